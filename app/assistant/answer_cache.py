@@ -0,0 +1,163 @@
+# ------------------------------------------------------------------------------
+# Script: answer_cache.py
+# Purpose: Cache final chat answers for repeated questions.
+#
+# Notes:
+#   - Keys combine the normalized question, profile and a prompt-input hash
+#   - In-memory LRU with TTL, plus an optional SQLite tier (ANSWER_CACHE_DB)
+#   - Watches the source files (summary.txt, PDF) and clears itself when they change
+# ------------------------------------------------------------------------------
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    question = re.sub(r"[^\w\s]", " ", question.lower())
+    return " ".join(question.split())
+
+
+class AnswerCache:
+    def __init__(self, max_entries: int = 256, ttl: int = 3600,
+                 db_path: Optional[str] = None, sources: tuple = ()):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db_path = db_path
+        self.sources = tuple(sources)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (stored_at, answer)
+        self._lock = threading.Lock()
+        self._signature = self._source_signature()
+        if self.db_path:
+            self._init_db()
+
+    def make_key(self, question: str, profile: str, prompt_hash: str) -> str:
+        # Pick up a source change first, or a fresh answer is stored under a dead key
+        self._check_sources()
+        raw = "\x1f".join([normalize_question(question), profile, prompt_hash, self._signature])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a fresh cached answer or None"""
+        self._check_sources()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._entries.pop(key, None)
+
+        entry = self._query_db(key) if self.db_path else None
+        with self._lock:
+            if entry and now - entry[0] <= self.ttl:
+                self._remember(key, entry)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return None
+
+    def store(self, key: str, answer: str):
+        if not answer:
+            return
+        entry = (time.time(), answer)
+        with self._lock:
+            self._remember(key, entry)
+        if self.db_path:
+            self._store_db(key, entry)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self.db_path:
+            try:
+                self._execute("DELETE FROM answers")
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to clear answer cache database: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def _remember(self, key: str, entry: tuple):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _source_signature(self) -> str:
+        parts = []
+        for path in self.sources:
+            try:
+                stat = os.stat(path)
+                parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+            except OSError:
+                parts.append(f"{path}:missing")
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+    def _check_sources(self):
+        """Invalidate everything when summary.txt or the PDF changed on disk"""
+        if not self.sources:
+            return
+        signature = self._source_signature()
+        if signature != self._signature:
+            logger.info("Answer cache sources changed - invalidating")
+            self._signature = signature
+            self.clear()
+
+    def _execute(self, sql: str, params: tuple = ()):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                return conn.execute(sql, params).fetchone()
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        try:
+            self._execute("""
+                CREATE TABLE IF NOT EXISTS answers (
+                    key TEXT PRIMARY KEY,
+                    answer TEXT,
+                    stored_at REAL
+                )
+            """)
+        except sqlite3.Error as e:
+            logger.warning(f"Answer cache database unavailable, using memory only: {e}")
+            self.db_path = None
+
+    def _query_db(self, key: str) -> Optional[tuple]:
+        try:
+            row = self._execute(
+                "SELECT stored_at, answer FROM answers WHERE key = ?", (key,)
+            )
+            return tuple(row) if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"Answer cache database error: {e}")
+            return None
+
+    def _store_db(self, key: str, entry: tuple):
+        try:
+            self._execute(
+                "INSERT OR REPLACE INTO answers (key, stored_at, answer) VALUES (?, ?, ?)",
+                (key, entry[0], entry[1])
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to store answer in database: {e}")
@@ -0,0 +1,211 @@
+# ------------------------------------------------------------------------------
+# Script: async_assistant.py
+# Purpose: asyncio variant of ResumeAssistant built on AsyncOpenAI, so one
+#          event loop can serve many concurrent chats without extra threads.
+#
+# How to Run:
+#   python -m app.assistant.async_assistant
+#
+# Expected Output:
+#   Assistant streams its answer to your input
+# ------------------------------------------------------------------------------
+import asyncio
+import logging
+import time
+
+from app.assistant.config.non_ai import config
+from app.assistant.minimal_assistant import ResumeAssistant
+from app.llm import AsyncSingleFlight
+from app.llm.client import get_async_openai_client
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResumeAssistant(ResumeAssistant):
+    """Same prompts, tools and caches as ResumeAssistant; awaitable chat methods"""
+
+    def _create_client(self):
+        return get_async_openai_client()
+
+    def _create_flights(self):
+        return AsyncSingleFlight()
+
+    async def _summarize(self, previous_summary, evicted):
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in evicted)
+        try:
+            response = await self.openai.chat.completions.create(
+                model=config.MEMORY["summary_model"],
+                messages=[{"role": "user", "content": self._summary_prompt(previous_summary, transcript)}],
+                temperature=0,
+                max_tokens=config.MEMORY["summary_max_tokens"]
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.warning(f"Conversation summarization failed: {e}")
+            return previous_summary
+
+    async def _remember(self, memory, user_input, answer):
+        if memory is None or answer is None:
+            return
+        evicted = memory.add_turn(user_input, answer)
+        if evicted and config.MEMORY["summarize"]:
+            memory.summary = await self._summarize(memory.summary, evicted)
+
+    async def _cached(self, user_input, memory, bundle):
+        """(cache key, cached answer or None); the answer cache stats its source
+        files and reads SQLite, so the lookup runs in a worker thread"""
+        if self.answer_cache is None:
+            return None, None
+
+        def lookup():
+            cache_key = self._cache_key(user_input, memory, bundle)
+            return cache_key, self.answer_cache.get(cache_key) if cache_key else None
+        return await asyncio.to_thread(lookup)
+
+    async def _store(self, cache_key, answer):
+        if cache_key:
+            await asyncio.to_thread(self.answer_cache.store, cache_key, answer)
+
+    async def _route(self, user_input, bundle):
+        router = bundle.router
+        decision = router.heuristic_route(user_input)
+        if decision is None and router.classifier_model:
+            try:
+                response = await self.openai.chat.completions.create(
+                    **router.classifier_request(user_input)
+                )
+                decision = router.from_classifier(response.choices[0].message.content)
+            except Exception as e:
+                logger.warning(f"Route classifier failed, using large model: {e}")
+        return router.decided(decision or router.large("ambiguous"))
+
+    async def chat(self, user_input, session_id=None, profile=None):
+        bundle = self.profiles.get(profile)
+        memory = self.sessions.get(self._session_id(session_id, bundle))
+        cache_key, cached = await self._cached(user_input, memory, bundle)
+        if cached is not None:
+            await self._remember(memory, user_input, cached)
+            return cached
+
+        decision = await self._route(user_input, bundle)
+        start = time.perf_counter()
+
+        flight_key = self._flight_key(user_input, memory, decision.model, bundle)
+        if flight_key:
+            answer = await self.flights.do(flight_key, lambda: self._answer(user_input, memory, cache_key, decision.model, bundle))
+        else:
+            answer = await self._answer(user_input, memory, cache_key, decision.model, bundle)
+        bundle.router.record(decision, time.perf_counter() - start)
+
+        await self._remember(memory, user_input, answer)
+        return answer
+
+    async def _answer(self, user_input, memory, cache_key, model, bundle):
+        messages = self._build_messages(user_input, memory, bundle)
+
+        response = await self.openai.chat.completions.create(
+            model=model,
+            messages=messages,
+            tools=list(bundle.tools)
+        )
+
+        choice = response.choices[0]
+        if choice.finish_reason == "tool_calls":
+            tool_calls = [tc.model_dump() for tc in choice.message.tool_calls or []]
+            messages.append({
+                "role": "assistant",
+                "content": None,
+                "tool_calls": tool_calls
+            })
+            messages.extend(await self.tool_executor.run_async(tool_calls, self._tool_context(bundle)))
+
+            second_response = await self.openai.chat.completions.create(
+                model=model,
+                messages=messages
+            )
+            return second_response.choices[0].message.content
+
+        await self._store(cache_key, choice.message.content)
+        return choice.message.content
+
+    async def chat_stream(self, user_input, session_id=None, profile=None):
+        """Async generator of response text deltas (see ResumeAssistant.chat_stream)"""
+        bundle = self.profiles.get(profile)
+        memory = self.sessions.get(self._session_id(session_id, bundle))
+        cache_key, cached = await self._cached(user_input, memory, bundle)
+        if cached is not None:
+            await self._remember(memory, user_input, cached)
+            yield cached
+            return
+
+        decision = await self._route(user_input, bundle)
+        start = time.perf_counter()
+        first_token = None
+
+        flight_key = self._flight_key(user_input, memory, decision.model, bundle)
+        if flight_key:
+            deltas = self.flights.stream(flight_key, lambda: self._answer_stream(user_input, memory, cache_key, decision.model, bundle))
+        else:
+            deltas = self._answer_stream(user_input, memory, cache_key, decision.model, bundle)
+
+        answer = []
+        async for delta in deltas:
+            if first_token is None:
+                first_token = time.perf_counter() - start
+            answer.append(delta)
+            yield delta
+        bundle.router.record(decision, time.perf_counter() - start, first_token)
+        await self._remember(memory, user_input, "".join(answer))
+
+    async def _answer_stream(self, user_input, memory, cache_key, model, bundle):
+        messages = self._build_messages(user_input, memory, bundle)
+
+        stream = await self.openai.chat.completions.create(
+            model=model,
+            messages=messages,
+            tools=list(bundle.tools),
+            stream=True
+        )
+
+        content = []
+        tool_calls = {}
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content.append(delta.content)
+                yield delta.content
+            self._merge_tool_call_fragments(tool_calls, delta)
+
+        if not tool_calls:
+            await self._store(cache_key, "".join(content))
+            return
+
+        calls = [tool_calls[i] for i in sorted(tool_calls)]
+        messages.append({
+            "role": "assistant",
+            "content": "".join(content) or None,
+            "tool_calls": calls
+        })
+        messages.extend(await self.tool_executor.run_async(calls, self._tool_context(bundle)))
+
+        follow_up = await self.openai.chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=True
+        )
+        async for chunk in follow_up:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+if __name__ == "__main__":
+    async def main():
+        assistant = AsyncResumeAssistant()
+        user_input = input("Ask something: ")
+        async for delta in assistant.chat_stream(user_input):
+            print(delta, end="", flush=True)
+        print()
+
+    asyncio.run(main())
@@ -1,5 +1,10 @@
+from contextvars import ContextVar
 from pathlib import Path
 import os
+
+# Profile of the request being served (multi-profile mode); unset falls back to CURRENT_PROFILE
+ACTIVE_PROFILE = ContextVar("active_profile", default=None)
+
 class ResumeConfig:
     """Central configuration for all resume profiles"""
     
@@ -15,6 +20,12 @@ class ResumeConfig:
                 "blog_url": "https://yourblog.com",
                 "resume_button_text": "Download the PDF"
             },
+            "MODELS": {
+                "fast": "gpt-4o-mini",      # Simple factual lookups
+                "large": "gpt-4",           # Everything that needs reasoning
+                "classifier": None,         # Optional tiny model for ambiguous queries
+                "routing": os.getenv("MODEL_ROUTING", "false").lower() == "true"
+            },
             "UI": {
                 "theme": {
                     "primary": "#10B981",  # Emerald green
@@ -54,6 +65,12 @@ class ResumeConfig:
                 "blog_url": "https://your-powerplatform-blog.com",
                 "resume_button_text": "Download Resume"
             },
+            "MODELS": {
+                "fast": "gpt-4o-mini",
+                "large": "gpt-4",
+                "classifier": None,
+                "routing": os.getenv("MODEL_ROUTING", "false").lower() == "true"
+            },
             "UI": {
                 "theme": {
                     "primary": "#3B82F6",  # Blue
@@ -97,11 +114,21 @@ class ResumeConfig:
         """Returns personal data for current profile"""
         return self.PROFILE_CONFIGS[self.CURRENT_PROFILE]["PERSONAL"]
 
+    @property
+    def MODELS(self):
+        """Returns model routing configuration for current profile"""
+        return self.PROFILE_CONFIGS[self.CURRENT_PROFILE]["MODELS"]
+
     @property
     def UI(self):
         """Returns UI configuration for current profile"""
         return self.PROFILE_CONFIGS[self.CURRENT_PROFILE]["UI"]
 
+    @property
+    def active_profile(self):
+        """Profile of the request being served, else CURRENT_PROFILE"""
+        return ACTIVE_PROFILE.get() or self.CURRENT_PROFILE
+
     def __init__(self):
         # Set profile-specific paths
         self.PERSONAL["resume_pdf"] = str(self.resume_path)
@@ -123,20 +150,39 @@ class ResumeConfig:
     
     @property
     def resume_path(self):
-        return self.BASE_PATH / self.CURRENT_PROFILE / "gi.pdf"
+        return self.resume_path_for(self.CURRENT_PROFILE)
     
     @property
     def summary_path(self):
-        return self.BASE_PATH / self.CURRENT_PROFILE / "summary.txt"
+        return self.summary_path_for(self.CURRENT_PROFILE)
+
+    def resume_path_for(self, profile):
+        return self.BASE_PATH / profile / "gi.pdf"
+
+    def summary_path_for(self, profile):
+        return self.BASE_PATH / profile / "summary.txt"
+
+    def available_profiles(self):
+        """Configured profiles that have a resume and summary under me/"""
+        return [
+            name for name in self.PROFILE_CONFIGS
+            if self.resume_path_for(name).exists() and self.summary_path_for(name).exists()
+        ]
     
     # Dynamic imports
     @property
     def prompts_module(self):
-        return f"app.assistant.config.prompts.gi_{self.CURRENT_PROFILE}"
+        return self.prompts_module_for(self.CURRENT_PROFILE)
     
     @property
     def tools_module(self):
-        return f"app.assistant.config.tools.gi_{self.CURRENT_PROFILE}"
+        return self.tools_module_for(self.CURRENT_PROFILE)
+
+    def prompts_module_for(self, profile):
+        return f"app.assistant.config.prompts.gi_{profile}"
+
+    def tools_module_for(self, profile):
+        return f"app.assistant.config.tools.gi_{profile}"
     # UI and other configurations remain here
     
     # ============ Assistant Configuration ============
@@ -163,6 +209,59 @@ class ResumeConfig:
     }
     
 
+    # ============ Retrieval Configuration ============
+    # When enabled, only the top-k resume/summary chunks relevant to the
+    # question are put into the system prompt instead of the full documents.
+    RETRIEVAL = {
+        "enabled": os.getenv("RESUME_RETRIEVAL", "false").lower() == "true",
+        "top_k": int(os.getenv("RESUME_RETRIEVAL_TOP_K", "6")),
+        "token_budget": int(os.getenv("RESUME_RETRIEVAL_TOKEN_BUDGET", "1200")),
+        "chunk_words": 120,
+        "chunk_overlap": 30,
+    }
+
+    # ============ Answer Cache Configuration ============
+    ANSWER_CACHE = {
+        "enabled": os.getenv("ANSWER_CACHE", "true").lower() == "true",
+        "max_entries": int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "256")),
+        "ttl": int(os.getenv("ANSWER_CACHE_TTL", "3600")),
+        "db_path": os.getenv("ANSWER_CACHE_DB"),  # Unset keeps the cache in memory only
+    }
+
+    # ============ Tool Execution Configuration ============
+    TOOL_EXECUTION = {
+        "deadline": float(os.getenv("TOOL_DEADLINE_SECONDS", "2.0")),
+        "deadlines": {},  # Per-tool overrides, e.g. {"record_user_details": 3.0}
+        "max_workers": int(os.getenv("TOOL_MAX_WORKERS", "8")),
+    }
+
+    # ============ Conversation Memory Configuration ============
+    MEMORY = {
+        "token_budget": int(os.getenv("CHAT_MEMORY_TOKEN_BUDGET", "1500")),
+        "summarize": os.getenv("CHAT_MEMORY_SUMMARIZE", "false").lower() == "true",
+        "summary_model": "gpt-3.5-turbo",
+        "summary_max_tokens": 200,
+        "max_sessions": 1000,
+        "session_ttl": 3600,
+    }
+
+    # ============ Multi-Profile Serving ============
+    # Every profile under me/ is loaded at startup; each request picks one by
+    # header, ?profile= query parameter or the first URL path segment.
+    SERVING = {
+        "profiles": [p for p in os.getenv("RESUME_PROFILES", "").split(",") if p],  # Empty = all available
+        "header": "X-Resume-Profile",
+        "query_param": "profile",
+    }
+
+    # ============ Hot Reload ============
+    # Poll me/<profile>/ and this file; changed profiles are rebuilt in the
+    # background and swapped in without a restart.
+    HOT_RELOAD = {
+        "enabled": os.getenv("RESUME_HOT_RELOAD", "false").lower() == "true",
+        "interval": float(os.getenv("RESUME_HOT_RELOAD_INTERVAL", "2.0")),
+    }
+
     # ============ Chat Configuration ============
     @property
     def CHAT(self):
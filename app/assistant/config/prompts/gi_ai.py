@@ -1,9 +1,10 @@
 from app.assistant.config.non_ai import config
 
-def get_system_prompt(summary: str, resume: str) -> str:
+def get_system_prompt(summary: str, resume: str, personal: dict = None) -> str:
     """Complete system prompt for AI profile"""
+    personal = personal or config.PERSONAL
     return f"""
-You are {config.PERSONAL['name']}, an AI Engineer specializing in LLMs.
+You are {personal['name']}, an AI Engineer specializing in LLMs.
 
 Key Responsibilities:
 - Developing AI systems
@@ -0,0 +1,91 @@
+# ------------------------------------------------------------------------------
+# Script: memory.py
+# Purpose: Per-session multi-turn conversation memory bounded by a token budget.
+#
+# Notes:
+#   - Oldest turns are evicted first once the budget is exceeded
+#   - Evicted turns can be folded into a rolling summary by the caller
+#   - Input tokens of the most recent turns are recorded so prompt growth is
+#     measurable; older turns only count towards the running maximum
+# ------------------------------------------------------------------------------
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Optional
+
+from app.assistant.tokens import count_tokens
+
+
+class ConversationMemory:
+    def __init__(self, token_budget: int = 1500, history: int = 50):
+        self.token_budget = token_budget
+        self.turns = []  # [(user_message, assistant_message, tokens)]
+        self.summary = ""
+        self.input_tokens = deque(maxlen=history)  # Prompt tokens sent on the latest turns
+        self.max_input_tokens = 0
+
+    def messages(self) -> list:
+        """History messages to place between the system prompt and the new question"""
+        messages = []
+        if self.summary:
+            messages.append({
+                "role": "system",
+                "content": f"Summary of the earlier conversation:\n{self.summary}"
+            })
+        for user_message, assistant_message, _ in self.turns:
+            messages.append({"role": "user", "content": user_message})
+            messages.append({"role": "assistant", "content": assistant_message})
+        return messages
+
+    def token_count(self) -> int:
+        return count_tokens(self.summary) + sum(t[2] for t in self.turns)
+
+    def add_turn(self, user_message: str, assistant_message: str) -> list:
+        """Store a turn and return the messages evicted to stay within budget"""
+        tokens = count_tokens(user_message) + count_tokens(assistant_message)
+        self.turns.append((user_message, assistant_message, tokens))
+
+        evicted = []
+        # Always keep the latest turn, even when it alone exceeds the budget
+        while len(self.turns) > 1 and self.token_count() > self.token_budget:
+            user_message, assistant_message, _ = self.turns.pop(0)
+            evicted.append({"role": "user", "content": user_message})
+            evicted.append({"role": "assistant", "content": assistant_message})
+        return evicted
+
+    def record_input_tokens(self, tokens: int):
+        self.input_tokens.append(tokens)
+        self.max_input_tokens = max(self.max_input_tokens, tokens)
+
+    def stats(self) -> dict:
+        return {
+            "turns": len(self.turns),
+            "memory_tokens": self.token_count(),
+            "last_input_tokens": self.input_tokens[-1] if self.input_tokens else 0,
+            "max_input_tokens": self.max_input_tokens,
+        }
+
+
+class SessionStore:
+    """Bounded map of session id -> ConversationMemory with idle expiry"""
+
+    def __init__(self, token_budget: int = 1500, max_sessions: int = 1000, ttl: int = 3600):
+        self.token_budget = token_budget
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()  # session_id -> (last_used, memory)
+        self._lock = threading.Lock()
+
+    def get(self, session_id: Optional[str]) -> Optional[ConversationMemory]:
+        if session_id is None:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            memory = entry[1] if entry and now - entry[0] <= self.ttl else None
+            if memory is None:
+                memory = ConversationMemory(self.token_budget)
+            self._sessions[session_id] = (now, memory)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            return memory
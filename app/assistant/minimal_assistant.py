@@ -8,100 +8,352 @@
 # Expected Output:
 #   Assistant responds to your input using static prompt context
 # ------------------------------------------------------------------------------
+import hashlib
+import logging
 import os
-from importlib import import_module  # Add this import
+import contextvars
+import time
 from dotenv import load_dotenv
-from openai import OpenAI
-from pypdf import PdfReader
-from openai.types.chat import ChatCompletionMessageToolCall
 
-from app.assistant.config.non_ai import config
-from app.tools import record_user_details, record_unknown_query
+from app.assistant.config.non_ai import ACTIVE_PROFILE, config
+from app.assistant.answer_cache import AnswerCache, normalize_question
+from app.assistant.memory import SessionStore
+from app.assistant.tokens import count_tokens
+from app.assistant.profiles import ProfileRegistry
+from app.assistant.reloader import ProfileReloader
+from app.tools import TOOL_FUNCTIONS
+from app.tools.executor import ToolExecutor
+from app.llm import SingleFlight
+from app.llm.client import get_openai_client
 
 load_dotenv()
+logger = logging.getLogger(__name__)
 
 class ResumeAssistant:
-    def __init__(self):
-        # Dynamic imports
-        prompts = import_module(config.prompts_module)
-        tools = import_module(config.tools_module)
-        
-        self.name = config.PERSONAL["name"]
-        self.openai = OpenAI()
-        self.tools = tools.TOOLS
-        self.summary = self._load_summary()
-        self.resume = self._load_resume()
-        self.system_prompt_func = prompts.get_system_prompt
-
-    def _load_summary(self):
-        with open(config.summary_path, encoding="utf-8") as f:
-            return f.read()
-
-    def _load_resume(self):
-        reader = PdfReader(config.resume_path)
-        return "\n".join(p.extract_text() for p in reader.pages if p.extract_text())
-
-    def get_resume_path(self):
+    def __init__(self, retrieval=None, answer_cache=None, profiles=None):
+        # Retrieval mode (A/B switch): None follows config.RETRIEVAL["enabled"]
+        retrieval = config.RETRIEVAL["enabled"] if retrieval is None else retrieval
+
+        # Every profile is preloaded; the client, caches and sessions are shared
+        self.profiles = profiles or ProfileRegistry.load(retrieval=retrieval)
+        self.retrieval = self.profiles.retrieval
+        self.openai = self._create_client()
+        self.tool_executor = ToolExecutor(
+            self.profiles.all_tools(),
+            TOOL_FUNCTIONS,
+            deadline=config.TOOL_EXECUTION["deadline"],
+            deadlines=config.TOOL_EXECUTION["deadlines"],
+            max_workers=config.TOOL_EXECUTION["max_workers"]
+        )
+
+        # Answers that needed no tool calls are reused for repeated questions
+        self.answer_cache = answer_cache
+        if self.answer_cache is None and config.ANSWER_CACHE["enabled"]:
+            self.answer_cache = AnswerCache(
+                max_entries=config.ANSWER_CACHE["max_entries"],
+                ttl=config.ANSWER_CACHE["ttl"],
+                db_path=config.ANSWER_CACHE["db_path"],
+                sources=self.profiles.source_paths()
+            )
+
+        self.flights = self._create_flights()
+
+        # Multi-turn memory per session, bounded by a token budget
+        self.sessions = SessionStore(
+            token_budget=config.MEMORY["token_budget"],
+            max_sessions=config.MEMORY["max_sessions"],
+            ttl=config.MEMORY["session_ttl"]
+        )
+
+        # Pick up edits to me/<profile>/ and non_ai.py without a restart
+        self.reloader = None
+        if config.HOT_RELOAD["enabled"]:
+            self.reloader = ProfileReloader(
+                self.profiles,
+                self.answer_cache,
+                interval=config.HOT_RELOAD["interval"]
+            ).start()
+
+    def _create_client(self):
+        return get_openai_client()
+
+    def _create_flights(self):
+        return SingleFlight()
+
+    # Default profile, for single-profile callers
+    @property
+    def profile(self):
+        return self.profiles.get()
+
+    @property
+    def name(self):
+        return self.profile.personal["name"]
+
+    @property
+    def tools(self):
+        return list(self.profile.tools)
+
+    @property
+    def summary(self):
+        return self.profile.summary
+
+    @property
+    def resume(self):
+        return self.profile.resume
+
+    @property
+    def index(self):
+        return self.profile.index
+
+    @property
+    def router(self):
+        return self.profile.router
+
+    @property
+    def prompt_hash(self):
+        return self.profile.prompt_hash
+
+    def get_resume_path(self, profile=None):
         """Return absolute path to resume PDF"""
-        abs_path = os.path.abspath(config.PERSONAL["resume_pdf"])
+        abs_path = os.path.abspath(self.profiles.get(profile).resume_path)
         if not os.path.exists(abs_path):
             raise FileNotFoundError(f"Resume not found at {abs_path}")
         return abs_path
 
-    def system_prompt(self):
-        return self.system_prompt_func(self.summary, self.resume)
+    def system_prompt(self, user_input=None, bundle=None):
+        bundle = bundle or self.profile
+        if bundle.index is not None and user_input:
+            summary, resume = bundle.index.context_for(
+                user_input,
+                top_k=config.RETRIEVAL["top_k"],
+                token_budget=config.RETRIEVAL["token_budget"]
+            )
+            return bundle.system_prompt(summary, resume)
+        return bundle.system_prompt(bundle.summary, bundle.resume)
+
+    def _build_messages(self, user_input, memory=None, bundle=None):
+        messages = [{"role": "system", "content": self.system_prompt(user_input, bundle)}]
+        if memory is not None:
+            messages.extend(memory.messages())
+        messages.append({"role": "user", "content": user_input})
+
+        if memory is not None:
+            input_tokens = sum(count_tokens(m["content"]) for m in messages)
+            memory.record_input_tokens(input_tokens)
+            logger.info(f"Chat turn input tokens: {input_tokens} ({memory.stats()['turns']} turns in memory)")
+        return messages
+
+    def _summarize(self, previous_summary, evicted):
+        """Fold evicted turns into the rolling conversation summary"""
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in evicted)
+        try:
+            response = self.openai.chat.completions.create(
+                model=config.MEMORY["summary_model"],
+                messages=[{"role": "user", "content": self._summary_prompt(previous_summary, transcript)}],
+                temperature=0,
+                max_tokens=config.MEMORY["summary_max_tokens"]
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.warning(f"Conversation summarization failed: {e}")
+            return previous_summary
+
+    @staticmethod
+    def _summary_prompt(previous_summary, transcript):
+        return (
+            "Update the running summary of a conversation about a candidate's resume. "
+            "Keep names, contact details and facts the user asked about. Be brief.\n\n"
+            f"Current summary:\n{previous_summary or '(none)'}\n\n"
+            f"New messages:\n{transcript}"
+        )
+
+    def _remember(self, memory, user_input, answer):
+        if memory is None or answer is None:
+            return
+        evicted = memory.add_turn(user_input, answer)
+        if evicted and config.MEMORY["summarize"]:
+            memory.summary = self._summarize(memory.summary, evicted)
+
+    @staticmethod
+    def _tool_context(bundle):
+        """Context the tools run in, so notifications name the right profile"""
+        context = contextvars.copy_context()
+        context.run(ACTIVE_PROFILE.set, bundle.name)
+        return context
+
+    def _run_tool_calls(self, tool_calls, bundle=None):
+        """Execute tool calls (as plain dicts) and return the tool messages"""
+        return self.tool_executor.run(tool_calls, self._tool_context(bundle or self.profile))
 
-    def chat(self, user_input):
-        messages = [
-            {"role": "system", "content": self.system_prompt()},
-            {"role": "user", "content": user_input}
-        ]
+    @staticmethod
+    def _session_id(session_id, bundle):
+        # A browser session talking to two profiles gets two conversations
+        return f"{bundle.name}:{session_id}" if session_id else None
+
+    def _cache_key(self, user_input, memory=None, bundle=None):
+        # Follow-up questions depend on the conversation, so only openers are cached
+        if self.answer_cache is None or (memory is not None and memory.turns):
+            return None
+        bundle = bundle or self.profile
+        return self.answer_cache.make_key(user_input, bundle.name, bundle.prompt_hash)
+
+    @staticmethod
+    def _merge_tool_call_fragments(tool_calls, delta):
+        """Assemble streamed tool call fragments into plain dicts keyed by index"""
+        for fragment in delta.tool_calls or []:
+            call = tool_calls.setdefault(fragment.index, {
+                "id": None,
+                "type": "function",
+                "function": {"name": "", "arguments": ""}
+            })
+            if fragment.id:
+                call["id"] = fragment.id
+            if fragment.function:
+                call["function"]["name"] += fragment.function.name or ""
+                call["function"]["arguments"] += fragment.function.arguments or ""
+
+    def _flight_key(self, user_input, memory, model, bundle):
+        # Only conversation openers are identical across visitors
+        if memory is not None and memory.turns:
+            return None
+        raw = "\x1f".join([normalize_question(user_input), model, bundle.name, bundle.prompt_hash])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def chat(self, user_input, session_id=None, profile=None):
+        bundle = self.profiles.get(profile)
+        memory = self.sessions.get(self._session_id(session_id, bundle))
+        cache_key = self._cache_key(user_input, memory, bundle)
+        if cache_key and (cached := self.answer_cache.get(cache_key)) is not None:
+            self._remember(memory, user_input, cached)
+            return cached
+
+        decision = bundle.router.route(user_input, self.openai)
+        start = time.perf_counter()
+
+        # Identical concurrent openers share one upstream call
+        flight_key = self._flight_key(user_input, memory, decision.model, bundle)
+        if flight_key:
+            answer = self.flights.do(flight_key, lambda: self._answer(user_input, memory, cache_key, decision.model, bundle))
+        else:
+            answer = self._answer(user_input, memory, cache_key, decision.model, bundle)
+        bundle.router.record(decision, time.perf_counter() - start)
+
+        self._remember(memory, user_input, answer)
+        return answer
+
+    def _answer(self, user_input, memory, cache_key, model, bundle):
+        messages = self._build_messages(user_input, memory, bundle)
 
         response = self.openai.chat.completions.create(
-            model="gpt-4",
+            model=model,
             messages=messages,
-            tools=self.tools
+            tools=list(bundle.tools)
         )
 
         choice = response.choices[0]
         if choice.finish_reason == "tool_calls":
-            tool_calls = choice.message.tool_calls or []
+            tool_calls = [tc.model_dump() for tc in choice.message.tool_calls or []]
 
             # Add tool call message
             messages.append({
                 "role": "assistant",
                 "content": None,
-                "tool_calls": [tc.model_dump() for tc in tool_calls]
+                "tool_calls": tool_calls
             })
-
-            for call in tool_calls:
-                fn_name = call.function.name
-                args = eval(call.function.arguments)  # JSON string
-
-                if fn_name == "record_user_details":
-                    result = record_user_details(**args)
-                elif fn_name == "record_unknown_query":
-                    result = record_unknown_query(**args)
-                else:
-                    result = {"error": "unknown tool"}
-
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": call.id,
-                    "content": str(result)
-                })
+            messages.extend(self._run_tool_calls(tool_calls, bundle))
 
             # Re-send messages with tool outputs
             second_response = self.openai.chat.completions.create(
-                model="gpt-4",
+                model=model,
                 messages=messages
             )
             return second_response.choices[0].message.content
 
         else:
+            if cache_key:
+                self.answer_cache.store(cache_key, choice.message.content)
             return choice.message.content
 
+    def chat_stream(self, user_input, session_id=None, profile=None):
+        """Yield response text deltas as they arrive from the model.
+
+        Tool calls are assembled from the streamed fragments, executed once the
+        first stream ends, and the follow-up answer is streamed as well.
+        """
+        bundle = self.profiles.get(profile)
+        memory = self.sessions.get(self._session_id(session_id, bundle))
+        cache_key = self._cache_key(user_input, memory, bundle)
+        if cache_key and (cached := self.answer_cache.get(cache_key)) is not None:
+            self._remember(memory, user_input, cached)
+            yield cached
+            return
+
+        decision = bundle.router.route(user_input, self.openai)
+        start = time.perf_counter()
+        first_token = None
+
+        flight_key = self._flight_key(user_input, memory, decision.model, bundle)
+        if flight_key:
+            deltas = self.flights.stream(flight_key, lambda: self._answer_stream(user_input, memory, cache_key, decision.model, bundle))
+        else:
+            deltas = self._answer_stream(user_input, memory, cache_key, decision.model, bundle)
+
+        answer = []
+        for delta in deltas:
+            if first_token is None:
+                first_token = time.perf_counter() - start
+            answer.append(delta)
+            yield delta
+        bundle.router.record(decision, time.perf_counter() - start, first_token)
+        self._remember(memory, user_input, "".join(answer))
+
+    def _answer_stream(self, user_input, memory, cache_key, model, bundle):
+        messages = self._build_messages(user_input, memory, bundle)
+
+        stream = self.openai.chat.completions.create(
+            model=model,
+            messages=messages,
+            tools=list(bundle.tools),
+            stream=True
+        )
+
+        content = []
+        tool_calls = {}
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content.append(delta.content)
+                yield delta.content
+            self._merge_tool_call_fragments(tool_calls, delta)
+
+        if not tool_calls:
+            if cache_key:
+                self.answer_cache.store(cache_key, "".join(content))
+            return
+
+        calls = [tool_calls[i] for i in sorted(tool_calls)]
+        messages.append({
+            "role": "assistant",
+            "content": "".join(content) or None,
+            "tool_calls": calls
+        })
+        messages.extend(self._run_tool_calls(calls, bundle))
+
+        # Stream the answer that uses the tool outputs
+        follow_up = self.openai.chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=True
+        )
+        for chunk in follow_up:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
 if __name__ == "__main__":
     assistant = ResumeAssistant()
     user_input = input("Ask something: ")
-    print(assistant.chat(user_input))
+    for delta in assistant.chat_stream(user_input):
+        print(delta, end="", flush=True)
+    print()
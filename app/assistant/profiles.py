@@ -0,0 +1,162 @@
+# ------------------------------------------------------------------------------
+# Script: profiles.py
+# Purpose: Load every resume profile under me/ into an immutable bundle
+#          (prompt builder, tools, extracted resume and summary, retrieval
+#          index, model router) so one process can serve all of them.
+#
+# Notes:
+#   - Bundles are frozen; changing a profile means building a new bundle and
+#     swapping it into the registry, so in-flight requests keep the old one
+#   - Requests choose a profile by header, ?profile= or URL path segment and
+#     fall back to config.CURRENT_PROFILE
+# ------------------------------------------------------------------------------
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+from app.assistant.config.non_ai import config
+from app.assistant.resume_loader import file_sha256, load_resume_text
+from app.assistant.retrieval import ResumeIndex
+from app.llm.router import ModelRouter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProfileBundle:
+    name: str
+    personal: MappingProxyType
+    models: MappingProxyType
+    tools: tuple
+    prompt_builder: Callable
+    summary: str
+    resume: str
+    summary_path: Path
+    resume_path: Path
+    resume_sha: str
+    prompt_hash: str
+    router: ModelRouter
+    index: Optional[ResumeIndex] = None
+
+    def system_prompt(self, summary: str, resume: str) -> str:
+        return self.prompt_builder(summary, resume, self.personal)
+
+
+def load_profile(name: str, retrieval: bool = False, resume: str = None) -> ProfileBundle:
+    """Build the bundle for one profile; pass resume to reuse already extracted text"""
+    profile_config = config.PROFILE_CONFIGS[name]
+    summary_path = config.summary_path_for(name)
+    resume_path = config.resume_path_for(name)
+
+    personal = dict(profile_config["PERSONAL"])
+    personal["resume_pdf"] = str(resume_path)
+    personal["summary_file"] = str(summary_path)
+
+    with open(summary_path, encoding="utf-8") as f:
+        summary = f.read()
+    if resume is None:
+        resume = load_resume_text(resume_path)
+
+    index = None
+    if retrieval:
+        index = ResumeIndex.from_texts(
+            summary,
+            resume,
+            chunk_words=config.RETRIEVAL["chunk_words"],
+            overlap=config.RETRIEVAL["chunk_overlap"]
+        )
+
+    return ProfileBundle(
+        name=name,
+        personal=MappingProxyType(personal),
+        models=MappingProxyType(dict(profile_config["MODELS"])),
+        tools=tuple(import_module(config.tools_module_for(name)).TOOLS),
+        prompt_builder=import_module(config.prompts_module_for(name)).get_system_prompt,
+        summary=summary,
+        resume=resume,
+        summary_path=summary_path,
+        resume_path=resume_path,
+        resume_sha=file_sha256(resume_path),
+        prompt_hash=hashlib.sha256(
+            "\x1f".join([summary, resume, str(retrieval), repr(sorted(personal.items()))]).encode("utf-8")
+        ).hexdigest(),
+        router=ModelRouter.from_config(profile_config["MODELS"]),
+        index=index,
+    )
+
+
+class ProfileRegistry:
+    """Profile name -> current ProfileBundle"""
+
+    def __init__(self, bundles: dict, default: str, retrieval: bool = False):
+        if default not in bundles:
+            raise ValueError(f"Default profile '{default}' is not loaded")
+        self._lock = threading.Lock()
+        self._bundles = dict(bundles)
+        self.default = default
+        self.retrieval = retrieval
+
+    @classmethod
+    def load(cls, names=None, retrieval: bool = False):
+        names = names or config.SERVING["profiles"] or config.available_profiles()
+        if config.CURRENT_PROFILE not in names:
+            names = [config.CURRENT_PROFILE, *names]
+        bundles = {}
+        for name in names:
+            bundles[name] = load_profile(name, retrieval=retrieval)
+            logger.info(f"Loaded profile '{name}'")
+        return cls(bundles, default=config.CURRENT_PROFILE, retrieval=retrieval)
+
+    def names(self) -> list:
+        return list(self._bundles)
+
+    def __contains__(self, name) -> bool:
+        return name in self._bundles
+
+    def get(self, name: str = None) -> ProfileBundle:
+        bundles = self._bundles  # One read, so a concurrent swap is seen whole
+        return bundles.get(name) or bundles[self.default]
+
+    def replace(self, bundle: ProfileBundle):
+        """Atomically publish a new bundle; holders of the old one keep it"""
+        with self._lock:
+            bundles = dict(self._bundles)
+            bundles[bundle.name] = bundle
+            self._bundles = bundles
+
+    def all_tools(self) -> list:
+        tools = {}
+        for bundle in self._bundles.values():
+            for tool in bundle.tools:
+                tools.setdefault(tool["function"]["name"], tool)
+        return list(tools.values())
+
+    def source_paths(self) -> list:
+        return [path for b in self._bundles.values() for path in (b.summary_path, b.resume_path)]
+
+    def resolve(self, request=None) -> ProfileBundle:
+        """Pick the bundle for a web request (Gradio gr.Request or Starlette Request)"""
+        if request is None:
+            return self.get()
+        bundles = self._bundles
+        headers = getattr(request, "headers", None) or {}
+        query = getattr(request, "query_params", None) or {}
+        candidates = [headers.get(config.SERVING["header"].lower()), query.get(config.SERVING["query_param"])]
+
+        # Path prefix, e.g. /ai/... behind an ingress; Gradio's queue calls keep
+        # the page URL only in the Referer header
+        url = getattr(request, "url", None)
+        for path in (getattr(url, "path", None), urlparse(headers.get("referer", "")).path):
+            if path:
+                candidates.extend(segment for segment in path.split("/") if segment)
+
+        for candidate in candidates:
+            if candidate in bundles:
+                return bundles[candidate]
+        return bundles[self.default]
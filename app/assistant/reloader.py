@@ -0,0 +1,160 @@
+# ------------------------------------------------------------------------------
+# Script: reloader.py
+# Purpose: Hot reload of resume profiles. A background thread polls each
+#          profile's summary.txt and gi.pdf plus config/non_ai.py, rebuilds
+#          only the profiles that changed and swaps the new bundles in.
+#
+# Notes:
+#   - Enabled with RESUME_HOT_RELOAD=true (see config.HOT_RELOAD)
+#   - The PDF is re-extracted only when its SHA-256 changed, so a touch or a
+#     summary-only edit costs one file read
+#   - A change is applied once it has been stable for one poll interval, so
+#     half-copied files are not picked up
+#   - Requests already running keep the bundle they started with
+#   - Polling (a few stat() calls per interval) needs no extra dependency
+# ------------------------------------------------------------------------------
+import importlib.util
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from app.assistant.config import non_ai
+from app.assistant.config.non_ai import ResumeConfig, config
+from app.assistant.profiles import load_profile
+from app.assistant.resume_loader import file_sha256
+
+logger = logging.getLogger(__name__)
+
+# ResumeConfig attributes taken over from an edited non_ai.py
+RELOADABLE_SETTINGS = ("PROFILE_CONFIGS", "NOTIFICATIONS", "ERRORS")
+
+
+def reload_profile_configs(path=None):
+    """Execute non_ai.py as a fresh module and copy its profile settings over"""
+    path = Path(path or non_ai.__file__)
+    spec = importlib.util.spec_from_file_location("app.assistant.config._non_ai_reload", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    for name in RELOADABLE_SETTINGS:
+        setattr(ResumeConfig, name, getattr(module.ResumeConfig, name))
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+class ProfileReloader:
+    def __init__(self, registry, answer_cache=None, interval: float = 2.0, config_path=None):
+        self.registry = registry
+        self.answer_cache = answer_cache
+        self.interval = interval
+        self.config_path = str(config_path or non_ai.__file__)
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload_ms = None
+        self._applied = self._snapshot()
+        self._pending = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _profile_names(self) -> list:
+        names = self.registry.names()
+        # New folders under me/ are picked up unless RESUME_PROFILES pins the list
+        if not config.SERVING["profiles"]:
+            names += [n for n in config.available_profiles() if n not in names]
+        return names
+
+    def _snapshot(self) -> dict:
+        """(profile or None for non_ai.py, path) -> file signature"""
+        files = {(None, self.config_path): _signature(self.config_path)}
+        for name in self._profile_names():
+            for path in (config.summary_path_for(name), config.resume_path_for(name)):
+                files[(name, str(path))] = _signature(path)
+        return files
+
+    def check(self) -> list:
+        """Poll once; returns the profiles that were reloaded"""
+        current = self._snapshot()
+        if current == self._applied:
+            self._pending = None
+            return []
+        if current != self._pending:
+            self._pending = current  # Apply on the next poll if nothing moves
+            return []
+        return self.reload(current)
+
+    def reload(self, current=None) -> list:
+        """Rebuild and swap in every profile whose files changed"""
+        current = current or self._snapshot()
+        changed = {key for key, sig in current.items() if self._applied.get(key) != sig}
+        self._applied, self._pending = current, None
+        if not changed:
+            return []
+
+        start = time.perf_counter()
+        names = {name for name, _ in changed if name is not None}
+        if (None, self.config_path) in changed:
+            try:
+                reload_profile_configs(self.config_path)
+                names.update(self._profile_names())  # PERSONAL/MODELS may differ for any profile
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Reloading {self.config_path} failed, keeping current settings: {e}")
+
+        reloaded = []
+        for name in sorted(names):
+            if name not in config.PROFILE_CONFIGS:
+                continue
+            try:
+                self.registry.replace(self._rebuild(name))
+                reloaded.append(name)
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Reloading profile '{name}' failed, keeping the previous version: {e}")
+
+        if reloaded:
+            # Keys already change with the prompt hash; clearing frees the stale entries
+            if self.answer_cache is not None:
+                self.answer_cache.clear()
+            self.reloads += 1
+            self.last_reload_ms = (time.perf_counter() - start) * 1000
+            logger.info(f"Hot reloaded profiles {reloaded} in {self.last_reload_ms:.0f} ms")
+        return reloaded
+
+    def _rebuild(self, name):
+        old = self.registry.get(name) if name in self.registry else None
+        resume = None
+        if old is not None and file_sha256(config.resume_path_for(name)) == old.resume_sha:
+            resume = old.resume  # PDF content unchanged - skip extraction
+        return load_profile(name, retrieval=self.registry.retrieval, resume=resume)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="profile-reloader", daemon=True)
+            self._thread.start()
+            logger.info(f"Watching profile files every {self.interval}s")
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Profile reload check failed: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_reload_ms": self.last_reload_ms,
+            "profiles": {name: self.registry.get(name).prompt_hash[:12] for name in self.registry.names()},
+        }
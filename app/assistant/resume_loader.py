@@ -0,0 +1,65 @@
+# ------------------------------------------------------------------------------
+# Script: resume_loader.py
+# Purpose: Extract resume text from a profile PDF, caching the extracted text
+#          on disk keyed by the PDF's SHA-256 and the pypdf version.
+#
+# Notes:
+#   - The cache survives pod restarts when RESUME_CACHE_DIR is on a volume
+#   - Editing the PDF changes its hash, so stale text is never served
+# ------------------------------------------------------------------------------
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+
+import pypdf
+from pypdf import PdfReader
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path) -> str:
+    """Return the hex SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_pdf_text(path) -> str:
+    """Extract text from every page, calling extract_text() once per page"""
+    reader = PdfReader(path)
+    pages = (page.extract_text() for page in reader.pages)
+    return "\n".join(text for text in pages if text)
+
+
+def load_resume_text(pdf_path, cache_dir=None) -> str:
+    """Return the resume text, reusing the on-disk extraction when possible"""
+    start = time.perf_counter()
+    cache_dir = Path(cache_dir or os.getenv("RESUME_CACHE_DIR", "cache/resume"))
+    digest = file_sha256(pdf_path)
+    cache_file = cache_dir / f"{digest}_pypdf-{pypdf.__version__}.txt"
+
+    try:
+        text = cache_file.read_text(encoding="utf-8")
+        status = "hit"
+    except (FileNotFoundError, UnicodeDecodeError):
+        text = extract_pdf_text(pdf_path)
+        status = "miss"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent pods never read a partial file
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(text, encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write resume cache {cache_file}: {e}")
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(
+        f"Resume cache {status} for {pdf_path} "
+        f"(sha256={digest[:12]}, {elapsed_ms:.1f} ms)"
+    )
+    return text
@@ -0,0 +1,110 @@
+# ------------------------------------------------------------------------------
+# Script: retrieval.py
+# Purpose: Lightweight local lexical retrieval over the resume and summary so
+#          only the chunks relevant to a question go into the system prompt.
+#
+# Notes:
+#   - Chunks are built once at load time; scoring is BM25 over NumPy arrays
+#   - No embeddings or network calls are involved
+# ------------------------------------------------------------------------------
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.assistant.tokens import count_tokens
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+
+
+@dataclass(frozen=True)
+class Chunk:
+    source: str  # "summary" or "resume"
+    position: int
+    text: str
+
+
+def tokenize(text: str) -> list:
+    return [t.rstrip(".-") for t in TOKEN_PATTERN.findall(text.lower())]
+
+
+def chunk_text(text: str, source: str, max_words: int = 120, overlap: int = 30) -> list:
+    """Split text into overlapping word windows"""
+    words = text.split()
+    if not words:
+        return []
+    step = max(1, max_words - overlap)
+    chunks = []
+    for start in range(0, len(words), step):
+        chunks.append(Chunk(source, len(chunks), " ".join(words[start:start + max_words])))
+        if start + max_words >= len(words):
+            break
+    return chunks
+
+
+class ResumeIndex:
+    """BM25 index over resume and summary chunks"""
+
+    def __init__(self, chunks: list, k1: float = 1.5, b: float = 0.75):
+        self.chunks = chunks
+        self.token_counts = [count_tokens(c.text) for c in chunks]
+        tokenized = [tokenize(c.text) for c in chunks]
+
+        self.vocab = {}
+        for tokens in tokenized:
+            for token in tokens:
+                self.vocab.setdefault(token, len(self.vocab))
+
+        tf = np.zeros((len(chunks), len(self.vocab)), dtype=np.float32)
+        for row, tokens in enumerate(tokenized):
+            np.add.at(tf[row], [self.vocab[t] for t in tokens], 1)
+
+        lengths = tf.sum(axis=1, keepdims=True)
+        avg_length = float(lengths.mean()) if len(chunks) else 1.0
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log1p((len(chunks) - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+        # Precompute per-term BM25 weights so a query is a column sum
+        norm = k1 * (1 - b + b * lengths / max(avg_length, 1.0))
+        self.weights = np.where(tf > 0, tf * (k1 + 1) / (tf + norm), 0.0) * idf
+
+    @classmethod
+    def from_texts(cls, summary: str, resume: str, chunk_words: int = 120, overlap: int = 30):
+        chunks = (
+            chunk_text(summary, "summary", chunk_words, overlap)
+            + chunk_text(resume, "resume", chunk_words, overlap)
+        )
+        return cls(chunks)
+
+    def search(self, query: str, top_k: int = 6) -> list:
+        """Return [(chunk_id, score)] for the best matching chunks"""
+        columns = sorted({self.vocab[t] for t in tokenize(query) if t in self.vocab})
+        if not columns:
+            return []
+        scores = self.weights[:, columns].sum(axis=1)
+        order = np.argsort(-scores)[:top_k]
+        return [(int(i), float(scores[i])) for i in order if scores[i] > 0]
+
+    def context_for(self, query: str, top_k: int = 6, token_budget: int = 1200) -> tuple:
+        """Return (summary, resume) text limited to the relevant chunks.
+
+        Falls back to the leading chunks when nothing in the query matches,
+        so greetings still get some grounding context.
+        """
+        ranked = [i for i, _ in self.search(query, top_k)] or range(len(self.chunks))
+
+        selected, used = [], 0
+        for i in ranked:
+            if used + self.token_counts[i] > token_budget:
+                continue
+            selected.append(i)
+            used += self.token_counts[i]
+            if len(selected) >= top_k:
+                break
+
+        # Keep the original reading order inside each section
+        selected.sort(key=lambda i: (self.chunks[i].source, self.chunks[i].position))
+        sections = {"summary": [], "resume": []}
+        for i in selected:
+            sections[self.chunks[i].source].append(self.chunks[i].text)
+        return "\n...\n".join(sections["summary"]), "\n...\n".join(sections["resume"])
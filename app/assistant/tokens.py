@@ -0,0 +1,43 @@
+"""Token counting shared by prompt budgeting code.
+
+Uses tiktoken (in requirements.txt) for exact counts. When it is not
+installed, or its encoding file cannot be loaded (it is downloaded on first
+use, so offline hosts need TIKTOKEN_CACHE_DIR populated), counts fall back to
+a ~4 characters per token estimate and a warning is logged once per model:
+retrieval and memory budgets are then approximate, not exact.
+"""
+import logging
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # Optional dependency
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """tiktoken encoding for model, or None when counts must be estimated"""
+    if tiktoken is None:
+        logger.warning("tiktoken is not installed; token budgets use a ~4 characters per token estimate")
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Could not load the tiktoken encoding for {model} ({e}); token budgets use an estimate")
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4") -> int:
+    """Return the (approximate) number of tokens in text"""
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return max(1, len(text) // 4)
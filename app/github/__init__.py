@@ -1,5 +1,24 @@
-from .loader import GithubLoader
-from .analyzer import RepoAnalyzer
-from .chat_manager import RepoChatManager
+# Submodules pull in PyGithub, llama_index and openai, so they are imported on
+# first attribute access (PEP 562) rather than when app.github is imported.
+from importlib import import_module
 
-__all__ = ["GithubLoader", "RepoAnalyzer", "RepoChatManager"]
+_EXPORTS = {
+    "GithubLoader": ".loader",
+    "RepoAnalyzer": ".analyzer",
+    "RepoChatManager": ".chat_manager",
+    "RepoWarmer": ".warmup",
+}
+
+__all__ = ["GithubLoader", "RepoAnalyzer", "RepoChatManager", "RepoWarmer"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
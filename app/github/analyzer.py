@@ -1,278 +1,375 @@
-from llama_index.core import VectorStoreIndex
-from pathlib import Path
+import logging
 import os
-import requests
+import threading
+import time
 from datetime import datetime, timedelta
 from collections import Counter
 from .cache import RepoCache  # Import RepoCache
+from .embedding_cache import EmbeddingCache, EmbeddingUsage, model_id
+from .git_mirror import GitMirrorSource
+from .index_store import IndexStore
+from .manifest import build_manifest, diff_tree
+from .memory import MemoryProbe
+from .skills import SkillScanner, is_manifest, language_bytes
+from .source import GithubTreeSource
+from .summarizer import RepoSummarizer
+from app.llm import SingleFlight
+from app.llm.client import configure_llama_index
+
+logger = logging.getLogger(__name__)
+
+
+def _no_progress(stage: str, detail: str = ""):
+    pass
+
+
+def _api_usage(meter: dict) -> dict:
+    return {"calls": meter["calls"], "kb": round(meter["bytes"] / 1024, 1)}
+
+
+class _Broadcast:
+    """Progress of one in-flight analysis, fanned out to every caller sharing
+    it; callers that join late get a replay of the events so far"""
 
-class RepoAnalyzer:
     def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []  # ("progress", (stage, detail)) or ("quick", (result,))
+        self.listeners = []  # (progress, on_quick) of each waiting caller
+
+    def join(self, listener: tuple):
+        with self.lock:
+            for kind, args in self.events:
+                self._call(listener, kind, args)
+            self.listeners.append(listener)
+
+    def leave(self, listener: tuple):
+        with self.lock:
+            self.listeners.remove(listener)
+
+    def progress(self, stage: str, detail: str = ""):
+        self._emit("progress", (stage, detail))
+
+    def quick(self, result: dict):
+        self._emit("quick", (result,))
+
+    def _emit(self, kind: str, args: tuple):
+        with self.lock:
+            self.events.append((kind, args))
+            listeners = list(self.listeners)
+        for listener in listeners:
+            self._call(listener, kind, args)
+
+    @staticmethod
+    def _call(listener: tuple, kind: str, args: tuple):
+        progress, on_quick = listener
         try:
-            from llama_index.readers.github import GithubRepositoryReader
-        except ImportError:
-            from llama_index.core import download_loader
-            GithubRepositoryReader = download_loader("GithubRepositoryReader")
-        
-        # Initialize GitHub client properly
-        from github import Github
-        github_client = Github(os.getenv("GITHUB_TOKEN"))
-        
-        self.loader = GithubRepositoryReader(
-            github_client=github_client,
-            owner="dummy",
-            repo="dummy",
-            verbose=True
-        )
+            (progress if kind == "progress" else on_quick)(*args)
+        except Exception as e:  # One caller's callback must not fail the shared analysis
+            logger.warning(f"Analysis {kind} callback failed: {e}")
+
+
+class RepoAnalyzer:
+    # Stages reported to the progress callback of analyze(), in order; the
+    # first three make up the quick phase, the last two the deep phase
+    STAGES = ("fetch", "skills", "commits", "index", "summary")
+
+    def __init__(self):
+        configure_llama_index()
+        # "mirror": local shallow git mirrors (and local paths), API as fallback; "api": REST only
+        self.source = GitMirrorSource() if os.getenv("GITHUB_SOURCE", "mirror") == "mirror" else GithubTreeSource()
         self.cache = RepoCache()  # Now properly defined
+        self.indexes = IndexStore()
+        # Vectors of chunks seen in any repo before, looked up ahead of every embedding call
+        self.embeddings = EmbeddingCache() if os.getenv("GITHUB_EMBEDDING_CACHE", "true").lower() == "true" else None
+        self.flights = SingleFlight()
+        # Progress of each in-flight analysis, so callers joining it see its stages too
+        self._broadcasts = {}
+        self._broadcasts_lock = threading.Lock()
+        self.skills = SkillScanner()
+        self.summarizer = RepoSummarizer()
+        # Documents embedded together; bounds how many files are held at once
+        self.index_batch = int(os.getenv("GITHUB_INDEX_BATCH", "16"))
+        # Update the last stored index of a changed repo instead of rebuilding it
+        self.incremental = os.getenv("GITHUB_INCREMENTAL", "true").lower() == "true"
+        # Manifest files read for the quick phase's skill estimate
+        self.quick_manifests = int(os.getenv("GITHUB_QUICK_MAX_MANIFESTS", "40"))
 
-    def analyze(self, repo_url: str) -> dict:
-        """Main method to analyze a repo, using cache if available"""
+    def analyze(self, repo_url: str, progress=None, on_quick=None) -> dict:
+        """Main method to analyze a repo, using cache if available.
+        progress(stage, detail="") is called as each of STAGES starts;
+        on_quick(result) receives the quick-phase result (skills from the tree
+        and manifests, commit stats, no AI summary) before the deep phase runs.
+        A caller that joins an analysis already in flight gets the stages and
+        quick result reported so far, then the rest as they happen.
+        Failures don't raise: the result then has an "error" key, alongside
+        whatever the quick phase found"""
         if cached := self.cache.get(repo_url):
             return cached
 
+        # Concurrent clicks on the same repo (or a click during warm-up) share one analysis
+        key = repo_url.rstrip("/").lower()
+        with self._broadcasts_lock:
+            broadcast = self._broadcasts.setdefault(key, _Broadcast())
+        listener = (progress or _no_progress, on_quick or _no_progress)
+        broadcast.join(listener)
+
+        def run():
+            try:
+                return self._analyze(repo_url, broadcast.progress, broadcast.quick)
+            finally:
+                with self._broadcasts_lock:
+                    if self._broadcasts.get(key) is broadcast:
+                        del self._broadcasts[key]
+
+        try:
+            return self.flights.do(key, run)
+        finally:
+            broadcast.leave(listener)
+
+    def _analyze(self, repo_url: str, progress, on_quick) -> dict:
         # Extract owner and repo from the URL
         # Example: "https://github.com/owner/repo"
-        parts = repo_url.split("/")
-        if len(parts) < 2:
+        try:
+            owner, repo = self.source.locate(repo_url)
+        except ValueError:
             return {"error": "Invalid repo URL"}
-        owner = parts[-2]
-        repo = parts[-1]
 
+        quick = None
         try:
-            # Fresh analysis
-            documents = self.loader.load_data(branch="main", commit_sha=None, repo_url=repo_url)
-            index = VectorStoreIndex.from_documents(documents)
-            
+            started = time.perf_counter()
+            with self.source.meter() as quick_api:
+                quick, entries = self._quick_phase(repo_url, owner, repo, progress)
+            quick_seconds = round(time.perf_counter() - started, 2)
+            quick["latency"] = {"quick": quick_seconds}
+            quick["api"] = {"quick": _api_usage(quick_api)}
+            on_quick(quick)
+
+            # Deep phase: index and AI summary
+            started = time.perf_counter()
+            sha = quick["sha"]
+            model = self._embedding_model()
+
+            with self.source.meter() as deep_api:
+                # Same commit and model as a previous analysis: no embedding calls,
+                # unless some files could not be fetched then and are retried now
+                stored = self.indexes.load(repo_url, sha, model)
+                if stored and not stored[1].get("failed"):
+                    index, meta = stored
+                    meta = {**meta, "changes": {}, "embeddings": {}}  # Nothing was re-indexed
+                    progress("index", f"index of {sha[:7]} loaded from disk")
+                else:
+                    index, meta = self._build_index(repo_url, owner, repo, sha, model, progress, entries, base=stored)
+                progress("summary")
+                summary = self._generate_summary(index, f"{owner}/{repo}", meta.get("files"))
+            latency = {"quick": quick_seconds, "deep": round(time.perf_counter() - started, 2)}
+            api = {"quick": _api_usage(quick_api), "deep": _api_usage(deep_api)}
+            logger.info(f"Analyzed {owner}/{repo}@{sha[:7]} in quick={latency['quick']}s deep={latency['deep']}s, GitHub API {api}")
+
             result = {
-                "summary": self._generate_summary(index),
-                "skills": self._extract_skills(documents),
-                "commits": self._analyze_commits(repo_url)
+                "summary": summary.pop("summary"),
+                "skills": meta["skills"],
+                "language_bytes": quick["language_bytes"],
+                "commits": quick["commits"],
+                "metadata": quick["metadata"],
+                "memory": meta.get("memory", {}),
+                "changes": meta["changes"],
+                "embeddings": meta["embeddings"],
+                "summary_stats": summary,
+                "latency": latency,
+                "api": api,
+                "phase": "deep",
+                "sha": sha
             }
             
             self.cache.store(repo_url, result)
             return result
         except Exception as e:
             print(f"Error analyzing repo {repo_url}: {str(e)}")
+            # A failed deep phase still returns what the quick phase found
             return {
+                **(quick or {"skills": {}, "commits": {}}),
                 "summary": f"Error analyzing repository: {str(e)}",
-                "skills": {},
-                "commits": {}
+                "error": str(e)
             }
 
-    def _generate_summary(self, index):
-        query_engine = index.as_query_engine()
-        return query_engine.query(
-            "Generate a 3-paragraph technical summary of this repository"
-        ).response
+    def _quick_phase(self, repo_url: str, owner: str, repo: str, progress) -> tuple:
+        """Result from cheap signals only: metadata, the tree listing, manifest
+        files and commit stats. Returns (result, tree entries)"""
+        progress("fetch")
+        metadata = self.source.repo_metadata(owner, repo)
+        sha = self.source.head_sha(owner, repo, metadata.get("default_branch", "main"))
+        entries = self.source.list_tree(owner, repo, sha)
 
-    def _extract_skills(self, documents) -> dict:
-        """Updated to include AWS detection"""
-        filenames = [d.metadata.get("file_name", "").lower() for d in documents]
-        content = " ".join(d.text for d in documents)
-        
-        return {
-            "languages": self._map_extensions(documents),
-            "devops": self._detect_devops(filenames, content),
-            "ai_components": self._detect_ai_tech(filenames, content),
-            "aws_resources": self._detect_aws_resources(filenames, content),
-            "frameworks": self._detect_frameworks(filenames)
-        }
+        # Languages and frameworks need only paths and sizes; only manifests are downloaded
+        manifests = [e for e in entries if is_manifest(e["path"])][:self.quick_manifests]
+        progress("skills", f"{len(entries)} paths, {len(manifests)} manifest files")
+        contents = {entry["path"]: text for entry, text in self.source.iter_texts(owner, repo, manifests)}
+        skills = self.skills.scan_tree(entries, contents)
 
-    def _detect_devops(self, filenames: list, content: str) -> list:
-        """Explicit DevOps tool detection"""
-        devops_indicators = {
-            # File-based detection
-            'dockerfile': 'Docker',
-            'kubernetes': 'Kubernetes',
-            'argo': 'ArgoCD',
-            'helm': 'Helm',
-            'terraform': 'Terraform',
-            'github-actions': 'GitHub Actions',
-            
-            # Content patterns
-            'apiVersion: apps/v1': 'Kubernetes',
-            'image: ': 'Docker',
-            'helm install': 'Helm'
+        progress("commits")
+        commits = self._analyze_commits(repo_url)
+        metadata = {
+            "name": metadata.get("full_name", f"{owner}/{repo}"),
+            "description": metadata.get("description") or "",
+            "language": metadata.get("language"),
+            "topics": metadata.get("topics", []),
+            "stars": metadata.get("stargazers_count", 0),
+            "default_branch": metadata.get("default_branch", "main"),
         }
-        
-        detected = set()
-        for filename in filenames:
-            for term, tool in devops_indicators.items():
-                if term in filename:
-                    detected.add(tool)
-        
-        # Additional content scanning
-        for term, tool in devops_indicators.items():
-            if term in content.lower():
-                detected.add(tool)
-                
-        return sorted(detected)
-
-    def _detect_ai_tech(self, filenames: list, content: str) -> list:
-        """Explicit AI/ML technology detection"""
-        ai_indicators = {
-            # Framework files
-            'requirements.txt': self._scan_ai_dependencies,
-            'pytorch': 'PyTorch',
-            'tensorflow': 'TensorFlow',
-            'transformers': 'HuggingFace',
-            
-            # Content patterns
-            'from langchain': 'LangChain',
-            'openai': 'OpenAI',
-            'llama-index': 'LlamaIndex',
-            'model.fit(': 'Scikit-learn/TensorFlow',
-            'AutoModelFor': 'HuggingFace'
-        }
-        
-        detected = set()
-        for filename in filenames:
-            if 'requirements.txt' in filename:
-                detected.update(self._scan_ai_dependencies(content))
-                
-            for term, tool in ai_indicators.items():
-                if callable(tool):
-                    continue
-                if term in filename:
-                    detected.add(tool)
-        
-        # Deep content scan
-        for term, tool in ai_indicators.items():
-            if callable(tool):
-                continue
-            if term in content.lower():
-                detected.add(tool)
-                
-        return sorted(detected)
-
-    def _detect_aws_resources(self, filenames: list, content: str) -> list:
-        """Flags AWS services using file patterns and content signatures"""
-        aws_indicators = {
-            # Infrastructure-as-Code files
-            'serverless.yml': 'AWS Lambda',
-            'template.yaml': 'AWS CloudFormation',
-            'cdk.json': 'AWS CDK',
-            
-            # SDK/CLI patterns
-            'boto3': 'AWS SDK (Python)',
-            'aws-sdk': 'AWS SDK',
-            'aws configure': 'AWS CLI',
-            
-            # Service-specific identifiers
-            's3://': 'Amazon S3',
-            'arn:aws:lambda': 'AWS Lambda',
-            'arn:aws:s3': 'Amazon S3',
-            'arn:aws:ec2': 'Amazon EC2',
-            'dynamodb.Table': 'Amazon DynamoDB',
-            'sns.publish': 'Amazon SNS',
-            'sqs.send_message': 'Amazon SQS',
-            'rds.amazonaws.com': 'Amazon RDS',
-            'secretsmanager': 'AWS Secrets Manager'
-        }
-        
-        detected = set()
-        
-        # 1. Filename detection
-        for filename in filenames:
-            for term, service in aws_indicators.items():
-                if term in filename:
-                    detected.add(service)
-        
-        # 2. Deep content scanning
-        content_lower = content.lower()
-        for term, service in aws_indicators.items():
-            if term in content_lower:
-                detected.add(service)
-        
-        # 3. Terraform-specific detection
-        if any(f.endswith('.tf') for f in filenames):
-            tf_services = {
-                'aws_instance': 'Amazon EC2',
-                'aws_lambda_function': 'AWS Lambda',
-                'aws_s3_bucket': 'Amazon S3',
-                'aws_rds_cluster': 'Amazon RDS'
-            }
-            for term, service in tf_services.items():
-                if term in content_lower:
-                    detected.add(service)
-        
-        return sorted(detected)
-
-    def _scan_ai_dependencies(self, content: str) -> list:
-        """Parse requirements.txt for AI libraries"""
-        ai_packages = {
-            'torch': 'PyTorch',
-            'tensorflow': 'TensorFlow',
-            'transformers': 'HuggingFace',
-            'openai': 'OpenAI',
-            'langchain': 'LangChain',
-            'llama-index': 'LlamaIndex',
-            'sentence-transformers': 'Sentence Transformers'
+        result = {
+            "summary": self._quick_summary(metadata),
+            "skills": skills,
+            "language_bytes": language_bytes(entries),
+            "commits": commits,
+            "metadata": metadata,
+            "phase": "quick",
+            "sha": sha
         }
-        
-        found = set()
-        for line in content.split('\n'):
-            line = line.split('#')[0].strip().lower()
-            for pkg, name in ai_packages.items():
-                if pkg in line:
-                    found.add(name)
-        return sorted(found)
-
-    def _map_extensions(self, documents) -> list:
-        """Map file extensions to languages"""
-        extension_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.java': 'Java',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.md': 'Markdown',
-            '.yml': 'YAML',
-            '.yaml': 'YAML'
-        }
-        extensions = set()
+        return result, entries
+
+    def _quick_summary(self, metadata: dict) -> str:
+        """Placeholder summary shown until the AI summary is ready"""
+        details = [f"Main language: {metadata['language']}"] if metadata["language"] else []
+        details.append(f"⭐ {metadata['stars']}")
+        if metadata["topics"]:
+            details.append("Topics: " + ", ".join(metadata["topics"][:5]))
+        return (
+            f"**{metadata['name']}**: {metadata['description'] or 'No description'}\n\n"
+            f"{' · '.join(details)}\n\n"
+            "_Generating the AI summary..._"
+        )
+
+    def _embedding_model(self) -> str:
+        from llama_index.core import Settings
+        return model_id(Settings.embed_model)
+
+    def _build_index(self, repo_url: str, owner: str, repo: str, sha: str, model: str,
+                     progress=None, entries=None, base=None) -> tuple:
+        """Index of the repo at sha, updated from its last stored index (or base) when possible.
+        Returns (index, meta) like IndexStore.load"""
+        if entries is None:
+            entries = self.source.list_tree(owner, repo, sha)
+        base = (base or self.indexes.latest(repo_url, model)) if self.incremental else None
+
+        if base is not None and "files" in base[1]:
+            index, meta = base
+            manifest = meta["files"]
+            diff = diff_tree(manifest, entries)
+            # Drop what the changed and removed files contributed; unchanged files keep theirs
+            for path in diff.removed + [e["path"] for e in diff.modified]:
+                if manifest.pop(path)["skills"] is not None:
+                    index.delete_ref_doc(path, delete_from_docstore=True)
+            manifest.update(build_manifest(diff.changed))
+            todo = diff.changed
+            logger.info(f"Updating {owner}/{repo} {meta['sha'][:7]}..{sha[:7]}: {diff.stats()}")
+        else:
+            index, manifest, todo, diff = None, build_manifest(entries), entries, None
+
+        progress = progress or _no_progress
+        progress("index", f"{len(todo)} of {len(entries)} files to embed")
+
+        # Files are streamed, never all held in memory
+        from llama_index.core import Settings
+        usage = EmbeddingUsage(getattr(Settings.embed_model, "embed_batch_size", 10))
+        failed = []
+        with MemoryProbe() as probe:
+            index, findings = self._index_documents(
+                self.source.iter_documents(owner, repo, sha, todo, failed), probe, index, usage
+            )
+        for path, found in findings.items():
+            manifest[path]["skills"] = found
+        # Files that could not be fetched stay out of the manifest, so the next
+        # analysis sees them as added and fetches them again
+        for path in failed:
+            manifest.pop(path, None)
+        if failed:
+            logger.warning(f"{len(failed)} files of {owner}/{repo}@{sha[:7]} could not be fetched; they are retried next time")
+        memory = probe.stats()
+        changes = diff.stats() if diff is not None else {"added": len(entries), "modified": 0, "removed": 0, "unchanged": 0}
+        embeddings = usage.stats()
+        logger.info(f"Analyzed {owner}/{repo}@{sha[:7]}: memory={memory} embeddings={embeddings}")
+
+        # Skills of unchanged files come from their cached findings
+        skills = self.skills.combine(f["skills"] for f in manifest.values() if f["skills"] is not None)
+        meta = {"skills": skills, "memory": memory, "changes": changes, "embeddings": embeddings,
+                "files": manifest, "failed": failed}
+        self.indexes.save(index, repo_url, sha, model, meta)
+        return index, meta
+
+    def _index_documents(self, documents, probe=None, index=None, usage=None) -> tuple:
+        """Embed and scan a stream of documents, holding at most one batch of them.
+        Returns (index, {path: skill findings})"""
+        from llama_index.core import Settings, VectorStoreIndex  # Heavy; only needed for a fresh analysis
+        from llama_index.core.ingestion import run_transformations
+
+        index = index if index is not None else VectorStoreIndex(nodes=[])
+        findings = {}
+        batch = []
+
+        def flush():
+            nodes = run_transformations(batch, Settings.transformations)
+            self._embed_nodes(nodes, usage)
+            index.insert_nodes(nodes)  # Nodes that already have an embedding aren't sent again
+            for doc in batch:
+                index.docstore.set_document_hash(doc.get_doc_id(), doc.hash)
+            batch.clear()
+
         for doc in documents:
-            file_name = doc.metadata.get("file_name", "")
-            ext = Path(file_name).suffix
-            if ext:
-                extensions.add(ext)
-        return sorted({
-            extension_map[ext] for ext in extensions 
-            if ext in extension_map
-        })
-
-    def _detect_frameworks(self, filenames: list) -> list:
-        """Detect frameworks from filenames"""
-        framework_hints = {
-            'requirements.txt': 'Python',
-            'package.json': 'Node.js',
-            'go.mod': 'Go',
-            'Cargo.toml': 'Rust',
-            'dockerfile': 'Docker',
-            'config.ru': 'Ruby on Rails'
-        }
-        
-        detected = set()
-        for filename in filenames:
-            for hint, framework in framework_hints.items():
-                if hint in filename:
-                    detected.add(framework)
-        return sorted(detected)
+            if probe is not None:
+                probe.record(doc.text)
+            findings[doc.get_doc_id()] = self.skills.detect(doc.metadata.get("file_name", ""), doc.text)
+            batch.append(doc)
+            if len(batch) >= self.index_batch:
+                flush()
+        if batch:
+            flush()
+        return index, findings
+
+    def _embed_nodes(self, nodes, usage=None):
+        """Set node embeddings from the embedding cache, embedding only the misses"""
+        if self.embeddings is None or not nodes:
+            return
+        from llama_index.core import Settings
+        from llama_index.core.schema import MetadataMode
+
+        model = self._embedding_model()
+        texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+        vectors = self.embeddings.get_many(model, texts)
+        hits = sum(1 for vector in vectors if vector is not None)
+        # Identical chunks within the batch are embedded once
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if missing:
+            fresh = Settings.embed_model.get_text_embedding_batch(missing)
+            self.embeddings.put_many(model, missing, fresh)
+            computed = dict(zip(missing, fresh))
+            vectors = [computed[text] if vector is None else vector for text, vector in zip(texts, vectors)]
+        for node, vector in zip(nodes, vectors):
+            node.embedding = vector
+        if usage is not None:
+            usage.record(len(nodes), hits, len(missing))
+
+    def _generate_summary(self, index, repo: str, manifest=None) -> dict:
+        """Map-reduce summary over every indexed file; a single index query without a manifest"""
+        files = {path: f["sha"] for path, f in (manifest or {}).items() if f["skills"] is not None}
+        if not files:
+            query_engine = index.as_query_engine()
+            return {"summary": query_engine.query(
+                "Generate a 3-paragraph technical summary of this repository"
+            ).response}
+        return self.summarizer.summarize(repo, files, lambda path: self._file_text(index, path))
+
+    def _file_text(self, index, path: str) -> str:
+        """Text of one file, rebuilt from its chunks in the index docstore"""
+        info = index.docstore.get_ref_doc_info(path)
+        if info is None:
+            return ""
+        return "\n".join(node.get_content() for node in index.docstore.get_nodes(info.node_ids))
 
     def _analyze_commits(self, repo_url: str) -> dict:
         """Basic commit message analysis"""
-        repo_path = repo_url.split("github.com/")[-1]
-        commits_url = f"https://api.github.com/repos/{repo_path}/commits"
-        
         try:
-            response = requests.get(
-                commits_url,
-                headers={"Authorization": f"token {os.getenv('GITHUB_TOKEN')}"},
-                params={"per_page": 100}  # Analyze last 100 commits
-            )
-            commits = response.json()
+            owner, repo = self.source.locate(repo_url)
+            commits = self.source.list_commits(owner, repo, per_page=100)  # Analyze last 100 commits
             
             return {
                 "recent_activity": self._get_activity_stats(commits),
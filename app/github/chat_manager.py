@@ -1,12 +1,15 @@
-import os
+import time
 from typing import Dict, List
-from openai import OpenAI
+from app.assistant.config.non_ai import config
 from app.github.cache import RepoCache
+from app.llm.client import get_openai_client
+from app.llm.router import ModelRouter
 
 class RepoChatManager:
     def __init__(self):
         self.cache = RepoCache()
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_openai_client()
+        self.router = ModelRouter.from_config(config.MODELS)
         self.followup_prompt = """Based on the conversation, suggest 3 technical follow-up questions focusing on:
 - Code structure
 - Implementation details
@@ -36,12 +39,15 @@ Format as bullet points without numbering."""
         history = self.get_chat_history(repo_url)
         history.append({"role": "user", "content": user_query})
         
-        # Get main response
+        # Get main response (simple lookups go to the fast model)
+        decision = self.router.route(user_query, self.client)
+        start = time.perf_counter()
         response = self.client.chat.completions.create(
-            model="gpt-4",
+            model=decision.model,
             messages=history,
             temperature=0.3
         )
+        self.router.record(decision, time.perf_counter() - start)
         ai_response = response.choices[0].message.content
         
         # Generate follow-ups
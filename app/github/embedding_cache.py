@@ -0,0 +1,187 @@
+# ------------------------------------------------------------------------------
+# Script: embedding_cache.py
+# Purpose: Content-addressed embedding cache shared by every repository and
+#          run: sha256(model + normalized chunk text) -> vector, with vectors
+#          in memory-mapped float16/float32 files and keys in SQLite.
+#
+# Notes:
+#   - The model key is model_id(): the model name plus the requested output
+#     dimensions, so changing `dimensions` never serves vectors of the old size
+#   - One vector file per (model, dimension, dtype): <model>-<dim>.<dtype>;
+#     rows are written and recorded in SQLite under one exclusive file lock,
+#     so several processes can share the directory
+#   - New rows go after the last row recorded in SQLite, not at the end of the
+#     file: bytes of a write that never got recorded (a crash in between) are
+#     overwritten rather than shifting every later row
+#   - Normalization only drops differences embeddings don't care about:
+#     line endings and trailing whitespace
+#   - GITHUB_EMBEDDING_DTYPE=float16 (default) halves the disk and page
+#     cache footprint; vectors are handed back as float32 lists
+# ------------------------------------------------------------------------------
+import hashlib
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows; appends are then only safe within one process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+TRAILING_SPACE = re.compile(r"[ \t]+(?=\n)")
+
+
+def normalize(text: str) -> str:
+    return TRAILING_SPACE.sub("", text.replace("\r\n", "\n").replace("\r", "\n")).strip()
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("_")
+
+
+def model_id(embed_model) -> str:
+    """Cache key of an embedding model: its name, plus the output dimensions when set"""
+    name = getattr(embed_model, "model_name", None) or type(embed_model).__name__
+    dimensions = getattr(embed_model, "dimensions", None)
+    return f"{name}@{dimensions}" if dimensions else name
+
+
+class EmbeddingCache:
+    """Vectors keyed by (embedding model, chunk content), persisted on disk"""
+
+    def __init__(self, root: Optional[str] = None, dtype: Optional[str] = None):
+        self.root = Path(root or os.getenv("GITHUB_EMBEDDING_CACHE_DIR", "cache/embeddings"))
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.dtype = np.dtype(dtype or os.getenv("GITHUB_EMBEDDING_DTYPE", "float16"))
+        self._lock = threading.Lock()
+        self._maps = {}  # vector file name -> np.memmap of its rows
+        self.hits = 0
+        self.misses = 0
+
+        self.db = sqlite3.connect(self.root / "index.db", check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS vectors (
+                key TEXT PRIMARY KEY,
+                file TEXT,
+                dim INTEGER,
+                row INTEGER
+            )
+        """)
+        self.db.commit()
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\0{normalize(text)}".encode("utf-8")).hexdigest()
+
+    def _rows(self, file: str, dim: int, row: int) -> np.memmap:
+        """Memory map of a vector file that covers at least row"""
+        rows = self._maps.get(file)
+        if rows is None or row >= rows.shape[0]:
+            path = self.root / file
+            dtype = np.dtype(path.suffix[1:])
+            count = path.stat().st_size // (dim * dtype.itemsize)
+            rows = np.memmap(path, dtype=dtype, mode="r", shape=(count, dim))
+            self._maps[file] = rows
+        return rows
+
+    def get_many(self, model: str, texts: list) -> list:
+        """Cached vector (list of floats) for each text, or None"""
+        keys = [self.key(model, text) for text in texts]
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                found.update({
+                    key: (file, dim, row) for key, file, dim, row in self.db.execute(
+                        f"SELECT key, file, dim, row FROM vectors WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                    )
+                })
+            vectors = []
+            for key in keys:
+                if key in found:
+                    file, dim, row = found[key]
+                    vectors.append(self._rows(file, dim, row)[row].astype(np.float32).tolist())
+                else:
+                    vectors.append(None)
+            hits = len(keys) - vectors.count(None)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return vectors
+
+    def put_many(self, model: str, texts: list, vectors: list):
+        """Store freshly computed vectors for texts"""
+        if not texts:
+            return
+        array = np.asarray(vectors, dtype=self.dtype)
+        dim = array.shape[1]
+        file = f"{_slug(model)}-{dim}.{self.dtype.name}"
+        keys = [self.key(model, text) for text in texts]
+        with self._lock:
+            fd = os.open(self.root / file, os.O_RDWR | os.O_CREAT, 0o644)
+            with os.fdopen(fd, "r+b") as f:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_EX)  # Released when the file is closed
+                # Rows recorded so far; anything after them was never committed
+                first = self.db.execute(
+                    "SELECT COALESCE(MAX(row) + 1, 0) FROM vectors WHERE file = ?", (file,)
+                ).fetchone()[0]
+                f.seek(first * dim * self.dtype.itemsize)
+                f.write(array.tobytes())
+                f.flush()
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO vectors (key, file, dim, row) VALUES (?, ?, ?, ?)",
+                    [(key, file, dim, first + i) for i, key in enumerate(keys)]
+                )
+                self.db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self.db.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "disk_mb": round(sum(p.stat().st_size for p in self.root.iterdir() if p.is_file()) / 1e6, 2),
+            "dtype": self.dtype.name,
+        }
+
+
+class EmbeddingUsage:
+    """Embedding work of one analysis: chunks served from the cache and API calls saved"""
+
+    def __init__(self, batch_size: int = 10):
+        self.batch_size = max(1, batch_size)
+        self.chunks = 0
+        self.cache_hits = 0
+        self.embedded = 0
+        self.calls = 0
+        self.calls_uncached = 0
+
+    def record(self, chunks: int, cache_hits: int, embedded: int):
+        self.chunks += chunks
+        self.cache_hits += cache_hits
+        self.embedded += embedded
+        self.calls += math.ceil(embedded / self.batch_size)
+        self.calls_uncached += math.ceil(chunks / self.batch_size)
+
+    def stats(self) -> dict:
+        return {
+            "chunks": self.chunks,
+            "cache_hits": self.cache_hits,
+            "embedded": self.embedded,
+            "hit_ratio": round(self.cache_hits / self.chunks, 3) if self.chunks else 0.0,
+            "embedding_calls": self.calls,
+            "calls_saved": self.calls_uncached - self.calls,
+        }
@@ -0,0 +1,116 @@
+# ------------------------------------------------------------------------------
+# Script: index_store.py
+# Purpose: Persist each repository's vector index on disk, keyed by repo URL,
+#          commit SHA and embedding model, so an unchanged repository is never
+#          embedded twice.
+#
+# Notes:
+#   - Layout: <root>/<repo>/<sha>-<model>/ holding the llama_index storage
+#     files plus meta.json (skills and anything else saved with the index)
+#   - Writes go to a temporary directory that is renamed into place, so a
+#     reader never sees a half-written index
+#   - Older SHAs of a repo are pruned, keeping GITHUB_INDEX_KEEP per repo
+#   - latest() hands back the newest index of a repo so a changed repo can be
+#     updated incrementally rather than rebuilt
+# ------------------------------------------------------------------------------
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("_")
+
+
+class IndexStore:
+    """Vector indexes persisted per (repo URL, commit SHA, embedding model)"""
+
+    def __init__(self, root: Optional[str] = None, keep: Optional[int] = None):
+        self.root = Path(root or os.getenv("GITHUB_INDEX_DIR", "cache/indexes"))
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.keep = keep or int(os.getenv("GITHUB_INDEX_KEEP", "2"))
+        self.hits = 0
+        self.misses = 0
+
+    def repo_dir(self, repo_url: str) -> Path:
+        return self.root / _slug(repo_url.rstrip("/").lower().split("://")[-1])
+
+    def path(self, repo_url: str, sha: str, model: str) -> Path:
+        return self.repo_dir(repo_url) / f"{sha}-{_slug(model)}"
+
+    def load(self, repo_url: str, sha: str, model: str) -> Optional[tuple]:
+        """(index, meta) saved for this commit and model, or None"""
+        folder = self.path(repo_url, sha, model)
+        if not (folder / "meta.json").exists():
+            self.misses += 1
+            return None
+        from llama_index.core import StorageContext, load_index_from_storage
+
+        try:
+            index = load_index_from_storage(StorageContext.from_defaults(persist_dir=str(folder)))
+            meta = json.loads((folder / "meta.json").read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Discarding unreadable index {folder}: {e}")
+            shutil.rmtree(folder, ignore_errors=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        logger.info(f"Loaded index of {repo_url}@{sha[:7]} from {folder}")
+        return index, meta
+
+    def latest(self, repo_url: str, model: str) -> Optional[tuple]:
+        """(index, meta) of the most recently saved commit of repo_url for model"""
+        repo_dir = self.repo_dir(repo_url)
+        if not repo_dir.exists():
+            return None
+        suffix = f"-{_slug(model)}"
+        candidates = sorted(
+            (p for p in repo_dir.iterdir() if p.name.endswith(suffix) and (p / "meta.json").exists()),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for folder in candidates:
+            if stored := self.load(repo_url, folder.name[:-len(suffix)], model):
+                return stored
+        return None
+
+    def save(self, index, repo_url: str, sha: str, model: str, meta: Optional[dict] = None) -> Path:
+        """Persist index (and meta) for this commit and model, atomically"""
+        folder = self.path(repo_url, sha, model)
+        folder.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".tmp-", dir=folder.parent))
+        try:
+            index.storage_context.persist(persist_dir=str(staging))
+            # meta.json is written last: its presence marks a complete index
+            (staging / "meta.json").write_text(
+                json.dumps({"repo_url": repo_url, "sha": sha, "model": model, **(meta or {})}),
+                encoding="utf-8"
+            )
+            if folder.exists():
+                shutil.rmtree(folder)
+            os.replace(staging, folder)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        self._prune(folder.parent)
+        return folder
+
+    def _prune(self, repo_dir: Path):
+        """Keep only the most recently written indexes of a repo"""
+        indexes = sorted(
+            (p for p in repo_dir.iterdir() if p.is_dir() and not p.name.startswith(".tmp-")),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in indexes[self.keep:]:
+            shutil.rmtree(stale, ignore_errors=True)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "root": str(self.root)}
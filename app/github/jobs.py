@@ -0,0 +1,194 @@
+# ------------------------------------------------------------------------------
+# Script: jobs.py
+# Purpose: Run repository analyses as background jobs: submit() returns a job
+#          id at once, jobs run on a bounded worker pool, duplicate submits for
+#          a repo attach to its running job, and stage progress can be polled
+#          or watched (async) without holding a UI worker thread.
+#
+# Notes:
+#   - Stages are reported by RepoAnalyzer through its progress callback, and
+#     its quick-phase result is kept as the job's "partial" result
+#   - watch() is an async generator that polls with asyncio.sleep, so a UI
+#     handler streaming progress needs no thread of its own
+#   - Finished jobs are kept for lookups, up to GITHUB_JOB_HISTORY of them
+# ------------------------------------------------------------------------------
+import asyncio
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+FINISHED = ("done", "failed")
+
+
+class Job:
+    """One analysis of one repository and its stage-by-stage progress"""
+
+    def __init__(self, repo_url: str, stages: tuple):
+        self.id = uuid.uuid4().hex[:12]
+        self.repo_url = repo_url
+        self.state = "queued"
+        self.stages = {name: {"state": "pending"} for name in stages}
+        self.result = None
+        self.partial = None  # Quick-phase result, until the full one is ready
+        self.error = None
+        self.submitted_at = time.time()
+        self.version = 0  # Bumped on every change; watchers compare it
+        self._stage = None
+        self._stage_started = None
+        self._started = None
+
+    def snapshot(self) -> dict:
+        return {
+            "id": self.id,
+            "repo_url": self.repo_url,
+            "state": self.state,
+            "stages": {name: dict(stage) for name, stage in self.stages.items()},
+            "result": self.result,
+            "partial": self.partial,
+            "error": self.error,
+            "seconds": round(time.perf_counter() - self._started, 2) if self._started else 0.0,
+            "version": self.version,
+        }
+
+
+class JobManager:
+    """Bounded pool of repository analyses with de-duplication per repo"""
+
+    def __init__(self, analyzer_factory: Callable, max_workers: Optional[int] = None,
+                 history: Optional[int] = None, stages: Optional[tuple] = None):
+        self.analyzer_factory = analyzer_factory  # Called on a worker thread, on first use
+        self.max_workers = max_workers or int(os.getenv("GITHUB_JOB_WORKERS", "2"))
+        self.history = history or int(os.getenv("GITHUB_JOB_HISTORY", "100"))
+        if stages is None:
+            from .analyzer import RepoAnalyzer
+            stages = RepoAnalyzer.STAGES
+        self.stages = stages
+        self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="repo-job")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()  # id -> Job
+        self._active = {}  # repo key -> Job still queued or running
+        self.submitted = 0
+        self.attached = 0
+
+    @staticmethod
+    def _key(repo_url: str) -> str:
+        return repo_url.rstrip("/").lower()
+
+    def submit(self, repo_url: str) -> str:
+        """Job id analysing repo_url; an unfinished job for the same repo is reused"""
+        with self._lock:
+            self.submitted += 1
+            if job := self._active.get(self._key(repo_url)):
+                self.attached += 1
+                return job.id
+            job = Job(repo_url, self.stages)
+            self._jobs[job.id] = job
+            self._active[self._key(repo_url)] = job
+            self._prune()
+        self.pool.submit(self._run, job)
+        return job.id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def snapshot(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.snapshot() if job else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None, interval: float = 0.05) -> Optional[dict]:
+        """Block until the job finishes (or timeout); returns its last snapshot"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            snapshot = self.snapshot(job_id)
+            if snapshot is None or snapshot["state"] in FINISHED:
+                return snapshot
+            if deadline is not None and time.monotonic() >= deadline:
+                return snapshot
+            time.sleep(interval)
+
+    async def watch(self, job_id: str, interval: float = 0.25):
+        """Async generator of snapshots, one per change, ending with the finished job"""
+        version = -1
+        while True:
+            snapshot = self.snapshot(job_id)
+            if snapshot is None:
+                return
+            if snapshot["version"] != version:
+                version = snapshot["version"]
+                yield snapshot
+            if snapshot["state"] in FINISHED:
+                return
+            await asyncio.sleep(interval)
+
+    def _progress(self, job: Job, stage: str, detail: str = ""):
+        """RepoAnalyzer's progress callback: stage has started (detail optional)"""
+        with self._lock:
+            now = time.perf_counter()
+            self._finish_stage(job, now)
+            job._stage, job._stage_started = stage, now
+            job.stages.setdefault(stage, {})
+            job.stages[stage].update(state="running", detail=detail)
+            job.version += 1
+
+    def _partial(self, job: Job, partial: dict):
+        with self._lock:
+            job.partial = partial
+            job.version += 1
+
+    @staticmethod
+    def _finish_stage(job: Job, now: float):
+        if job._stage is not None:
+            job.stages[job._stage].update(state="done", seconds=round(now - job._stage_started, 2))
+            job._stage = None
+
+    def _run(self, job: Job):
+        with self._lock:
+            job.state = "running"
+            job._started = time.perf_counter()
+            job.version += 1
+        try:
+            analyzer = self.analyzer_factory()
+            result = analyzer.analyze(
+                job.repo_url,
+                progress=lambda stage, detail="": self._progress(job, stage, detail),
+                on_quick=lambda partial: self._partial(job, partial)
+            )
+            error = result.get("error")
+        except Exception as e:
+            result, error = None, str(e)
+
+        with self._lock:
+            now = time.perf_counter()
+            if error and job._stage is not None:
+                job.stages[job._stage].update(state="failed", seconds=round(now - job._stage_started, 2))
+                job._stage = None
+            self._finish_stage(job, now)
+            for stage in job.stages.values():
+                if stage["state"] == "pending":
+                    stage["state"] = "skipped"  # Served from a cache, or never reached
+            job.result, job.error = result, error
+            job.state = "failed" if error else "done"
+            job.version += 1
+            if self._active.get(self._key(job.repo_url)) is job:
+                del self._active[self._key(job.repo_url)]
+        logger.info(f"Analysis job {job.id} for {job.repo_url} {job.state} in {now - job._started:.1f}s")
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.state in FINISHED]
+        for job_id in finished[:max(0, len(self._jobs) - self.history)]:
+            del self._jobs[job_id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            states = {}
+            for job in self._jobs.values():
+                states[job.state] = states.get(job.state, 0) + 1
+            return {"submitted": self.submitted, "attached": self.attached, "workers": self.max_workers, **states}
@@ -0,0 +1,57 @@
+# ------------------------------------------------------------------------------
+# Script: manifest.py
+# Purpose: Per-file manifest of an analysed repository (blob SHA and cached
+#          skill findings per path) and the diff between a manifest and the
+#          current git tree, which drives incremental re-analysis.
+#
+# Notes:
+#   - A manifest is {path: {"sha": blob_sha, "skills": findings or None}};
+#     None marks a file that was listed but not indexed (binary, too large)
+#   - Files whose fetch failed are left out, so the next diff lists them as
+#     added and they are fetched again
+#   - Git blob SHAs are content hashes, so an equal SHA means an equal file
+# ------------------------------------------------------------------------------
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TreeDiff:
+    added: list = field(default_factory=list)      # Tree entries new since the manifest
+    modified: list = field(default_factory=list)   # Tree entries whose blob SHA changed
+    removed: list = field(default_factory=list)    # Paths gone from the tree
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> list:
+        """Entries to fetch and embed"""
+        return self.added + self.modified
+
+    def stats(self) -> dict:
+        return {
+            "added": len(self.added),
+            "modified": len(self.modified),
+            "removed": len(self.removed),
+            "unchanged": self.unchanged,
+        }
+
+
+def diff_tree(manifest: dict, entries: list) -> TreeDiff:
+    """Compare a stored manifest with the current tree entries ({"path", "sha", "size"})"""
+    diff = TreeDiff()
+    current = set()
+    for entry in entries:
+        current.add(entry["path"])
+        known = manifest.get(entry["path"])
+        if known is None:
+            diff.added.append(entry)
+        elif known["sha"] != entry["sha"]:
+            diff.modified.append(entry)
+        else:
+            diff.unchanged += 1
+    diff.removed = [path for path in manifest if path not in current]
+    return diff
+
+
+def build_manifest(entries: list) -> dict:
+    """Fresh manifest of tree entries, nothing indexed yet"""
+    return {entry["path"]: {"sha": entry["sha"], "skills": None} for entry in entries}
@@ -0,0 +1,95 @@
+# ------------------------------------------------------------------------------
+# Script: memory.py
+# Purpose: Measure the memory of one repository analysis: traced Python
+#          allocation peak, process RSS and the size of the files streamed.
+#
+# Notes:
+#   - By default only RSS and file sizes are reported: tracemalloc slows every
+#     allocation several times, so it is opt-in (GITHUB_TRACE_MEMORY=true, or
+#     MemoryProbe(trace=True) in tests and benchmarks)
+#   - Tracing is reference-counted across probes: the first probe starts it
+#     (unless someone else already traces) and the last one stops it
+#   - The traced peak is process-wide; probes that overlap (concurrent
+#     analyses) share one peak, measured from when the first of them started
+# ------------------------------------------------------------------------------
+import os
+import resource
+import sys
+import threading
+import tracemalloc
+from typing import Optional
+
+_trace_lock = threading.Lock()
+_trace_users = 0  # Probes currently tracing
+_trace_owned = False  # Whether the probes started tracemalloc (and so stop it)
+
+
+def current_rss_mb() -> float:
+    """Resident set size now, from /proc when available"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """Highest RSS of the process so far (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class MemoryProbe:
+    """Context manager recording memory use while documents are streamed through"""
+
+    def __init__(self, trace: Optional[bool] = None):
+        self.trace = trace if trace is not None else os.getenv("GITHUB_TRACE_MEMORY", "false").lower() == "true"
+        self.files = 0
+        self.total_bytes = 0
+        self.largest_file_bytes = 0
+
+    def __enter__(self):
+        global _trace_users, _trace_owned
+        if self.trace:
+            with _trace_lock:
+                if _trace_users == 0:
+                    _trace_owned = not tracemalloc.is_tracing()
+                    if _trace_owned:
+                        tracemalloc.start()
+                    tracemalloc.reset_peak()  # Only with no other probe measuring
+                _trace_users += 1
+        self.rss_before_mb = current_rss_mb()
+        return self
+
+    def __exit__(self, *exc):
+        global _trace_users
+        if self.trace:
+            with _trace_lock:
+                self.traced_peak_bytes = tracemalloc.get_traced_memory()[1]
+                _trace_users -= 1
+                if _trace_users == 0 and _trace_owned:
+                    tracemalloc.stop()
+        self.rss_after_mb = current_rss_mb()
+        return False
+
+    def record(self, text: str):
+        size = len(text)  # Characters; avoids copying the file just to measure it
+        self.files += 1
+        self.total_bytes += size
+        self.largest_file_bytes = max(self.largest_file_bytes, size)
+
+    def stats(self) -> dict:
+        stats = {
+            "files": self.files,
+            "total_kb": round(self.total_bytes / 1024, 1),
+            "largest_file_kb": round(self.largest_file_bytes / 1024, 1),
+            "rss_before_mb": round(self.rss_before_mb, 1),
+            "rss_after_mb": round(getattr(self, "rss_after_mb", self.rss_before_mb), 1),
+            "rss_peak_mb": round(peak_rss_mb(), 1),
+        }
+        if self.trace:
+            stats["traced_peak_mb"] = round(getattr(self, "traced_peak_bytes", 0) / 1e6, 2)
+        return stats
@@ -0,0 +1,304 @@
+# ------------------------------------------------------------------------------
+# Script: skills.py
+# Purpose: Detect languages, DevOps tools, AI components, AWS services and
+#          frameworks in a repository with one compiled multi-pattern matcher
+#          that runs once over each (lowercased) document.
+#
+# Notes:
+#   - Uses an Aho-Corasick automaton when pyahocorasick is installed, else a
+#     single trie-shaped regex with a lookahead so overlapping terms are found
+#   - Terraform resource names only count when the repo has a .tf file
+#   - AI packages are only looked up in requirements files
+#   - SkillAccumulator takes documents one at a time, so the text of a repo
+#     never has to be held or joined in memory
+#   - scan_tree() and language_bytes() work from a git tree listing (paths and
+#     blob sizes), so only manifest files ever need to be downloaded
+#   - Per-file findings can be cached and combined later, so an unchanged
+#     file never has to be scanned again
+# ------------------------------------------------------------------------------
+import re
+from collections import defaultdict
+from pathlib import Path
+
+try:
+    import ahocorasick
+except ImportError:  # Optional dependency
+    ahocorasick = None
+
+DEVOPS_TERMS = {
+    # File-based detection
+    'dockerfile': 'Docker',
+    'kubernetes': 'Kubernetes',
+    'argo': 'ArgoCD',
+    'helm': 'Helm',
+    'terraform': 'Terraform',
+    'github-actions': 'GitHub Actions',
+
+    # Content patterns
+    'apiversion: apps/v1': 'Kubernetes',
+    'image: ': 'Docker',
+    'helm install': 'Helm'
+}
+
+AI_TERMS = {
+    'pytorch': 'PyTorch',
+    'tensorflow': 'TensorFlow',
+    'transformers': 'HuggingFace',
+    'from langchain': 'LangChain',
+    'openai': 'OpenAI',
+    'llama-index': 'LlamaIndex',
+    'model.fit(': 'Scikit-learn/TensorFlow',
+    'automodelfor': 'HuggingFace'
+}
+
+AWS_TERMS = {
+    # Infrastructure-as-Code files
+    'serverless.yml': 'AWS Lambda',
+    'template.yaml': 'AWS CloudFormation',
+    'cdk.json': 'AWS CDK',
+
+    # SDK/CLI patterns
+    'boto3': 'AWS SDK (Python)',
+    'aws-sdk': 'AWS SDK',
+    'aws configure': 'AWS CLI',
+
+    # Service-specific identifiers
+    's3://': 'Amazon S3',
+    'arn:aws:lambda': 'AWS Lambda',
+    'arn:aws:s3': 'Amazon S3',
+    'arn:aws:ec2': 'Amazon EC2',
+    'dynamodb.table': 'Amazon DynamoDB',
+    'sns.publish': 'Amazon SNS',
+    'sqs.send_message': 'Amazon SQS',
+    'rds.amazonaws.com': 'Amazon RDS',
+    'secretsmanager': 'AWS Secrets Manager'
+}
+
+TERRAFORM_AWS_TERMS = {
+    'aws_instance': 'Amazon EC2',
+    'aws_lambda_function': 'AWS Lambda',
+    'aws_s3_bucket': 'Amazon S3',
+    'aws_rds_cluster': 'Amazon RDS'
+}
+
+AI_PACKAGES = {
+    'torch': 'PyTorch',
+    'tensorflow': 'TensorFlow',
+    'transformers': 'HuggingFace',
+    'openai': 'OpenAI',
+    'langchain': 'LangChain',
+    'llama-index': 'LlamaIndex',
+    'sentence-transformers': 'Sentence Transformers'
+}
+
+FRAMEWORK_HINTS = {
+    'requirements.txt': 'Python',
+    'package.json': 'Node.js',
+    'go.mod': 'Go',
+    'cargo.toml': 'Rust',
+    'dockerfile': 'Docker',
+    'config.ru': 'Ruby on Rails'
+}
+
+EXTENSION_LANGUAGES = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.java': 'Java',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.md': 'Markdown',
+    '.yml': 'YAML',
+    '.yaml': 'YAML'
+}
+
+# Small files whose content is enough for a first skill estimate of a repo
+MANIFEST_NAMES = ('requirements', 'package.json', 'dockerfile', 'docker-compose', 'go.mod',
+                  'cargo.toml', 'pyproject.toml', 'setup.py', 'serverless.yml', 'template.yaml',
+                  'cdk.json', 'chart.yaml')
+MANIFEST_SUFFIXES = ('.tf',)
+
+# Categories reported by the scanner, in RepoAnalyzer's result order
+CATEGORIES = ("languages", "devops", "ai_components", "aws_resources", "frameworks")
+
+COMMENT = re.compile(r"#[^\n]*")
+
+
+def _trie_pattern(terms) -> str:
+    """Regex alternation shaped like a prefix trie; tries the longest term first"""
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def language_bytes(entries) -> dict:
+    """{language: bytes} from tree entries ({"path", "size"}), largest first; no content needed"""
+    totals = defaultdict(int)
+    for entry in entries:
+        language = EXTENSION_LANGUAGES.get(Path(entry["path"]).suffix)
+        if language:
+            totals[language] += entry.get("size", 0)
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def is_manifest(path: str) -> bool:
+    """Dependency, container and infrastructure files (requirements*.txt, package.json, Dockerfile, *.tf, ...)"""
+    name = path.rsplit("/", 1)[-1].lower()
+    return name.startswith(MANIFEST_NAMES) or name.endswith(MANIFEST_SUFFIXES)
+
+
+class TermMatcher:
+    """Find every occurrence of many literal terms in one pass over a text"""
+
+    def __init__(self, terms: dict):
+        # term -> tuple of tags; terms are matched case-sensitively, so callers lowercase
+        self.terms = {term: tuple(tags) for term, tags in terms.items()}
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for term, tags in self.terms.items():
+                self._automaton.add_word(term, tags)
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            # A match is the longest term at its position; shorter terms that
+            # are prefixes of it start there too
+            self._prefix_tags = {
+                term: tuple(tag for other, tags in self.terms.items() if term.startswith(other) for tag in tags)
+                for term in self.terms
+            }
+            self._pattern = re.compile("(?=(" + _trie_pattern(self.terms) + "))")
+
+    def tags(self, text: str) -> set:
+        """Tags of every term occurring in text"""
+        found = set()
+        if self._automaton is not None:
+            for _, tags in self._automaton.iter(text):
+                found.update(tags)
+        else:
+            for match in self._pattern.finditer(text):
+                found.update(self._prefix_tags[match.group(1)])
+        return found
+
+
+def _tagged(*tables):
+    """Merge {term: label} tables into {term: [(category, label), ...]}"""
+    merged = defaultdict(list)
+    for category, table in tables:
+        for term, label in table.items():
+            merged[term].append((category, label))
+    return merged
+
+
+class SkillAccumulator:
+    """Skill detection state for one repository, fed one document at a time"""
+
+    def __init__(self, scanner: "SkillScanner"):
+        self.scanner = scanner
+        self.found = {category: set() for category in CATEGORIES}
+        self.terraform_hits = set()
+        self.has_terraform = False
+        self.documents = 0
+
+    def add(self, file_name: str, text: str) -> dict:
+        """Scan one document; returns its own findings (see SkillScanner.detect)"""
+        found = self.scanner.detect(file_name, text)
+        self.merge(found)
+        return found
+
+    def merge(self, found: dict):
+        """Fold in one file's findings, e.g. cached from an earlier analysis"""
+        self.documents += 1
+        for category in CATEGORIES:
+            self.found[category].update(found.get(category, ()))
+        self.terraform_hits.update(found.get("terraform", ()))
+        self.has_terraform = self.has_terraform or found.get("tf_file", False)
+
+    def result(self) -> dict:
+        found = {category: set(labels) for category, labels in self.found.items()}
+        if self.has_terraform:
+            found["aws_resources"].update(self.terraform_hits)
+        return {category: sorted(found[category]) for category in CATEGORIES}
+
+
+class SkillScanner:
+    """Compiled matchers shared by every analysis; build once and reuse"""
+
+    def __init__(self):
+        self.content_matcher = TermMatcher(_tagged(
+            ("devops", DEVOPS_TERMS),
+            ("ai_components", AI_TERMS),
+            ("aws_resources", AWS_TERMS),
+            ("terraform", TERRAFORM_AWS_TERMS),
+        ))
+        self.filename_matcher = TermMatcher(_tagged(
+            ("devops", DEVOPS_TERMS),
+            ("ai_components", AI_TERMS),
+            ("aws_resources", AWS_TERMS),
+            ("frameworks", FRAMEWORK_HINTS),
+        ))
+        self.package_matcher = TermMatcher(_tagged(("ai_components", AI_PACKAGES)))
+
+    def detect(self, file_name: str, text: str) -> dict:
+        """Findings of one file: {category: [labels]} plus the Terraform-only
+        "terraform" hits and "tf_file"; empty entries are left out so the
+        result stays small enough to cache per file"""
+        name = (file_name or "").lower()
+        found = defaultdict(set)
+
+        ext = Path(file_name or "").suffix
+        if ext in EXTENSION_LANGUAGES:
+            found["languages"].add(EXTENSION_LANGUAGES[ext])
+
+        for category, label in self.filename_matcher.tags(name):
+            found[category].add(label)
+
+        content = (text or "").lower()
+        for category, label in self.content_matcher.tags(content):
+            found[category].add(label)
+
+        if "requirements.txt" in name:
+            for category, label in self.package_matcher.tags(COMMENT.sub("", content)):
+                found[category].add(label)
+
+        result = {category: sorted(labels) for category, labels in found.items()}
+        if name.endswith(".tf"):
+            result["tf_file"] = True
+        return result
+
+    def accumulator(self) -> SkillAccumulator:
+        return SkillAccumulator(self)
+
+    def scan(self, documents) -> dict:
+        """Skills of llama_index documents (anything with .text and .metadata)"""
+        accumulator = self.accumulator()
+        for doc in documents:
+            accumulator.add(doc.metadata.get("file_name", ""), doc.text)
+        return accumulator.result()
+
+    def scan_tree(self, entries, contents=None) -> dict:
+        """Skills of a repository from its tree listing: every path by name,
+        plus the text of the few files given in contents ({path: text})"""
+        contents = contents or {}
+        accumulator = self.accumulator()
+        for entry in entries:
+            accumulator.add(Path(entry["path"]).name, contents.get(entry["path"], ""))
+        return accumulator.result()
+
+    def combine(self, findings) -> dict:
+        """Repository skills from per-file findings of detect()"""
+        accumulator = self.accumulator()
+        for found in findings:
+            accumulator.merge(found)
+        return accumulator.result()
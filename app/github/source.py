@@ -0,0 +1,169 @@
+# ------------------------------------------------------------------------------
+# Script: source.py
+# Purpose: Stream the files of a GitHub repository one document at a time,
+#          from the git tree and blob APIs, so an analysis never holds more
+#          than the file it is currently processing.
+#
+# Notes:
+#   - One tree call lists every blob with its path, SHA and size
+#   - Blobs are fetched lazily as the generator is consumed
+#   - Files above GITHUB_MAX_FILE_BYTES and binary files are skipped, which
+#     bounds memory by the largest file that is actually processed
+# ------------------------------------------------------------------------------
+import logging
+import os
+import posixpath
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+API_URL = "https://api.github.com"
+
+
+def parse_repo_url(repo_url: str) -> tuple:
+    """(owner, repo) of https://github.com/owner/repo[.git][/]"""
+    parts = [p for p in repo_url.rstrip("/").split("/") if p]
+    if len(parts) < 2:
+        raise ValueError(f"Invalid repo URL: {repo_url}")
+    owner, repo = parts[-2], parts[-1]
+    return owner, repo[:-4] if repo.endswith(".git") else repo
+
+
+def decode_text(raw: bytes) -> Optional[str]:
+    """UTF-8 text of a blob, or None for binary content"""
+    if b"\0" in raw[:8000]:
+        return None
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+class GithubTreeSource:
+    """Lists a repository tree and yields its text files as llama_index documents"""
+
+    def __init__(self, token: Optional[str] = None, max_file_bytes: Optional[int] = None):
+        self.session = requests.Session()
+        self.token = token or os.getenv("GITHUB_TOKEN")
+        if self.token:
+            self.session.headers["Authorization"] = f"token {self.token}"
+        self.max_file_bytes = max_file_bytes or int(os.getenv("GITHUB_MAX_FILE_BYTES", str(1024 * 1024)))
+        # Last rate limit GitHub reported (X-RateLimit-* headers); None until the first call
+        self.rate_remaining = None
+        self.rate_reset = 0.0
+        # API calls and bytes received, in total and per meter() block of the calling thread
+        self.calls = 0
+        self.bytes_received = 0
+        self._meters = threading.local()
+
+    def _get(self, path: str, **kwargs) -> requests.Response:
+        response = self.session.get(f"{API_URL}{path}", timeout=30, **kwargs)
+        size = len(response.content or b"")
+        self.calls += 1
+        self.bytes_received += size
+        for meter in getattr(self._meters, "active", ()):
+            meter["calls"] += 1
+            meter["bytes"] += size
+        headers = getattr(response, "headers", {})
+        if "X-RateLimit-Remaining" in headers:
+            self.rate_remaining = int(headers["X-RateLimit-Remaining"])
+            self.rate_reset = float(headers.get("X-RateLimit-Reset", 0))
+        response.raise_for_status()
+        return response
+
+    @contextmanager
+    def meter(self):
+        """Count the API calls and bytes this thread makes inside the block"""
+        meter = {"calls": 0, "bytes": 0}
+        active = self._meters.__dict__.setdefault("active", [])
+        active.append(meter)
+        try:
+            yield meter
+        finally:
+            active.remove(meter)
+
+    def rate_limit_wait(self, min_remaining: int) -> float:
+        """Seconds to wait before using the API again so min_remaining calls stay in reserve"""
+        if self.rate_remaining is None or self.rate_remaining >= min_remaining:
+            return 0.0
+        return max(0.0, self.rate_reset - time.time())
+
+    def locate(self, repo_url: str) -> tuple:
+        """(owner, repo) that the other methods take for repo_url"""
+        return parse_repo_url(repo_url)
+
+    def repo_metadata(self, owner: str, repo: str) -> dict:
+        """The repository resource: description, topics, default_branch, language, ..."""
+        return self._get(f"/repos/{owner}/{repo}").json()
+
+    def default_branch(self, owner: str, repo: str) -> str:
+        return self.repo_metadata(owner, repo).get("default_branch", "main")
+
+    def head_sha(self, owner: str, repo: str, ref: str) -> str:
+        """Commit SHA that ref (branch, tag or SHA) points at"""
+        return self._get(
+            f"/repos/{owner}/{repo}/commits/{ref}",
+            headers={"Accept": "application/vnd.github.sha"}
+        ).text.strip()
+
+    def list_tree(self, owner: str, repo: str, ref: str) -> list:
+        """Every blob in the tree at ref: [{"path", "sha", "size"}]"""
+        tree = self._get(f"/repos/{owner}/{repo}/git/trees/{ref}", params={"recursive": "1"}).json()
+        if tree.get("truncated"):
+            logger.warning(f"Tree of {owner}/{repo}@{ref} is truncated by the API; some files are missing")
+        return [
+            {"path": item["path"], "sha": item["sha"], "size": item.get("size", 0)}
+            for item in tree.get("tree", [])
+            if item.get("type") == "blob"
+        ]
+
+    def read_blob(self, owner: str, repo: str, sha: str) -> Optional[str]:
+        """Text of one blob, or None when it isn't UTF-8 text"""
+        raw = self._get(
+            f"/repos/{owner}/{repo}/git/blobs/{sha}",
+            headers={"Accept": "application/vnd.github.raw"}
+        ).content
+        return decode_text(raw)
+
+    def list_commits(self, owner: str, repo: str, per_page: int = 100) -> list:
+        return self._get(f"/repos/{owner}/{repo}/commits", params={"per_page": per_page}).json()
+
+    def iter_texts(self, owner: str, repo: str, entries: Iterable[dict],
+                   failed: Optional[list] = None) -> Iterator[tuple]:
+        """(entry, text) of each text file among entries, fetched one at a time.
+        Paths that could not be fetched are appended to failed"""
+        for entry in entries:
+            if entry.get("size", 0) > self.max_file_bytes:
+                logger.info(f"Skipping {entry['path']} ({entry['size']} bytes)")
+                continue
+            try:
+                text = self.read_blob(owner, repo, entry["sha"])
+            except requests.RequestException as e:
+                logger.warning(f"Could not fetch {entry['path']}: {e}")
+                if failed is not None:
+                    failed.append(entry["path"])
+                continue
+            if text is not None:
+                yield entry, text
+
+    def iter_documents(self, owner: str, repo: str, ref: str, entries: Optional[Iterable[dict]] = None,
+                       failed: Optional[list] = None) -> Iterator:
+        """Documents of the given tree entries (default: the whole tree), fetched one at a time.
+        Paths that could not be fetched are appended to failed"""
+        from llama_index.core import Document
+
+        entries = self.list_tree(owner, repo, ref) if entries is None else entries
+        for entry, text in self.iter_texts(owner, repo, entries, failed):
+            yield Document(
+                id_=entry["path"],
+                text=text,
+                metadata={"file_path": entry["path"], "file_name": posixpath.basename(entry["path"])},
+                # Embed the file name but not its directory, so copies of a file
+                # at different paths share cached embeddings
+                excluded_embed_metadata_keys=["file_path"],
+            )
@@ -0,0 +1,203 @@
+# ------------------------------------------------------------------------------
+# Script: summarizer.py
+# Purpose: Map-reduce repository summaries: files are grouped by top-level
+#          directory, each group is summarized concurrently by the fast model,
+#          and the large model reduces the group summaries to the final
+#          3-paragraph summary.
+#
+# Notes:
+#   - A group's cache key is the hash of its (path, blob SHA) pairs, model
+#     and prompt, so when one directory changes only its summary is redone;
+#     the reduce step is cached the same way over the group keys
+#   - Group summaries live as small JSON files under GITHUB_SUMMARY_CACHE_DIR;
+#     a hit refreshes a file's mtime, and beyond GITHUB_SUMMARY_CACHE_KEEP files
+#     the least recently used are deleted
+#   - A group whose map call fails is left out of the reduce (and retried on
+#     the next run); the reduce of an incomplete set of groups isn't cached
+#   - Groups above GITHUB_SUMMARY_GROUP_FILES files are split one level deeper
+#   - Each group sends at most GITHUB_SUMMARY_GROUP_CHARS of excerpts, spread
+#     over its files with READMEs and manifests first
+# ------------------------------------------------------------------------------
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+ROOT_GROUP = "(root)"
+
+MAP_PROMPT = (
+    "You are reviewing one part of the {repo} repository: {group}. "
+    "In one short paragraph, describe what this part does, its main components "
+    "and the technologies it uses. Only use the excerpts below."
+)
+
+REDUCE_PROMPT = (
+    "Generate a 3-paragraph technical summary of the {repo} repository from "
+    "these summaries of its parts: what it does, how it is built, and notable "
+    "technologies and practices."
+)
+
+# Files that describe a directory best are excerpted first
+KEY_FILES = ("readme", "__init__.py", "main.", "index.", "package.json", "pyproject.toml",
+             "requirements.txt", "go.mod", "cargo.toml", "dockerfile")
+
+
+def _hash(*parts) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def group_files(paths, max_files: int) -> dict:
+    """{group: [paths]} by top-level directory; oversized groups split by the next level"""
+    groups = {}
+    for path in paths:
+        top = path.split("/", 1)[0] if "/" in path else ROOT_GROUP
+        groups.setdefault(top, []).append(path)
+
+    split = {}
+    for group, members in groups.items():
+        if group != ROOT_GROUP and len(members) > max_files:
+            for path in members:
+                parts = path.split("/")
+                split.setdefault("/".join(parts[:2]) if len(parts) > 2 else group, []).append(path)
+        else:
+            split[group] = members
+    return {group: sorted(members) for group, members in sorted(split.items())}
+
+
+def _excerpt_order(path: str) -> tuple:
+    name = posixpath.basename(path).lower()
+    return (not name.startswith(KEY_FILES), path.count("/"), path)
+
+
+class RepoSummarizer:
+    """Summarizes a repository from its files, reusing cached per-group summaries"""
+
+    def __init__(self, client=None, map_model: Optional[str] = None, reduce_model: Optional[str] = None,
+                 cache_dir: Optional[str] = None, max_concurrency: Optional[int] = None):
+        if client is None or map_model is None or reduce_model is None:
+            from app.assistant.config.non_ai import config
+            from app.llm.client import get_openai_client
+            client = client or get_openai_client()
+            map_model = map_model or config.MODELS["fast"]
+            reduce_model = reduce_model or config.MODELS["large"]
+        self.client = client
+        self.map_model = map_model
+        self.reduce_model = reduce_model
+        self.cache_dir = Path(cache_dir or os.getenv("GITHUB_SUMMARY_CACHE_DIR", "cache/summaries"))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_concurrency = max_concurrency or int(os.getenv("GITHUB_SUMMARY_CONCURRENCY", "4"))
+        self.group_chars = int(os.getenv("GITHUB_SUMMARY_GROUP_CHARS", "12000"))
+        self.group_files = int(os.getenv("GITHUB_SUMMARY_GROUP_FILES", "200"))
+        self.keep = int(os.getenv("GITHUB_SUMMARY_CACHE_KEEP", "2000"))
+
+    def summarize(self, repo: str, files: dict, read: Callable[[str], str]) -> dict:
+        """Summary of repo from {path: blob_sha}; read(path) returns a file's text.
+        Returns {"summary", "groups", "cached_groups", "failed_groups", "seconds"}"""
+        started = time.perf_counter()
+        groups = group_files(files, self.group_files)
+        keys = {
+            group: _hash("map", self.map_model, MAP_PROMPT, repo, group, [(p, files[p]) for p in members])
+            for group, members in groups.items()
+        }
+        summaries = {group: self._cached(key) for group, key in keys.items()}
+        todo = [group for group, summary in summaries.items() if summary is None]
+
+        failed = {}
+        if todo:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="repo-summary") as pool:
+                futures = {pool.submit(self._map, repo, group, groups[group], read): group for group in todo}
+                for future in as_completed(futures):
+                    group = futures[future]
+                    try:
+                        summaries[group] = future.result()
+                    except Exception as e:  # A rate limit or timeout costs one group, not the summary
+                        logger.warning(f"Could not summarize {repo} {group}: {e}")
+                        failed[group] = e
+                        continue
+                    self._store(keys[group], summaries[group])
+        if failed and len(failed) == len(groups):
+            raise next(iter(failed.values()))
+
+        reduce_key = _hash("reduce", self.reduce_model, REDUCE_PROMPT, repo, sorted(keys.values()))
+        summary = None if failed else self._cached(reduce_key)
+        if summary is None:
+            summary = self._reduce(repo, {group: text for group, text in summaries.items() if text is not None})
+            if not failed:
+                self._store(reduce_key, summary)
+        if todo:
+            self._prune()
+
+        stats = {
+            "groups": len(groups),
+            "cached_groups": len(groups) - len(todo),
+            "failed_groups": len(failed),
+            "seconds": round(time.perf_counter() - started, 2),
+        }
+        logger.info(f"Summarized {repo}: {stats}")
+        return {"summary": summary, **stats}
+
+    def _excerpts(self, members: list, read: Callable[[str], str]) -> str:
+        per_file = max(800, self.group_chars // max(1, len(members)))
+        parts, used = [], 0
+        for path in sorted(members, key=_excerpt_order):
+            if used >= self.group_chars:
+                break
+            text = (read(path) or "")[:min(per_file, self.group_chars - used)]
+            if text.strip():
+                parts.append(f"--- {path}\n{text}")
+                used += len(text)
+        return "\n\n".join(parts)
+
+    def _map(self, repo: str, group: str, members: list, read: Callable[[str], str]) -> str:
+        response = self.client.chat.completions.create(
+            model=self.map_model,
+            messages=[
+                {"role": "system", "content": MAP_PROMPT.format(repo=repo, group=group)},
+                {"role": "user", "content": self._excerpts(members, read)},
+            ],
+            temperature=0.2
+        )
+        return response.choices[0].message.content.strip()
+
+    def _reduce(self, repo: str, summaries: dict) -> str:
+        parts = "\n\n".join(f"## {group}\n{summary}" for group, summary in summaries.items())
+        response = self.client.chat.completions.create(
+            model=self.reduce_model,
+            messages=[
+                {"role": "system", "content": REDUCE_PROMPT.format(repo=repo)},
+                {"role": "user", "content": parts},
+            ],
+            temperature=0.3
+        )
+        return response.choices[0].message.content.strip()
+
+    def _cached(self, key: str) -> Optional[str]:
+        path = self.cache_dir / f"{key}.json"
+        try:
+            summary = json.loads(path.read_text(encoding="utf-8"))["summary"]
+            os.utime(path)  # Recently used: pruned last
+            return summary
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _store(self, key: str, summary: str):
+        try:
+            (self.cache_dir / f"{key}.json").write_text(json.dumps({"summary": summary}), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not cache summary {key}: {e}")
+
+    def _prune(self):
+        """Keep only the most recently used summaries"""
+        try:
+            cached = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        except OSError:
+            return  # A file removed by another process mid-scan; prune next time
+        for stale in cached[self.keep:]:
+            stale.unlink(missing_ok=True)
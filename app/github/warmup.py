@@ -0,0 +1,116 @@
+# ------------------------------------------------------------------------------
+# Script: warmup.py
+# Purpose: Analyze every repository in GITHUB_REPOS in the background once the
+#          server is up, so "AI Summary" clicks are answered from RepoCache.
+#
+# Notes:
+#   - A small thread pool (GITHUB_WARMUP_WORKERS) runs RepoAnalyzer.analyze;
+#     the work is network and API bound, so threads are enough
+#   - Before each repo the worker waits out GitHub's rate limit when fewer than
+#     GITHUB_WARMUP_MIN_REMAINING requests are left (from response headers)
+#   - A click on a repo that is still warming joins its analysis (SingleFlight)
+#   - GITHUB_WARMUP_INTERVAL > 0 repeats the pass, keeping the cache fresh
+#     past GITHUB_CACHE_TTL
+# ------------------------------------------------------------------------------
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def repo_urls_from_env() -> list:
+    """GITHUB_REPOS as canonical https://github.com/owner/repo URLs (the RepoCache keys the UI uses)"""
+    urls = []
+    for url in os.getenv("GITHUB_REPOS", "").split(","):
+        if url.strip():
+            urls.append(f"https://github.com/{url.strip().split('github.com/')[-1].strip('/')}")
+    return urls
+
+
+class RepoWarmer:
+    """Background pre-analysis of a list of repositories with per-repo progress"""
+
+    def __init__(self, analyzer_factory: Callable, repo_urls: Optional[list] = None,
+                 max_workers: Optional[int] = None, min_remaining: Optional[int] = None,
+                 interval: Optional[float] = None):
+        self.analyzer_factory = analyzer_factory  # Called on the worker thread, not at startup
+        self.repo_urls = repo_urls if repo_urls is not None else repo_urls_from_env()
+        self.max_workers = max_workers or int(os.getenv("GITHUB_WARMUP_WORKERS", "2"))
+        self.min_remaining = min_remaining if min_remaining is not None else int(os.getenv("GITHUB_WARMUP_MIN_REMAINING", "50"))
+        self.interval = interval if interval is not None else float(os.getenv("GITHUB_WARMUP_INTERVAL", "0"))
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.passes = 0
+        self.repos = {url: {"state": "pending"} for url in self.repo_urls}
+
+    def start(self) -> "RepoWarmer":
+        if self._thread is None and self.repo_urls:
+            self._thread = threading.Thread(target=self._run, name="repo-warmup", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            analyzer = self.analyzer_factory()
+        except Exception as e:
+            logger.error(f"Repo warm-up could not start: {e}")
+            return
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="repo-warmup") as pool:
+                list(pool.map(lambda url: self._warm(analyzer, url), self.repo_urls))
+            self.passes += 1
+            logger.info(f"Repo warm-up pass {self.passes} done in {time.perf_counter() - started:.1f}s: {self.progress()['counts']}")
+            if self.interval <= 0 or self._stop.wait(self.interval):
+                break
+
+    def _warm(self, analyzer, url: str):
+        if self._stop.is_set():
+            return
+        self._wait_for_rate_limit(analyzer, url)
+        self._update(url, state="running", started_at=time.time())
+        started = time.perf_counter()
+        try:
+            result = analyzer.analyze(url)
+            # analyze() reports failures in the result rather than raising
+            error = result.get("error")
+        except Exception as e:
+            error = str(e)
+        seconds = round(time.perf_counter() - started, 2)
+        if error:
+            logger.warning(f"Warm-up of {url} failed after {seconds}s: {error}")
+            self._update(url, state="failed", seconds=seconds, error=error)
+        else:
+            self._update(url, state="done", seconds=seconds, error=None)
+
+    def _wait_for_rate_limit(self, analyzer, url: str):
+        source = getattr(analyzer, "source", None)
+        wait = source.rate_limit_wait(self.min_remaining) if source is not None else 0
+        if wait > 0:
+            logger.info(f"GitHub rate limit nearly used up; warm-up of {url} waits {wait:.0f}s")
+            self._update(url, state="rate_limited")
+            self._stop.wait(wait)
+
+    def _update(self, url: str, **fields):
+        with self._lock:
+            self.repos[url] = {**self.repos.get(url, {}), **fields}
+
+    def progress(self) -> dict:
+        with self._lock:
+            repos = {url: dict(status) for url, status in self.repos.items()}
+        counts = {}
+        for status in repos.values():
+            counts[status["state"]] = counts.get(status["state"], 0) + 1
+        return {"total": len(repos), "passes": self.passes, "counts": counts, "repos": repos}
@@ -0,0 +1,3 @@
+from .singleflight import SingleFlight, AsyncSingleFlight
+
+__all__ = ["SingleFlight", "AsyncSingleFlight"]
@@ -0,0 +1,312 @@
+# ------------------------------------------------------------------------------
+# Script: client.py
+# Purpose: Single place that builds OpenAI clients, so every component can be
+#          pointed at another OpenAI-compatible endpoint (e.g. the local fake
+#          server) through OPENAI_BASE_URL, and so the whole process shares one
+#          tuned, warmed HTTP connection pool.
+#
+# Notes:
+#   - get_openai_client() / get_async_openai_client() return process-wide
+#     singletons; the assistant, repo chat manager and llama_index all use them
+#   - Pool limits come from OPENAI_POOL_* env vars; HTTP/2 is used when the
+#     optional h2 package is installed (pip install "httpx[http2]")
+#   - Pool metrics are kept by a wrapping transport, not event hooks: hooks
+#     never see requests that fail before a response, and see streamed
+#     responses end at their headers
+#   - The async pool belongs to the event loop that first uses it (Gradio's),
+#     so llama_index, which runs async calls on loops of its own, only gets
+#     the sync pool
+# ------------------------------------------------------------------------------
+import importlib.util
+import logging
+import os
+import threading
+import time
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.RLock()  # factories nest (OpenAI client -> HTTP pool)
+_clients = {}
+_warmed = set()
+
+
+def base_url():
+    """OpenAI-compatible endpoint to use, or None for the public API"""
+    return os.getenv("OPENAI_BASE_URL") or None
+
+
+def api_key():
+    # Local stand-ins don't check the key, but the SDK insists on one
+    return os.getenv("OPENAI_API_KEY") or ("sk-local" if base_url() else None)
+
+
+def http2_enabled() -> bool:
+    if os.getenv("OPENAI_HTTP2", "true").lower() != "true":
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+def pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=int(os.getenv("OPENAI_POOL_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("OPENAI_POOL_MAX_KEEPALIVE", "20")),
+        keepalive_expiry=float(os.getenv("OPENAI_POOL_KEEPALIVE_EXPIRY", "120")),
+    )
+
+
+def pool_timeout() -> httpx.Timeout:
+    # Long read timeout for slow generations, short connect/pool waits
+    return httpx.Timeout(
+        float(os.getenv("OPENAI_TIMEOUT", "120")),
+        connect=float(os.getenv("OPENAI_CONNECT_TIMEOUT", "10")),
+        pool=float(os.getenv("OPENAI_POOL_TIMEOUT", "30")),
+    )
+
+
+class PoolMetrics:
+    """Request counters kept by the metered transports below"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.errors = 0
+
+    def started(self):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+
+    def finished(self, failed: bool):
+        with self._lock:
+            self.in_flight -= 1
+            if failed:
+                self.errors += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"requests": self.requests, "in_flight": self.in_flight, "errors": self.errors}
+
+
+class _MeteredStream(httpx.SyncByteStream):
+    """Response body that ends its request's in-flight count when closed, so
+    streamed responses count until their last byte, not their headers"""
+
+    def __init__(self, stream, metrics: PoolMetrics, failed: bool):
+        self._stream = stream
+        self._metrics = metrics
+        self._failed = failed
+        self._closed = False
+
+    def __iter__(self):
+        try:
+            yield from self._stream
+        except Exception:
+            self._failed = True
+            raise
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._stream.close()
+        finally:
+            self._metrics.finished(self._failed)
+
+
+class _AsyncMeteredStream(httpx.AsyncByteStream):
+    def __init__(self, stream, metrics: PoolMetrics, failed: bool):
+        self._stream = stream
+        self._metrics = metrics
+        self._failed = failed
+        self._closed = False
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except Exception:
+            self._failed = True
+            raise
+
+    async def aclose(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._stream.aclose()
+        finally:
+            self._metrics.finished(self._failed)
+
+
+class MeteredTransport(httpx.BaseTransport):
+    """Wraps a transport and counts its requests, including ones that never
+    get a response (connect errors, timeouts), which httpx event hooks miss"""
+
+    def __init__(self, transport: httpx.BaseTransport, metrics: PoolMetrics):
+        self.transport = transport
+        self.metrics = metrics
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.metrics.started()
+        try:
+            response = self.transport.handle_request(request)
+        except Exception:
+            self.metrics.finished(failed=True)
+            raise
+        failed = response.status_code >= 400
+        if response.is_closed:  # Body already read (a response built in memory)
+            self.metrics.finished(failed)
+        else:
+            response.stream = _MeteredStream(response.stream, self.metrics, failed)
+        return response
+
+    def close(self):
+        self.transport.close()
+
+
+class AsyncMeteredTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: PoolMetrics):
+        self.transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.metrics.started()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            self.metrics.finished(failed=True)
+            raise
+        failed = response.status_code >= 400
+        if response.is_closed:  # Body already read (a response built in memory)
+            self.metrics.finished(failed)
+        else:
+            response.stream = _AsyncMeteredStream(response.stream, self.metrics, failed)
+        return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def _shared(name, factory):
+    with _lock:
+        if name not in _clients:
+            _clients[name] = factory()
+        return _clients[name]
+
+
+def _build_http_client(asynchronous: bool):
+    metrics = PoolMetrics()
+    # Limits and HTTP/2 belong to the transport once one is passed in
+    pool = {"limits": pool_limits(), "http2": http2_enabled()}
+    options = {"timeout": pool_timeout(), "follow_redirects": True}
+    if asynchronous:
+        transport = AsyncMeteredTransport(httpx.AsyncHTTPTransport(**pool), metrics)
+        http_client = httpx.AsyncClient(transport=transport, **options)
+    else:
+        transport = MeteredTransport(httpx.HTTPTransport(**pool), metrics)
+        http_client = httpx.Client(transport=transport, **options)
+    logger.info(f"Created shared {'async ' if asynchronous else ''}HTTP pool (http2={pool['http2']})")
+    return http_client, metrics
+
+
+def get_http_client() -> httpx.Client:
+    return _shared("http", lambda: _build_http_client(False))[0]
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    return _shared("async_http", lambda: _build_http_client(True))[0]
+
+
+def get_openai_client() -> OpenAI:
+    """Process-wide OpenAI client on the shared pool"""
+    return _shared("openai", lambda: OpenAI(api_key=api_key(), base_url=base_url(), http_client=get_http_client()))
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """Process-wide AsyncOpenAI client on the shared async pool"""
+    return _shared(
+        "async_openai",
+        lambda: AsyncOpenAI(api_key=api_key(), base_url=base_url(), http_client=get_async_http_client()),
+    )
+
+
+def warm_up() -> bool:
+    """Open a pooled connection (DNS, TCP, TLS) before the first user request"""
+    if "openai" in _warmed:
+        return True
+    start = time.perf_counter()
+    try:
+        get_openai_client().models.list()
+    except Exception as e:
+        logger.warning(f"OpenAI pool warm-up failed: {e}")
+        return False
+    _warmed.add("openai")
+    logger.info(f"OpenAI pool warmed in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return True
+
+
+async def async_warm_up() -> bool:
+    """warm_up() for the async pool; call it from the serving event loop"""
+    if "async_openai" in _warmed:
+        return True
+    start = time.perf_counter()
+    try:
+        await get_async_openai_client().models.list()
+    except Exception as e:
+        logger.warning(f"Async OpenAI pool warm-up failed: {e}")
+        return False
+    _warmed.add("async_openai")
+    logger.info(f"Async OpenAI pool warmed in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return True
+
+
+def warm_up_in_background():
+    threading.Thread(target=warm_up, name="openai-warmup", daemon=True).start()
+
+
+def _connection_counts(http_client) -> dict:
+    # httpcore keeps the pool behind private attributes; report what is visible
+    transport = getattr(http_client, "_transport", None)
+    pool = getattr(getattr(transport, "transport", transport), "_pool", None)  # Under MeteredTransport
+    connections = list(getattr(pool, "connections", []))
+    return {
+        "connections": len(connections),
+        "idle": sum(1 for c in connections if c.is_idle()),
+        "http2": sum(1 for c in connections if "HTTP/2" in repr(c)),
+    }
+
+
+def stats() -> dict:
+    """Pool usage of the shared clients created so far"""
+    with _lock:
+        pools = {name: _clients[name] for name in ("http", "async_http") if name in _clients}
+    result = {}
+    for name, (http_client, metrics) in pools.items():
+        result[name] = {**metrics.snapshot(), **_connection_counts(http_client)}
+    return result
+
+
+def configure_llama_index():
+    """Point llama_index's default LLM and embedding model at base_url() and the shared sync pool"""
+    from llama_index.core import Settings
+    from llama_index.embeddings.openai import OpenAIEmbedding
+    from llama_index.llms.openai import OpenAI as LlamaOpenAI
+
+    # No async_http_client: llama_index runs async work in loops of its own
+    # (asyncio.run in run_transformations), and an httpx.AsyncClient's pooled
+    # connections belong to the loop that opened them. Without reuse_client,
+    # each async call gets a fresh AsyncOpenAI on its own loop, while sync
+    # calls still wrap the one shared httpx.Client.
+    shared = {
+        "api_key": api_key(),
+        "api_base": base_url(),
+        "http_client": get_http_client(),
+        "reuse_client": False,
+    }
+    Settings.llm = LlamaOpenAI(**shared)
+    Settings.embed_model = OpenAIEmbedding(**shared)
@@ -0,0 +1,361 @@
+# ------------------------------------------------------------------------------
+# Script: fake_server.py
+# Purpose: Local stand-in for the OpenAI API so load and latency work can run
+#          offline and for free. Implements /v1/chat/completions (including
+#          streaming and tool calls), /v1/embeddings and /v1/models.
+#
+# How to Run:
+#   python -m app.llm.fake_server --port 8088 --latency lognormal:-1.5,0.5 --tps 40
+#   export OPENAI_BASE_URL=http://127.0.0.1:8088/v1
+#
+# Latency distributions (time to first token / full response):
+#   fixed:0.2 | uniform:0.1,0.6 | normal:0.3,0.1 | lognormal:-1.5,0.5
+#
+# Notes:
+#   - Responses are deterministic for a given prompt (seeded from its hash)
+#   - Tool calls are made when the prompt looks like contact details or when
+#     --tool-call-rate fires; arguments are filled from the tool's JSON schema
+#   - --error-rate injects failures using the statuses in --error-statuses
+# ------------------------------------------------------------------------------
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+FILLER = (
+    "Girma has delivered Power Platform, SharePoint and AI projects across cloud "
+    "environments, automating business processes and deploying assistants on Kubernetes "
+    "with GitOps, observability and secure delivery pipelines."
+).split()
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+
+
+@dataclass
+class FakeServerConfig:
+    latency: str = "fixed:0.05"
+    tokens_per_second: float = 0.0  # 0 streams as fast as possible
+    response_tokens: int = 60
+    error_rate: float = 0.0
+    error_statuses: list = field(default_factory=lambda: [429, 500])
+    tool_call_rate: float = 0.0
+    embedding_dimensions: int = 1536
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            latency=os.getenv("FAKE_OPENAI_LATENCY", cls.latency),
+            tokens_per_second=float(os.getenv("FAKE_OPENAI_TPS", cls.tokens_per_second)),
+            response_tokens=int(os.getenv("FAKE_OPENAI_RESPONSE_TOKENS", cls.response_tokens)),
+            error_rate=float(os.getenv("FAKE_OPENAI_ERROR_RATE", cls.error_rate)),
+            error_statuses=[int(s) for s in os.getenv("FAKE_OPENAI_ERROR_STATUSES", "429,500").split(",")],
+            tool_call_rate=float(os.getenv("FAKE_OPENAI_TOOL_CALL_RATE", cls.tool_call_rate)),
+            embedding_dimensions=int(os.getenv("FAKE_OPENAI_EMBEDDING_DIMENSIONS", cls.embedding_dimensions)),
+        )
+
+
+def sample_latency(spec: str, rng: random.Random) -> float:
+    """Draw a latency in seconds from a 'kind:params' distribution spec"""
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(",") if v]
+    if kind == "fixed":
+        return values[0]
+    if kind == "uniform":
+        return rng.uniform(values[0], values[1])
+    if kind == "normal":
+        return max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return rng.lognormvariate(values[0], values[1])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_config = FakeServerConfig()
+    stats = {"requests": 0, "errors": 0, "tool_calls": 0}
+    stats_lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    # ============ Routing ============
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [
+                {"id": model, "object": "model", "owned_by": "fake"}
+                for model in ("gpt-4", "gpt-4o-mini", "gpt-3.5-turbo", "text-embedding-ada-002")
+            ]})
+        elif self.path.rstrip("/").endswith("/stats"):
+            with self.stats_lock:
+                self._send_json(200, dict(self.stats))
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        rng = random.Random()
+        with self.stats_lock:
+            self.stats["requests"] += 1
+
+        if rng.random() < self.server_config.error_rate:
+            with self.stats_lock:
+                self.stats["errors"] += 1
+            status = rng.choice(self.server_config.error_statuses)
+            self._send_json(status, {"error": {"message": "Injected failure", "type": "fake_error"}})
+            return
+
+        path = self.path.rstrip("/")
+        if path.endswith("/chat/completions"):
+            self._chat_completions(body, rng)
+        elif path.endswith("/embeddings"):
+            time.sleep(sample_latency(self.server_config.latency, rng))
+            self._embeddings(body)
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    # ============ Chat completions ============
+    def _chat_completions(self, body, rng):
+        messages = body.get("messages", [])
+        model = body.get("model", "gpt-4")
+        prompt = "\n".join(str(m.get("content") or "") for m in messages)
+        seed = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+
+        tool_call = self._maybe_tool_call(body, messages, rng)
+        words = self._response_words(seed, body.get("max_tokens"))
+        prompt_tokens = max(1, len(prompt) // 4)
+
+        time.sleep(sample_latency(self.server_config.latency, rng))
+        if body.get("stream"):
+            self._stream_chat(model, words, tool_call, prompt_tokens, body)
+            return
+
+        # Non-streaming callers still pay the generation time
+        time.sleep(self._generation_time(len(words)))
+        message = {"role": "assistant", "content": None if tool_call else " ".join(words)}
+        if tool_call:
+            message["tool_calls"] = [tool_call]
+        self._send_json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if tool_call else "stop",
+            }],
+            "usage": self._usage(prompt_tokens, 0 if tool_call else len(words)),
+        })
+
+    def _stream_chat(self, model, words, tool_call, prompt_tokens, body):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+        def send(choices, usage=None):
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": choices,
+            }
+            if usage is not None:
+                payload["usage"] = usage
+            self._write_chunk(f"data: {json.dumps(payload)}\n\n")
+
+        def chunk(delta, finish_reason=None):
+            send([{"index": 0, "delta": delta, "finish_reason": finish_reason}])
+
+        chunk({"role": "assistant", "content": ""})
+        if tool_call:
+            arguments = tool_call["function"]["arguments"]
+            half = len(arguments) // 2
+            # Split the call across two fragments like the real API does
+            chunk({"tool_calls": [{
+                "index": 0, "id": tool_call["id"], "type": "function",
+                "function": {"name": tool_call["function"]["name"], "arguments": arguments[:half]},
+            }]})
+            chunk({"tool_calls": [{"index": 0, "function": {"arguments": arguments[half:]}}]})
+            chunk({}, finish_reason="tool_calls")
+        else:
+            delay = self._generation_time(1)
+            for i, word in enumerate(words):
+                chunk({"content": word if i == 0 else f" {word}"})
+                if delay:
+                    time.sleep(delay)
+            chunk({}, finish_reason="stop")
+
+        if (body.get("stream_options") or {}).get("include_usage"):
+            send([], usage=self._usage(prompt_tokens, 0 if tool_call else len(words)))
+        self._write_chunk("data: [DONE]\n\n")
+        self._write_chunk("")
+
+    def _maybe_tool_call(self, body, messages, rng):
+        tools = body.get("tools") or []
+        if not tools or not messages or messages[-1].get("role") != "user":
+            return None
+
+        question = str(messages[-1].get("content") or "")
+        names = {t["function"]["name"]: t["function"] for t in tools}
+        if EMAIL_PATTERN.search(question) and "record_user_details" in names:
+            function = names["record_user_details"]
+        elif rng.random() < self.server_config.tool_call_rate:
+            function = rng.choice(list(names.values()))
+        else:
+            return None
+
+        with self.stats_lock:
+            self.stats["tool_calls"] += 1
+        return {
+            "id": f"call_{uuid.uuid4().hex[:24]}",
+            "type": "function",
+            "function": {
+                "name": function["name"],
+                "arguments": json.dumps(self._fill_arguments(function.get("parameters", {}), question)),
+            },
+        }
+
+    @staticmethod
+    def _fill_arguments(schema, question):
+        arguments = {}
+        for name, spec in (schema.get("properties") or {}).items():
+            if name not in schema.get("required", []) and name != "name":
+                continue
+            if "enum" in spec:
+                arguments[name] = spec["enum"][0]
+            elif name == "email":
+                match = EMAIL_PATTERN.search(question)
+                arguments[name] = match.group(0) if match else "visitor@example.com"
+            elif name in ("question", "issue", "prompt"):
+                arguments[name] = question
+            else:
+                arguments[name] = "Load Test"
+        return arguments
+
+    def _response_words(self, seed, max_tokens):
+        rng = random.Random(seed)
+        count = self.server_config.response_tokens
+        if max_tokens:
+            count = min(count, int(max_tokens))
+        return [rng.choice(FILLER) for _ in range(max(1, count))]
+
+    def _generation_time(self, tokens):
+        tps = self.server_config.tokens_per_second
+        return tokens / tps if tps > 0 else 0.0
+
+    @staticmethod
+    def _usage(prompt_tokens, completion_tokens):
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    # ============ Embeddings ============
+    def _embeddings(self, body):
+        inputs = body.get("input", [])
+        if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+            inputs = [inputs]
+        dimensions = int(body.get("dimensions") or self.server_config.embedding_dimensions)
+        data = [
+            {"object": "embedding", "index": i, "embedding": self._embed(str(text), dimensions)}
+            for i, text in enumerate(inputs)
+        ]
+        tokens = sum(max(1, len(str(text)) // 4) for text in inputs)
+        self._send_json(200, {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "text-embedding-ada-002"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        })
+
+    @staticmethod
+    def _embed(text, dimensions):
+        """Deterministic unit vector seeded from the text"""
+        rng = random.Random(hashlib.sha256(text.encode("utf-8")).digest())
+        vector = [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    # ============ Transport ============
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+def create_server(host="127.0.0.1", port=8088, server_config=None):
+    """Build a server bound to host:port; port 0 picks a free port"""
+    handler = type("ConfiguredFakeOpenAIHandler", (FakeOpenAIHandler,), {
+        "server_config": server_config or FakeServerConfig.from_env(),
+        "stats": {"requests": 0, "errors": 0, "tool_calls": 0},
+        "stats_lock": threading.Lock(),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    defaults = FakeServerConfig.from_env()
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--latency", default=defaults.latency, help="e.g. fixed:0.2, lognormal:-1.5,0.5")
+    parser.add_argument("--tps", type=float, default=defaults.tokens_per_second, help="Streamed tokens per second (0 = unthrottled)")
+    parser.add_argument("--response-tokens", type=int, default=defaults.response_tokens)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--error-statuses", default=",".join(map(str, defaults.error_statuses)))
+    parser.add_argument("--tool-call-rate", type=float, default=defaults.tool_call_rate)
+    parser.add_argument("--embedding-dimensions", type=int, default=defaults.embedding_dimensions)
+    args = parser.parse_args()
+
+    server_config = FakeServerConfig(
+        latency=args.latency,
+        tokens_per_second=args.tps,
+        response_tokens=args.response_tokens,
+        error_rate=args.error_rate,
+        error_statuses=[int(s) for s in args.error_statuses.split(",")],
+        tool_call_rate=args.tool_call_rate,
+        embedding_dimensions=args.embedding_dimensions,
+    )
+    sample_latency(server_config.latency, random.Random())  # Fail fast on a bad spec
+
+    logging.basicConfig(level=logging.INFO)
+    server = create_server(args.host, args.port, server_config)
+    logger.info(f"Fake OpenAI server on http://{args.host}:{server.server_port}/v1 ({server_config})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
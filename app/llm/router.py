@@ -0,0 +1,149 @@
+# ------------------------------------------------------------------------------
+# Script: router.py
+# Purpose: Route each query to a fast/cheap model or the large model based on
+#          its complexity, and record decisions and latency per route.
+#
+# Notes:
+#   - Cheap heuristics decide most queries without any model call
+#   - Ambiguous queries can optionally be classified by a tiny model;
+#     without one they go to the large model (never degrade hard answers)
+# ------------------------------------------------------------------------------
+import logging
+import re
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Contact and fact lookups that a small model answers as well as a large one.
+# Kept narrow on purpose: words like "role", "current", "when" or "years"
+# appear in most questions about the candidate's experience, which need the
+# large model
+LOOKUP_TERMS = re.compile(
+    r"\b(email|e-mail|phone|contact details|contact info\w*|linkedin|github|website|blog|"
+    r"location|located|based in|relocate|degree|university|certifications?)\b"
+)
+
+# Anything asking for reasoning, synthesis or generation goes to the large model
+COMPLEX_TERMS = re.compile(
+    r"\b(why|explain|compare|comparison|difference|design|architect\w*|trade-?offs?|"
+    r"walk me through|how would|how does|how did|approach|strategy|evaluate|assess|"
+    r"recommend|suitable|fit for|strengths?|weakness\w*|pros|cons|write|code|debug|"
+    r"optimi[sz]e|migrat\w*|scenario|example of)\b"
+)
+
+CLASSIFIER_PROMPT = (
+    "Classify the user's question about a candidate's resume. Answer SIMPLE if it is a "
+    "single factual lookup (contact details, dates, titles, a yes/no fact). Answer COMPLEX "
+    "if it needs reasoning, comparison, explanation or writing. Reply with one word."
+)
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    route: str  # "fast" or "large"
+    model: str
+    reason: str
+
+
+class ModelRouter:
+    def __init__(self, fast_model: str, large_model: str, classifier_model: Optional[str] = None,
+                 enabled: bool = True, max_fast_words: int = 12):
+        self.fast_model = fast_model
+        self.large_model = large_model
+        self.classifier_model = classifier_model
+        self.enabled = enabled
+        self.max_fast_words = max_fast_words
+        self._lock = threading.Lock()
+        self._reasons = Counter()
+        # Recent samples only, so memory stays flat in long-running pods
+        self._latency = {"fast": deque(maxlen=1000), "large": deque(maxlen=1000)}
+        self._first_token = {"fast": deque(maxlen=1000), "large": deque(maxlen=1000)}
+
+    @classmethod
+    def from_config(cls, models: dict):
+        return cls(
+            fast_model=models["fast"],
+            large_model=models["large"],
+            classifier_model=models.get("classifier"),
+            enabled=models.get("routing", False),
+        )
+
+    def fast(self, reason: str) -> RouteDecision:
+        return RouteDecision("fast", self.fast_model, reason)
+
+    def large(self, reason: str) -> RouteDecision:
+        return RouteDecision("large", self.large_model, reason)
+
+    def heuristic_route(self, query: str) -> Optional[RouteDecision]:
+        """Decide from the text alone; None means the query is ambiguous"""
+        if not self.enabled:
+            return self.large("routing disabled")
+        text = query.lower()
+        if COMPLEX_TERMS.search(text):
+            return self.large("complex wording")
+        if len(text.split()) > self.max_fast_words:
+            return self.large("long query")
+        if LOOKUP_TERMS.search(text):
+            return self.fast("factual lookup")
+        return None
+
+    def classifier_request(self, query: str) -> dict:
+        """Keyword arguments for a chat.completions.create classification call"""
+        return {
+            "model": self.classifier_model,
+            "messages": [
+                {"role": "system", "content": CLASSIFIER_PROMPT},
+                {"role": "user", "content": query},
+            ],
+            "max_tokens": 2,
+            "temperature": 0,
+        }
+
+    def from_classifier(self, label: str) -> RouteDecision:
+        if label and label.strip().upper().startswith("SIMPLE"):
+            return self.fast("classifier: simple")
+        return self.large("classifier: complex")
+
+    def route(self, query: str, client=None) -> RouteDecision:
+        """Heuristics first, then the tiny classifier model when configured"""
+        decision = self.heuristic_route(query)
+        if decision is None and self.classifier_model and client is not None:
+            try:
+                response = client.chat.completions.create(**self.classifier_request(query))
+                decision = self.from_classifier(response.choices[0].message.content)
+            except Exception as e:
+                logger.warning(f"Route classifier failed, using large model: {e}")
+        return self.decided(decision or self.large("ambiguous"))
+
+    def decided(self, decision: RouteDecision) -> RouteDecision:
+        with self._lock:
+            self._reasons[(decision.route, decision.reason)] += 1
+        logger.info(f"Routed query to {decision.model} ({decision.reason})")
+        return decision
+
+    def record(self, decision: RouteDecision, latency: float, first_token: Optional[float] = None):
+        with self._lock:
+            self._latency[decision.route].append(latency)
+            if first_token is not None:
+                self._first_token[decision.route].append(first_token)
+
+    def stats(self) -> dict:
+        def summary(values):
+            if not values:
+                return {"count": 0}
+            ordered = sorted(values)
+            return {
+                "count": len(ordered),
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+            }
+
+        with self._lock:
+            return {
+                "decisions": {f"{route}: {reason}": n for (route, reason), n in self._reasons.items()},
+                "latency": {route: summary(v) for route, v in self._latency.items()},
+                "first_token": {route: summary(v) for route, v in self._first_token.items()},
+            }
@@ -0,0 +1,194 @@
+# ------------------------------------------------------------------------------
+# Script: singleflight.py
+# Purpose: Coalesce identical in-flight requests so concurrent callers share
+#          one upstream call (or one upstream stream) and receive its result.
+#
+# Notes:
+#   - SingleFlight is for threaded callers, AsyncSingleFlight for asyncio
+#   - Streams are driven by a producer independent of any single consumer,
+#     so a waiter disconnecting never stalls the others; late joiners get a
+#     replay of the deltas produced so far
+# ------------------------------------------------------------------------------
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _StreamFlight:
+    def __init__(self, condition):
+        self.items = []
+        self.finished = False
+        self.error = None
+        self.condition = condition
+
+
+class _Stats:
+    def __init__(self):
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def record(self, key, leader: bool):
+        self.calls += 1
+        if leader:
+            self.executions += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"Coalesced request onto in-flight call {key[:16]}")
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
+
+
+class SingleFlight(_Stats):
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._streams = {}
+
+    def do(self, key: str, fn):
+        """Run fn() once per key at a time; concurrent callers share its outcome"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            self.record(key, leader)
+
+        if not leader:
+            flight.done.wait()
+        else:
+            try:
+                flight.result = fn()
+            except Exception as e:
+                flight.error = e
+            finally:
+                with self._lock:
+                    self._flights.pop(key, None)
+                flight.done.set()
+
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def stream(self, key: str, factory):
+        """Return a generator over the shared stream produced by factory()"""
+        with self._lock:
+            flight = self._streams.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._streams[key] = _StreamFlight(threading.Condition())
+            self.record(key, leader)
+
+        if leader:
+            threading.Thread(
+                target=self._produce, args=(key, flight, factory), daemon=True
+            ).start()
+        return self._consume(flight)
+
+    def _produce(self, key, flight, factory):
+        try:
+            for item in factory():
+                with flight.condition:
+                    flight.items.append(item)
+                    flight.condition.notify_all()
+        except Exception as e:
+            flight.error = e
+        finally:
+            with self._lock:
+                self._streams.pop(key, None)
+            with flight.condition:
+                flight.finished = True
+                flight.condition.notify_all()
+
+    @staticmethod
+    def _consume(flight):
+        position = 0
+        while True:
+            with flight.condition:
+                flight.condition.wait_for(lambda: position < len(flight.items) or flight.finished)
+                if position < len(flight.items):
+                    item = flight.items[position]
+                elif flight.error is not None:
+                    raise flight.error
+                else:
+                    return
+            position += 1
+            yield item
+
+
+class AsyncSingleFlight(_Stats):
+    def __init__(self):
+        super().__init__()
+        self._tasks = {}
+        self._streams = {}
+
+    async def do(self, key: str, fn):
+        """Await fn() once per key at a time; concurrent callers share its outcome"""
+        task = self._tasks.get(key)
+        leader = task is None
+        if leader:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._forget(self._tasks, key, t))
+        self.record(key, leader)
+        # shield() so one cancelled waiter doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    def stream(self, key: str, factory):
+        """Return an async generator over the shared stream produced by factory()"""
+        flight = self._streams.get(key)
+        leader = flight is None
+        if leader:
+            flight = self._streams[key] = _StreamFlight(asyncio.Condition())
+            task = asyncio.ensure_future(self._produce(flight, factory))
+            task.add_done_callback(lambda t: self._forget(self._streams, key, flight))
+        self.record(key, leader)
+        return self._consume(flight)
+
+    @staticmethod
+    def _forget(registry, key, value):
+        if registry.get(key) is value:
+            del registry[key]
+
+    @staticmethod
+    async def _produce(flight, factory):
+        try:
+            async for item in factory():
+                async with flight.condition:
+                    flight.items.append(item)
+                    flight.condition.notify_all()
+        except Exception as e:
+            flight.error = e
+        finally:
+            async with flight.condition:
+                flight.finished = True
+                flight.condition.notify_all()
+
+    @staticmethod
+    async def _consume(flight):
+        position = 0
+        while True:
+            async with flight.condition:
+                await flight.condition.wait_for(lambda: position < len(flight.items) or flight.finished)
+                if position < len(flight.items):
+                    item = flight.items[position]
+                elif flight.error is not None:
+                    raise flight.error
+                else:
+                    return
+            position += 1
+            yield item
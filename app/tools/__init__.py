@@ -5,3 +5,8 @@
 from app.tools.notify_user import record_user_details
 from app.tools.log_unknown import record_unknown_query
 
+# Tool name -> implementation, used to build the executor registry
+TOOL_FUNCTIONS = {
+    "record_user_details": record_user_details,
+    "record_unknown_query": record_unknown_query,
+}
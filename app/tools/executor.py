@@ -0,0 +1,101 @@
+# ------------------------------------------------------------------------
+# Purpose: Execute the tool calls of one model turn concurrently, each
+#          bounded by a deadline, so slow side effects (SMTP, Pushover,
+#          Slack retries) never hold up the next model call.
+# ------------------------------------------------------------------------
+import asyncio
+import contextvars
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+logger = logging.getLogger(__name__)
+
+
+class ToolExecutor:
+    def __init__(self, tools: list, functions: dict, deadline: float = 2.0,
+                 deadlines: dict = None, max_workers: int = 8):
+        # name -> callable, limited to the tools the model was offered
+        self.registry = {
+            tool["function"]["name"]: functions[tool["function"]["name"]]
+            for tool in tools
+            if tool["function"]["name"] in functions
+        }
+        self.deadline = deadline
+        self.deadlines = deadlines or {}
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tool")
+
+    def run(self, tool_calls: list, context: contextvars.Context = None) -> list:
+        """Run all tool calls concurrently and return the tool messages"""
+        submitted = [(call, time.monotonic(), self._submit(call, context)) for call in tool_calls]
+        messages = []
+        for call, started, future in submitted:
+            remaining = max(0.0, started + self._deadline_for(call) - time.monotonic())
+            try:
+                result = future.result(timeout=remaining)
+            except FutureTimeout:
+                result = self._accepted(call)
+            messages.append(self._tool_message(call, result))
+        return messages
+
+    async def run_async(self, tool_calls: list, context: contextvars.Context = None) -> list:
+        """Awaitable variant of run() for the asyncio assistant"""
+        async def wait(call):
+            future = asyncio.wrap_future(self._submit(call, context))
+            try:
+                # shield() lets the side effect finish after we stop waiting
+                result = await asyncio.wait_for(asyncio.shield(future), self._deadline_for(call))
+            except asyncio.TimeoutError:
+                result = self._accepted(call)
+            return self._tool_message(call, result)
+
+        return list(await asyncio.gather(*(wait(call) for call in tool_calls)))
+
+    def _submit(self, call: dict, context: contextvars.Context = None):
+        # Tools see the caller's context variables (e.g. the active profile);
+        # each call gets its own copy since a context can't be entered twice
+        context = (context or contextvars.copy_context()).copy()
+        future = self.pool.submit(context.run, self._invoke, call)
+        future.add_done_callback(self._log_late_failure)
+        return future
+
+    def _invoke(self, call: dict) -> dict:
+        fn_name = call["function"]["name"]
+        fn = self.registry.get(fn_name)
+        if fn is None:
+            return {"error": "unknown tool"}
+        try:
+            args = json.loads(call["function"]["arguments"] or "{}")
+        except json.JSONDecodeError as e:
+            return {"status": "error", "message": f"Invalid arguments: {e}"}
+        if not isinstance(args, dict):
+            return {"status": "error", "message": "Arguments must be a JSON object"}
+        try:
+            return fn(**args)
+        except TypeError as e:
+            return {"status": "error", "message": str(e)}
+        except Exception as e:
+            # The model still gets a tool message; a failing tool never ends the turn
+            logger.error(f"Tool {fn_name} failed: {e!r}")
+            return {"status": "error", "message": str(e)}
+
+    def _deadline_for(self, call: dict) -> float:
+        return self.deadlines.get(call["function"]["name"], self.deadline)
+
+    def _accepted(self, call: dict) -> dict:
+        logger.info(f"Tool {call['function']['name']} exceeded its deadline - continuing in background")
+        return {"status": "accepted", "message": "Request received and is being processed"}
+
+    @staticmethod
+    def _log_late_failure(future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Tool execution failed: {future.exception()}")
+
+    @staticmethod
+    def _tool_message(call: dict, result) -> dict:
+        return {
+            "role": "tool",
+            "tool_call_id": call["id"],
+            "content": json.dumps(result) if isinstance(result, dict) else str(result)
+        }
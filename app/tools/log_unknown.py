@@ -7,7 +7,7 @@ logger = logging.getLogger(__name__)
 
 def record_unknown_query(question: str) -> dict:
     try:
-        message = f"Unknown Question\nProfile: {config.CURRENT_PROFILE}\nQuestion: {question}"
+        message = f"Unknown Question\nProfile: {config.active_profile}\nQuestion: {question}"
         send_notification(message)
         logger.info(f"Logged unknown question: {question}")
         return {"status": "success", "message": "Question logged"}
@@ -8,7 +8,7 @@ def record_user_details(email: str, name: str = "Not provided", notes: str = "No
     try:
         message = (
             f"New Contact Request\n"
-            f"Profile: {config.CURRENT_PROFILE}\n"
+            f"Profile: {config.active_profile}\n"
             f"Name: {name}\n"
             f"Email: {email}\n"
             f"Notes: {notes}"
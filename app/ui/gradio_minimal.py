@@ -1,21 +1,120 @@
-
 import gradio as gr
-from app.assistant.minimal_assistant import ResumeAssistant
-from app.github import RepoAnalyzer
-from app.github.chat_manager import RepoChatManager
-from app.github import GithubLoader, RepoAnalyzer
+import asyncio
+import functools
+import threading
+import time
 import os
 from dotenv import load_dotenv
 from typing import List, Dict
-import matplotlib.pyplot as plt
 import io
 import base64
 
 load_dotenv()
-chat_manager = RepoChatManager()
-assistant = ResumeAssistant()
-github_loader = GithubLoader()
-analyzer = RepoAnalyzer()
+
+# openai, llama_index, PyGithub and matplotlib are imported - and the clients
+# built - on first use, so the UI starts serving without waiting for them
+_instances = {}
+_instance_locks = {name: threading.Lock() for name in ("assistant", "chat_manager", "github_loader", "analyzer", "repos", "warmer", "jobs")}
+
+
+def _lazy(name, factory):
+    if name not in _instances:
+        with _instance_locks[name]:
+            if name not in _instances:
+                _instances[name] = factory()
+    return _instances[name]
+
+
+def get_assistant():
+    def create():
+        from app.assistant.async_assistant import AsyncResumeAssistant
+        return AsyncResumeAssistant()
+    return _lazy("assistant", create)
+
+
+def get_chat_manager():
+    def create():
+        from app.github import RepoChatManager
+        return RepoChatManager()
+    return _lazy("chat_manager", create)
+
+
+def get_github_loader():
+    def create():
+        from app.github import GithubLoader
+        return GithubLoader()
+    return _lazy("github_loader", create)
+
+
+def get_analyzer():
+    def create():
+        from app.github import RepoAnalyzer
+        return RepoAnalyzer()
+    return _lazy("analyzer", create)
+
+
+def get_jobs():
+    """Background analysis jobs; clicks only submit and watch them"""
+    def create():
+        from app.github.jobs import JobManager
+        return JobManager(get_analyzer)
+    return _lazy("jobs", create)
+
+
+def get_public_repos():
+    """Repo list from GitHub: kept for the process once every repo loaded; a list
+    missing repos after GitHub errors is refetched after GITHUB_REPOS_RETRY seconds"""
+    with _instance_locks["repos"]:
+        cached = _instances.get("repos")  # (repos, retry_at or None)
+        if cached is None or (cached[1] is not None and time.monotonic() >= cached[1]):
+            repos, failures = load_public_repos()
+            retry_at = time.monotonic() + float(os.getenv("GITHUB_REPOS_RETRY", "300")) if failures else None
+            cached = _instances["repos"] = (repos, retry_at)
+    return cached[0]
+
+
+def get_warmer():
+    """Background pre-analysis of GITHUB_REPOS, sharing the UI's analyzer and its cache"""
+    def create():
+        from app.github.warmup import RepoWarmer
+        return RepoWarmer(get_analyzer)
+    return _lazy("warmer", create)
+
+
+def warmup_status() -> str:
+    """Markdown progress of the repo warm-up, refreshed by a timer in the Repo Analysis tab"""
+    if "warmer" not in _instances:
+        return ""
+    progress = get_warmer().progress()
+    if not progress["total"]:
+        return ""
+    done = progress["counts"].get("done", 0)
+    lines = [f"Pre-analyzed {done}/{progress['total']} repositories"]
+    for url, status in progress["repos"].items():
+        timing = f" ({status['seconds']}s)" if "seconds" in status else ""
+        lines.append(f"- {url.split('/')[-1]}: {status['state']}{timing}")
+    return "\n".join(lines)
+
+
+def preload():
+    """Build the assistant, warm the OpenAI pool and fetch the repo list while the UI is already up"""
+    try:
+        get_assistant()
+        from app.llm.client import warm_up
+        warm_up()
+        get_public_repos()
+        if os.getenv("GITHUB_WARMUP", "true").lower() == "true":
+            get_warmer().start()
+    except Exception as e:
+        print(f"Background preload failed: {str(e)}")
+
+
+async def warm_up_pool():
+    # Warm the async pool on Gradio's own event loop (once per process)
+    from app.llm.client import async_warm_up
+    await async_warm_up()
+
+
 # Custom Tag Component
 def create_tag(tag_text: str, visible: bool = True) -> gr.HTML:
     """Creates a styled tag component using HTML"""
@@ -52,7 +151,7 @@ def handle_repo_chat(repo_header: str, message: str, chat_history: list):
         if repo_header and "(" in repo_header:
             repo_url = repo_header.split("(")[-1].rstrip(")")
         
-        response = chat_manager.generate_response(repo_url or "resume", message)
+        response = get_chat_manager().generate_response(repo_url or "resume", message)
         
         bot_response = response.get("text", "No response text")
         if "follow_ups" in response:
@@ -66,10 +165,9 @@ def handle_repo_chat(repo_header: str, message: str, chat_history: list):
 
 active_tab = gr.State(value=0)  # 0=Resume Chat, 1=Repo Analysis, 2=Repo Chat
 
-def handle_repo_click(repo_url: str, action: str) -> list:
-    """Handle button clicks for repo actions - returns exactly 9 outputs"""
-    # Create default updates for all 9 outputs
-    default_updates = [
+def _default_updates() -> list:
+    """Default updates for all 9 outputs of the repo buttons"""
+    return [
         gr.update(value=""),                # repo_summary
         gr.update(value=""),                # skills_plot
         gr.update(value=""),                # skills_tags
@@ -80,35 +178,19 @@ def handle_repo_click(repo_url: str, action: str) -> list:
         gr.update(value=[]),                # repo_chatbot
         gr.update(selected=0)               # tabs (default to Resume Chat)
     ]
+
+def handle_repo_click(repo_url: str, action: str) -> list:
+    """Handle button clicks for repo actions - returns exactly 9 outputs"""
+    default_updates = _default_updates()
     
     if action == "summary":
         try:
-            analysis = analyzer.analyze(repo_url)  # Use the pre-initialized analyzer
-            return [
-                gr.update(value=analysis["summary"]),
-                gr.update(value=f'<img src="{create_skills_plot(analysis["skills"])}" style="max-width: 100%;">'),
-                gr.update(value=create_tech_tags(analysis["skills"])),
-                gr.update(visible=bool(analysis["skills"].get("aws_resources"))),
-                gr.update(visible=bool(analysis["skills"].get("ai_components"))),
-                gr.update(visible=bool(analysis["skills"].get("devops"))),
-                gr.update(value=f"### Analyzing: {repo_url.split('/')[-1]}"),
-                default_updates[7],  # Keep chat as is
-                gr.update(selected=1)  # Switch to Repo Analysis tab
-            ]
+            analysis = get_analyzer().analyze(repo_url)
         except Exception as e:
             print(f"Error analyzing repo: {str(e)}")
-            return [
-                gr.update(value=f"Error analyzing repository: {str(e)}"),
-                default_updates[1],
-                default_updates[2],
-                default_updates[3],
-                default_updates[4],
-                default_updates[5],
-                gr.update(value=f"### Error analyzing: {repo_url}"),
-                default_updates[7],
-                gr.update(selected=1)  # Still switch to Repo Analysis
-            ]
-    
+            return _error_updates(repo_url, e, default_updates)
+        return _analysis_updates(repo_url, analysis, default_updates)
+
     else:  # "chat" action
         if repo_url == "resume":
             return [
@@ -135,15 +217,93 @@ def handle_repo_click(repo_url: str, action: str) -> list:
                 gr.update(selected=2)  # Switch to Repo Chat tab
             ]
 
+def _analysis_updates(repo_url: str, analysis: dict, default_updates: list) -> list:
+    """The 9 outputs of a finished analysis (or its error)"""
+    try:
+        return [
+            gr.update(value=analysis["summary"]),
+            gr.update(value=f'<img src="{create_skills_plot(analysis["skills"])}" style="max-width: 100%;">'),
+            gr.update(value=create_tech_tags(analysis["skills"])),
+            gr.update(visible=bool(analysis["skills"].get("aws_resources"))),
+            gr.update(visible=bool(analysis["skills"].get("ai_components"))),
+            gr.update(visible=bool(analysis["skills"].get("devops"))),
+            gr.update(value=f"### Analyzing: {repo_url.split('/')[-1]}"),
+            default_updates[7],  # Keep chat as is
+            gr.update(selected=1)  # Switch to Repo Analysis tab
+        ]
+    except Exception as e:
+        print(f"Error analyzing repo: {str(e)}")
+        return _error_updates(repo_url, e, default_updates)
+
+
+def _error_updates(repo_url: str, error: Exception, default_updates: list) -> list:
+    """The 9 outputs of an analysis that failed"""
+    return [
+        gr.update(value=f"Error analyzing repository: {str(error)}"),
+        default_updates[1],
+        default_updates[2],
+        default_updates[3],
+        default_updates[4],
+        default_updates[5],
+        gr.update(value=f"### Error analyzing: {repo_url}"),
+        default_updates[7],
+        gr.update(selected=1)  # Still switch to Repo Analysis
+    ]
+
+
+def job_progress_markdown(job: dict) -> str:
+    """Stage list of a running analysis job"""
+    icons = {"pending": "⏳", "running": "🔄", "done": "✅", "failed": "❌", "skipped": "➖"}
+    lines = [f"**Analyzing {job['repo_url'].split('/')[-1]}** ({job['seconds']:.0f}s)", ""]
+    for name, stage in job["stages"].items():
+        timing = f" {stage['seconds']}s" if "seconds" in stage else ""
+        detail = f" - {stage['detail']}" if stage.get("detail") else ""
+        lines.append(f"- {icons.get(stage['state'], '')} {name}{timing}{detail}")
+    return "\n".join(lines)
+
+
+async def handle_repo_summary(repo_url: str):
+    """Submit (or join) an analysis job and stream its progress; never blocks a worker thread"""
+    default_updates = _default_updates()
+    jobs = await asyncio.to_thread(get_jobs)  # Only the first click builds the manager
+    job_id = jobs.submit(repo_url)
+    shown_partial = False
+    async for job in jobs.watch(job_id):
+        if job["state"] in ("done", "failed"):
+            analysis = job["result"] or {}
+            if "summary" not in analysis:
+                analysis = {"summary": f"Error analyzing repository: {job['error']}", "skills": {}}
+            yield _analysis_updates(repo_url, analysis, default_updates)
+        elif job["partial"] and not shown_partial:
+            # Quick phase done: skill plot and tags now, the AI summary when the deep phase ends
+            shown_partial = True
+            partial = job["partial"]
+            yield _analysis_updates(
+                repo_url, {**partial, "summary": f"{partial['summary']}\n\n{job_progress_markdown(job)}"}, default_updates
+            )
+        else:
+            summary = job_progress_markdown(job)
+            if job["partial"]:
+                summary = f"{job['partial']['summary']}\n\n{summary}"
+            yield [
+                gr.update(value=summary),
+                *(gr.update() for _ in range(5)),  # Plot and tags stay until the result replaces them
+                gr.update(value=f"### Analyzing: {repo_url.split('/')[-1]}"),
+                default_updates[7],
+                gr.update(selected=1)
+            ]
+
+
 def load_public_repos():
-    """Load public repos with better error handling"""
-    repo_urls = [url.strip() for url in os.getenv("GITHUB_REPOS", "").split(",") if url.strip()]
-    
-    repos = []
+    """Load public repos with better error handling; returns (repos, number of repos that failed)"""
+    from app.github.warmup import repo_urls_from_env
+    repo_urls = repo_urls_from_env()  # Same URLs the warm-up fills RepoCache for
+
+    repos, failures = [], 0
     for repo_url in repo_urls:
         try:
             repo_path = repo_url.split("github.com/")[-1].strip("/")
-            repo = github_loader.g.get_repo(repo_path)
+            repo = get_github_loader().g.get_repo(repo_path)
             
             repos.append({
                 "url": f"https://github.com/{repo_path}",
@@ -154,9 +314,10 @@ def load_public_repos():
             })
         except Exception as e:
             print(f"Error loading repo {repo_url}: {str(e)}")
+            failures += 1
             continue
     
-    return [r for r in repos if not r['private']]
+    return [r for r in repos if not r['private']], failures
     
 def create_repo_card(repo):
     """Generate project card UI"""
@@ -169,7 +330,7 @@ def create_repo_card(repo):
     </div>
     """
 
-def respond(message, history):
+async def respond(message, history, request: gr.Request):
     history = history or []
     
     # Add user message with icon (using the new format)
@@ -183,25 +344,39 @@ def respond(message, history):
         "role": "assistant",
         "content": "<span class='spinner'></span>"
     })
+    yield history, ""
     
     try:
-        response = assistant.chat(message)
-        # Update with bot response and icon
-        history[-1] = {
-            "role": "assistant",
-            "content": f"🤖 {response}"
-        }
+        # Built off the event loop; only the first chat after startup can wait on it
+        assistant = await asyncio.to_thread(get_assistant)
+
+        # Render model deltas as they arrive
+        response = ""
+        async for delta in assistant.chat_stream(
+            message,
+            session_id=request.session_hash,
+            profile=assistant.profiles.resolve(request).name
+        ):
+            response += delta
+            history[-1] = {
+                "role": "assistant",
+                "content": f"🤖 {response}"
+            }
+            yield history, ""
     except Exception as e:
         # Update with error message
         history[-1] = {
             "role": "assistant",
             "content": f"⚠️ Error: {str(e)}"
         }
-    
-    return history
+        yield history, ""
 
 def create_skills_plot(skills: Dict[str, List[str]]) -> str:
     """Generate skill distribution bar chart"""
+    import matplotlib
+    matplotlib.use("Agg")  # No display in the pod
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(8, 4))
     categories = []
     counts = []
@@ -723,7 +898,8 @@ with gr.Blocks(css=custom_css) as demo:
         # Middle Column - Project List
         with gr.Column(scale=2):
             gr.Markdown("### My Projects")
-            public_repos = load_public_repos()
+            # Filled from GitHub after the page is served (see demo.load below)
+            public_repos = gr.State([])
             
             # Resume chat card
             with gr.Group(elem_classes="repo-card"):
@@ -736,14 +912,32 @@ with gr.Blocks(css=custom_css) as demo:
                     resume_chat_btn = gr.Button("Chat", elem_classes="chat-btn")
             
             # Repository cards
-            repo_components = []
-            for repo in public_repos:
-                with gr.Group(elem_classes="repo-card"):
-                    gr.Markdown(create_repo_card(repo))
-                    with gr.Row():
-                        summary_btn = gr.Button("AI Summary", elem_classes="summary-btn")
-                        chat_btn = gr.Button("Chat", elem_classes="chat-btn")
-                        repo_components.append((repo["url"], summary_btn, chat_btn))
+            @gr.render(inputs=public_repos)
+            def render_repo_cards(repos):
+                for repo in repos:
+                    with gr.Group(elem_classes="repo-card"):
+                        gr.Markdown(create_repo_card(repo))
+                        with gr.Row():
+                            summary_btn = gr.Button("AI Summary", elem_classes="summary-btn")
+                            chat_btn = gr.Button("Chat", elem_classes="chat-btn")
+                    summary_btn.click(
+                        functools.partial(handle_repo_summary, repo["url"]),
+                        outputs=[
+                            repo_summary, skills_plot, skills_tags,
+                            aws_tag, ai_tag, devops_tag,
+                            current_repo_header, repo_chatbot,
+                            tabs
+                        ]
+                    )
+                    chat_btn.click(
+                        lambda url=repo["url"]: handle_repo_click(url, "chat"),
+                        outputs=[
+                            repo_summary, skills_plot, skills_tags,
+                            aws_tag, ai_tag, devops_tag,
+                            current_repo_header, repo_chatbot,
+                            tabs
+                        ]
+                    )
         
         # Right Column - Content
         with gr.Column(scale=4, elem_classes="right-panel"):
@@ -764,11 +958,15 @@ with gr.Blocks(css=custom_css) as demo:
                     msg.submit(
                         respond,
                         [msg, chatbot],
-                        [chatbot, msg]
+                        [chatbot, msg],
+                        concurrency_limit=None  # Async handler: no worker thread per chat
                     )
+                    demo.load(warm_up_pool, inputs=None, outputs=None)
                     
                 # Repo Analysis Tab
                 with gr.Tab("Repo Analysis", id="repo"):
+                    warmup_progress = gr.Markdown()
+                    gr.Timer(5).tick(warmup_status, inputs=None, outputs=warmup_progress)
                     repo_summary = gr.Markdown()
                     gr.Markdown("### Skill Distribution")
                     skills_plot = gr.HTML()
@@ -797,7 +995,7 @@ with gr.Blocks(css=custom_css) as demo:
                     )
         # Bind resume buttons
         resume_summary_btn.click(
-            lambda: handle_repo_click("resume", "summary"),
+            functools.partial(handle_repo_summary, "resume"),
             outputs=[
                 repo_summary, skills_plot, skills_tags,
                 aws_tag, ai_tag, devops_tag,
@@ -816,26 +1014,9 @@ with gr.Blocks(css=custom_css) as demo:
             ]
         )
 
-        # For repo cards
-        for repo_url, summary_btn, chat_btn in repo_components:
-            summary_btn.click(
-                lambda url=repo_url: handle_repo_click(url, "summary"),
-                outputs=[
-                    repo_summary, skills_plot, skills_tags,
-                    aws_tag, ai_tag, devops_tag,
-                    current_repo_header, repo_chatbot,
-                    tabs
-                ]
-            )
-            chat_btn.click(
-                lambda url=repo_url: handle_repo_click(url, "chat"),
-                outputs=[
-                    repo_summary, skills_plot, skills_tags,
-                    aws_tag, ai_tag, devops_tag,
-                    current_repo_header, repo_chatbot,
-                    tabs
-                ]
-            )
+        # Repo list arrives after the page is up instead of blocking startup
+        demo.load(get_public_repos, inputs=None, outputs=public_repos)
 
 if __name__ == "__main__":
+    threading.Thread(target=preload, name="ui-preload", daemon=True).start()
     demo.launch()
@@ -1,11 +1,12 @@
 import gradio as gr
-from app.assistant.minimal_assistant import ResumeAssistant
+from app.assistant.async_assistant import AsyncResumeAssistant
 from app.assistant.config.non_ai import config
+from app.llm.client import async_warm_up
 import time
 import re
 import os
 
-assistant = ResumeAssistant()
+assistant = AsyncResumeAssistant()
 
 def get_ui_config():
     """Helper to get current UI config"""
@@ -34,7 +35,7 @@ def clean_response(response):
         response = response.replace(full_name, config.first_name)
     return re.sub(r'\s+', ' ', response).strip()
 
-def respond(message, history):
+async def respond(message, history, request: gr.Request):
     ui_config = get_ui_config()
     history = history or []
     
@@ -46,26 +47,22 @@ def respond(message, history):
     history[-1] = (message, ui_config["chat"]["thinking_message"])
     yield history, history
     
-    # 3. Get and clean AI response (only affects bot's replies)
-    response = assistant.chat(message)  # Pass original message unchanged
-    
-    clean_response = clean_message(response)
-    clean_response = (
-        clean_response
-        .replace(f"{config.PERSONAL['name']}'s", f"{config.first_name}'s")
-        .replace(f"{config.PERSONAL['name']} ", f"{config.first_name} ")
-        .replace("  ", " ")
-        .strip()
-    )
-    
-    # 4. Type out response
-    full_response = ""
-    for char in clean_response:
-        full_response += char
-        history[-1] = (message, full_response)  # Keep original user message
+    # 3. Stream and clean AI response (only affects bot's replies)
+    response = ""
+    profile = assistant.profiles.resolve(request).name  # Header, ?profile= or URL path
+    async for delta in assistant.chat_stream(message, session_id=request.session_hash, profile=profile):  # Pass original message unchanged
+        response += delta
+        clean_response = clean_message(response)
+        clean_response = (
+            clean_response
+            .replace(f"{config.PERSONAL['name']}'s", f"{config.first_name}'s")
+            .replace(f"{config.PERSONAL['name']} ", f"{config.first_name} ")
+            .replace("  ", " ")
+            .strip()
+        )
+        history[-1] = (message, clean_response)  # Keep original user message
         yield history, history
-        time.sleep(ui_config["chat"]["typing_delay"])
-           
+
 def load_initial_message():
     ui_config = get_ui_config()
     initial_text = ui_config["chat"]["initial_message"]
@@ -397,7 +394,7 @@ with gr.Blocks(css=custom_css) as demo:
                     <h2 class="profile-title">{config.PERSONAL['title']}</h2>
                     <p class="profile-description">{config.PERSONAL['description']}</p>
                     """)
-                    
+
                     download_btn = gr.Button(
                         config.PERSONAL["resume_button_text"], 
                         elem_classes="download-btn"
@@ -440,7 +437,7 @@ with gr.Blocks(css=custom_css) as demo:
                 yield [(None, initial_text)]
             
             # Modified to preserve initial message
-            def respond(message, history):
+            async def respond(message, history, request: gr.Request):
                 history = history or []
                 
                 # Keep original user message
@@ -451,17 +448,16 @@ with gr.Blocks(css=custom_css) as demo:
                 history[-1] = (message, config.UI["chat"]["thinking_message"])
                 yield history, history
                 
-                # Get and display response
-                response = assistant.chat(message)
-                clean_response = clean_message(response)
-                
-                full_response = ""
-                for char in clean_response:
-                    full_response += char
-                    history[-1] = (message, full_response)
+                # Stream response deltas as they arrive
+                response = ""
+                profile = assistant.profiles.resolve(request).name  # Header, ?profile= or URL path
+                async for delta in assistant.chat_stream(message, session_id=request.session_hash, profile=profile):
+                    response += delta
+                    history[-1] = (message, clean_message(response))
                     yield history, history
-                    time.sleep(config.UI["chat"]["typing_delay"])
-            
+
+            # Warm the async pool on Gradio's own event loop (once per process)
+            demo.load(async_warm_up, inputs=None, outputs=None)
             demo.load(
                 load_initial_message,
                 inputs=None,
@@ -474,7 +470,8 @@ with gr.Blocks(css=custom_css) as demo:
             msg.submit(
                 respond,
                 inputs=[msg, state],
-                outputs=[chatbot, state]
+                outputs=[chatbot, state],
+                concurrency_limit=None  # Async handler: no worker thread per chat
             ).then(
                 lambda: "",
                 None,
@@ -0,0 +1,79 @@
+# ------------------------------------------------------------------------------
+# Script: benchmark_chat.py
+# Purpose: Measure time-to-first-token and total latency of the resume chat
+#          under concurrent load, against OPENAI_BASE_URL (normally the local
+#          fake server, so no network or API spend is involved).
+#
+# How to Run:
+#   python -m app.llm.fake_server --latency lognormal:-1.5,0.5 --tps 40 &
+#   OPENAI_BASE_URL=http://127.0.0.1:8088/v1 python scripts/benchmark_chat.py --concurrency 20 --requests 200
+#
+# Expected Output:
+#   p50/p95/max for time-to-first-token and total latency, plus throughput
+# ------------------------------------------------------------------------------
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(args):
+    from app.assistant.async_assistant import AsyncResumeAssistant
+    from app.llm import client
+
+    assistant = AsyncResumeAssistant()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    ttft, total = [], []
+
+    async def one(i):
+        question = args.question if args.identical else f"{args.question} (#{i})"
+        async with semaphore:
+            start = time.perf_counter()
+            first = None
+            async for _ in assistant.chat_stream(question):
+                if first is None:
+                    first = time.perf_counter() - start
+            ttft.append(first or 0.0)
+            total.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    for name, values in (("time to first token", ttft), ("total latency", total)):
+        print(
+            f"{name:>20}: p50={statistics.median(values) * 1000:.0f} ms "
+            f"p95={percentile(values, 95) * 1000:.0f} ms max={max(values) * 1000:.0f} ms"
+        )
+    print(f"{'throughput':>20}: {args.requests / elapsed:.1f} chats/s ({args.requests} chats, concurrency {args.concurrency})")
+    print(f"{'single-flight':>20}: {assistant.flights.stats()}")
+    print(f"{'connection pool':>20}: {client.stats().get('async_http')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume chat latency benchmark")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--question", default="What cloud experience does Girma have?")
+    parser.add_argument("--identical", action="store_true", help="Send the same question every time")
+    args = parser.parse_args()
+
+    if not os.getenv("OPENAI_BASE_URL"):
+        print("WARNING: OPENAI_BASE_URL is not set - this will call the real OpenAI API")
+    # Measure the model path, not the answer cache
+    os.environ.setdefault("ANSWER_CACHE", "false")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# ------------------------------------------------------------------------------
+# Script: benchmark_skill_scanner.py
+# Purpose: Compare the single-pass SkillScanner with the previous per-category
+#          detectors of RepoAnalyzer on a synthetic large repository.
+#
+# How to Run:
+#   python scripts/benchmark_skill_scanner.py
+#   python scripts/benchmark_skill_scanner.py --files 5000 --file-kb 8 --services 10
+#
+# Expected Output:
+#   Time per run for both implementations, the speed-up, and any difference
+#   between their results (see LegacySkillDetector for the expected ones)
+# ------------------------------------------------------------------------------
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github import skills
+from app.github.skills import SkillScanner
+
+
+class LegacySkillDetector:
+    """Frozen copy of RepoAnalyzer's detectors before SkillScanner.
+
+    Known differences from SkillScanner:
+      - terms with capitals ('apiVersion: apps/v1', 'AutoModelFor',
+        'dynamodb.Table', 'Cargo.toml') never matched the lowercased text
+      - AI packages were looked up in every file once any requirements.txt existed
+    """
+
+    def extract_skills(self, documents) -> dict:
+        filenames = [d.metadata.get("file_name", "").lower() for d in documents]
+        content = " ".join(d.text for d in documents)
+
+        return {
+            "languages": self._map_extensions(documents),
+            "devops": self._detect_devops(filenames, content),
+            "ai_components": self._detect_ai_tech(filenames, content),
+            "aws_resources": self._detect_aws_resources(filenames, content),
+            "frameworks": self._detect_frameworks(filenames)
+        }
+
+    def _detect_devops(self, filenames, content):
+        devops_indicators = {
+            'dockerfile': 'Docker', 'kubernetes': 'Kubernetes', 'argo': 'ArgoCD', 'helm': 'Helm',
+            'terraform': 'Terraform', 'github-actions': 'GitHub Actions',
+            'apiVersion: apps/v1': 'Kubernetes', 'image: ': 'Docker', 'helm install': 'Helm'
+        }
+        detected = set()
+        for filename in filenames:
+            for term, tool in devops_indicators.items():
+                if term in filename:
+                    detected.add(tool)
+        for term, tool in devops_indicators.items():
+            if term in content.lower():
+                detected.add(tool)
+        return sorted(detected)
+
+    def _detect_ai_tech(self, filenames, content):
+        ai_indicators = {
+            'requirements.txt': self._scan_ai_dependencies,
+            'pytorch': 'PyTorch', 'tensorflow': 'TensorFlow', 'transformers': 'HuggingFace',
+            'from langchain': 'LangChain', 'openai': 'OpenAI', 'llama-index': 'LlamaIndex',
+            'model.fit(': 'Scikit-learn/TensorFlow', 'AutoModelFor': 'HuggingFace'
+        }
+        detected = set()
+        for filename in filenames:
+            if 'requirements.txt' in filename:
+                detected.update(self._scan_ai_dependencies(content))
+            for term, tool in ai_indicators.items():
+                if callable(tool):
+                    continue
+                if term in filename:
+                    detected.add(tool)
+        for term, tool in ai_indicators.items():
+            if callable(tool):
+                continue
+            if term in content.lower():
+                detected.add(tool)
+        return sorted(detected)
+
+    def _detect_aws_resources(self, filenames, content):
+        aws_indicators = {
+            'serverless.yml': 'AWS Lambda', 'template.yaml': 'AWS CloudFormation', 'cdk.json': 'AWS CDK',
+            'boto3': 'AWS SDK (Python)', 'aws-sdk': 'AWS SDK', 'aws configure': 'AWS CLI',
+            's3://': 'Amazon S3', 'arn:aws:lambda': 'AWS Lambda', 'arn:aws:s3': 'Amazon S3',
+            'arn:aws:ec2': 'Amazon EC2', 'dynamodb.Table': 'Amazon DynamoDB', 'sns.publish': 'Amazon SNS',
+            'sqs.send_message': 'Amazon SQS', 'rds.amazonaws.com': 'Amazon RDS',
+            'secretsmanager': 'AWS Secrets Manager'
+        }
+        detected = set()
+        for filename in filenames:
+            for term, service in aws_indicators.items():
+                if term in filename:
+                    detected.add(service)
+        content_lower = content.lower()
+        for term, service in aws_indicators.items():
+            if term in content_lower:
+                detected.add(service)
+        if any(f.endswith('.tf') for f in filenames):
+            tf_services = {
+                'aws_instance': 'Amazon EC2', 'aws_lambda_function': 'AWS Lambda',
+                'aws_s3_bucket': 'Amazon S3', 'aws_rds_cluster': 'Amazon RDS'
+            }
+            for term, service in tf_services.items():
+                if term in content_lower:
+                    detected.add(service)
+        return sorted(detected)
+
+    def _scan_ai_dependencies(self, content):
+        ai_packages = {
+            'torch': 'PyTorch', 'tensorflow': 'TensorFlow', 'transformers': 'HuggingFace',
+            'openai': 'OpenAI', 'langchain': 'LangChain', 'llama-index': 'LlamaIndex',
+            'sentence-transformers': 'Sentence Transformers'
+        }
+        found = set()
+        for line in content.split('\n'):
+            line = line.split('#')[0].strip().lower()
+            for pkg, name in ai_packages.items():
+                if pkg in line:
+                    found.add(name)
+        return sorted(found)
+
+    def _map_extensions(self, documents):
+        extension_map = {
+            '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript', '.java': 'Java', '.go': 'Go',
+            '.rs': 'Rust', '.md': 'Markdown', '.yml': 'YAML', '.yaml': 'YAML'
+        }
+        extensions = set()
+        for doc in documents:
+            ext = Path(doc.metadata.get("file_name", "")).suffix
+            if ext:
+                extensions.add(ext)
+        return sorted({extension_map[ext] for ext in extensions if ext in extension_map})
+
+    def _detect_frameworks(self, filenames):
+        framework_hints = {
+            'requirements.txt': 'Python', 'package.json': 'Node.js', 'go.mod': 'Go',
+            'Cargo.toml': 'Rust', 'dockerfile': 'Docker', 'config.ru': 'Ruby on Rails'
+        }
+        detected = set()
+        for filename in filenames:
+            for hint, framework in framework_hints.items():
+                if hint in filename:
+                    detected.add(framework)
+        return sorted(detected)
+
+
+SPECIAL_FILES = {
+    "Dockerfile": "FROM python:3.11-slim\nRUN pip install -r requirements.txt\n",
+    "deploy/kubernetes/deployment.yaml": "apiVersion: apps/v1\nkind: Deployment\n  image: resume:latest\n",
+    "infra/main.tf": 'resource "aws_s3_bucket" "cache" {}\nresource "aws_lambda_function" "api" {}\n',
+    "package.json": '{"dependencies": {"aws-sdk": "^2.0.0"}}\n',
+}
+
+REQUIREMENTS = "openai==1.97.0\nllama-index==0.12.0\n# torch is optional\nnumpy\n"
+
+CODE_SNIPPETS = [
+    "import boto3",
+    "table = boto3.resource('dynamodb').Table('users')",
+    "client = OpenAI()",
+    "from langchain.chains import LLMChain",
+    "s3_uri = 's3://resume-bucket/cv.pdf'",
+]
+
+
+def synthetic_repo(files: int, file_kb: int, services: int, seed: int = 7) -> list:
+    """Random code-like files plus manifests, one requirements.txt per service"""
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choices(string.ascii_letters + "_", k=rng.randint(2, 12))) for _ in range(4000)]
+    extensions = [".py", ".js", ".ts", ".go", ".md", ".yaml", ".java"]
+    documents = []
+    for i in range(files):
+        lines, size = [], 0
+        while size < file_kb * 1024:
+            if rng.random() < 0.01:
+                line = rng.choice(CODE_SNIPPETS)
+            else:
+                line = "    " + " ".join(rng.choices(vocabulary, k=rng.randint(3, 8)))
+            lines.append(line)
+            size += len(line) + 1
+        name = f"services/svc_{i % services}/module_{i}{rng.choice(extensions)}"
+        documents.append(SimpleNamespace(text="\n".join(lines), metadata={"file_name": name}))
+    for i in range(services):
+        documents.append(SimpleNamespace(text=REQUIREMENTS, metadata={"file_name": f"services/svc_{i}/requirements.txt"}))
+    for name, text in SPECIAL_FILES.items():
+        documents.append(SimpleNamespace(text=text, metadata={"file_name": name}))
+    return documents
+
+
+def timed(fn, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skill scanner benchmark")
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--file-kb", type=int, default=8, help="Approximate size of each file")
+    parser.add_argument("--services", type=int, default=5, help="Services, each with its own requirements.txt")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    documents = synthetic_repo(args.files, args.file_kb, args.services)
+    size_mb = sum(len(d.text) for d in documents) / 1e6
+    print(f"Synthetic repo: {len(documents)} files, {size_mb:.1f} MB")
+    print(f"Matcher: {'Aho-Corasick (pyahocorasick)' if skills.ahocorasick else 'combined regex'}")
+
+    scanner = SkillScanner()
+    legacy = LegacySkillDetector()
+    legacy_time, legacy_result = timed(lambda: legacy.extract_skills(documents), args.runs)
+    scanner_time, scanner_result = timed(lambda: scanner.scan(documents), args.runs)
+
+    print(f"{'legacy detectors':>18}: {legacy_time * 1000:.0f} ms")
+    print(f"{'SkillScanner':>18}: {scanner_time * 1000:.0f} ms ({legacy_time / scanner_time:.1f}x faster)")
+
+    for category in scanner_result:
+        old, new = set(legacy_result.get(category, [])), set(scanner_result[category])
+        if old != new:
+            print(f"{category}: only legacy {sorted(old - new)}, only scanner {sorted(new - old)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# ------------------------------------------------------------------------------
+# Script: benchmark_startup.py
+# Purpose: Measure how long importing a UI module takes, using
+#          `python -X importtime` in a fresh interpreter, and list the
+#          slowest imports so startup regressions can be tracked over time.
+#
+# How to Run:
+#   python scripts/benchmark_startup.py
+#   python scripts/benchmark_startup.py --module app.ui.gradio_resume_chat --runs 5
+#   python scripts/benchmark_startup.py --record cache/startup_history.jsonl
+#
+# Expected Output:
+#   Wall-clock and import time (median over runs) and the slowest packages
+#   by cumulative import time; --record appends one JSON line per invocation
+# ------------------------------------------------------------------------------
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# "import time:       412 |       1893 |   openai"
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> list:
+    """[(package, self_us, cumulative_us, depth)] in the order Python reported them"""
+    rows = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, package = match.groups()
+            rows.append((package, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def measure(module: str) -> dict:
+    """Import module once in a fresh interpreter"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,  # Runs in the current directory, which must hold me/
+        text=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"Importing {module} failed:\n" + "\n".join(errors[-10:]))
+
+    rows = parse_importtime(result.stderr)
+    top_level = [r for r in rows if r[3] == 0]
+
+    # Heaviest entry per root package (openai, gradio, matplotlib, ...)
+    heaviest = {}
+    for row in rows:
+        root = row[0].split(".")[0]
+        if row[0] != module and row[2] > heaviest.get(root, ("", 0, 0, 0))[2]:
+            heaviest[root] = row
+    return {
+        "wall_s": wall,
+        "import_s": sum(r[2] for r in top_level) / 1e6,
+        "modules": len(rows),
+        "top": sorted(heaviest.values(), key=lambda r: r[2], reverse=True),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UI import-time benchmark")
+    parser.add_argument("--module", default="app.ui.gradio_minimal")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters to start (median is reported)")
+    parser.add_argument("--top", type=int, default=15, help="Slowest packages to list")
+    parser.add_argument("--record", help="Append the result as a JSON line to this file")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    wall = statistics.median(r["wall_s"] for r in runs)
+    imports = statistics.median(r["import_s"] for r in runs)
+
+    print(f"{args.module}: wall={wall * 1000:.0f} ms import={imports * 1000:.0f} ms "
+          f"modules={runs[-1]['modules']} (median of {args.runs})")
+    print(f"\n{'cumulative ms':>14} {'self ms':>9}  package")
+    for package, self_us, cumulative_us, _ in runs[-1]["top"][:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {package}")
+
+    if args.record:
+        os.makedirs(os.path.dirname(os.path.abspath(args.record)), exist_ok=True)
+        with open(args.record, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "revision": git_revision(),
+                "module": args.module,
+                "wall_ms": round(wall * 1000, 1),
+                "import_ms": round(imports * 1000, 1),
+                "modules": runs[-1]["modules"],
+                "top": {p: round(c / 1000, 1) for p, _, c, _ in runs[-1]["top"][:args.top]},
+            }) + "\n")
+        print(f"\nRecorded to {args.record}")
+
+
+if __name__ == "__main__":
+    main()
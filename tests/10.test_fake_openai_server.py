@@ -0,0 +1,92 @@
+# ------------------------------------------------------------------------------
+# File: tests/10.test_fake_openai_server.py
+# Purpose: Start the local fake OpenAI server and exercise it with the real
+#          OpenAI SDK: completions, streaming, tool calls, embeddings and
+#          injected errors. Needs no network access or API key.
+#
+# How to Run:
+#   python tests/10.test_fake_openai_server.py
+#
+# Expected Output:
+#   SUCCESS: fake OpenAI server behaves like the API.
+# ------------------------------------------------------------------------------
+import json
+import os
+import sys
+import threading
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import openai
+from openai import OpenAI
+
+from app.llm.fake_server import FakeServerConfig, create_server
+
+TOOLS = [{
+    "type": "function",
+    "function": {
+        "name": "record_user_details",
+        "parameters": {
+            "type": "object",
+            "properties": {"email": {"type": "string"}, "name": {"type": "string"}},
+            "required": ["email"],
+        },
+    },
+}]
+
+
+def _start(server_config):
+    server = create_server(port=0, server_config=server_config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = OpenAI(api_key="sk-local", base_url=f"http://127.0.0.1:{server.server_port}/v1", max_retries=0)
+    return server, client
+
+
+def test_fake_server():
+    server, client = _start(FakeServerConfig(latency="fixed:0.01", response_tokens=12))
+    try:
+        response = client.chat.completions.create(
+            model="gpt-4", messages=[{"role": "user", "content": "Say hello"}]
+        )
+        assert response.choices[0].finish_reason == "stop"
+        assert len(response.choices[0].message.content.split()) == 12
+
+        deltas = [
+            chunk.choices[0].delta.content
+            for chunk in client.chat.completions.create(
+                model="gpt-4", messages=[{"role": "user", "content": "Say hello"}], stream=True
+            )
+            if chunk.choices and chunk.choices[0].delta.content
+        ]
+        assert "".join(deltas) == response.choices[0].message.content
+
+        arguments = ""
+        for chunk in client.chat.completions.create(
+            model="gpt-4", tools=TOOLS, stream=True,
+            messages=[{"role": "user", "content": "Please reach me at alice@example.com"}]
+        ):
+            for call in (chunk.choices[0].delta.tool_calls or []) if chunk.choices else []:
+                arguments += call.function.arguments or ""
+        assert json.loads(arguments)["email"] == "alice@example.com"
+
+        embeddings = client.embeddings.create(model="text-embedding-ada-002", input=["a", "b", "a"])
+        vectors = [item.embedding for item in embeddings.data]
+        assert len(vectors[0]) == 1536 and vectors[0] == vectors[2] != vectors[1]
+    finally:
+        server.shutdown()
+
+    server, client = _start(FakeServerConfig(latency="fixed:0", error_rate=1.0, error_statuses=[429]))
+    try:
+        client.chat.completions.create(model="gpt-4", messages=[{"role": "user", "content": "hi"}])
+        raise AssertionError("Expected an injected error")
+    except openai.RateLimitError:
+        pass
+    finally:
+        server.shutdown()
+
+    print("SUCCESS: fake OpenAI server behaves like the API.")
+
+
+if __name__ == "__main__":
+    test_fake_server()
@@ -0,0 +1,104 @@
+# ------------------------------------------------------------------------------
+# File: tests/11.test_shared_client.py
+# Purpose: Verify that the OpenAI client factory hands out one process-wide
+#          client per flavour, that warm-up opens a pooled connection and that
+#          later requests reuse it (checked against the local fake server),
+#          and that pool metrics count failed requests and whole streams.
+#
+# How to Run:
+#   python tests/11.test_shared_client.py
+#
+# Expected Output:
+#   SUCCESS: OpenAI clients share one warmed connection pool.
+# ------------------------------------------------------------------------------
+import asyncio
+import os
+import sys
+import threading
+
+import httpx
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.llm import client
+from app.llm.fake_server import FakeServerConfig, create_server
+
+
+def test_shared_client():
+    server = create_server(port=0, server_config=FakeServerConfig(latency="fixed:0.01", response_tokens=5))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+    try:
+        assert client.get_openai_client() is client.get_openai_client()
+        assert client.get_async_openai_client() is client.get_async_openai_client()
+        assert client.get_openai_client()._client is client.get_http_client()
+
+        assert client.warm_up()
+        assert client.stats()["http"]["connections"] == 1
+
+        for _ in range(5):
+            client.get_openai_client().chat.completions.create(
+                model="gpt-4", messages=[{"role": "user", "content": "Say hello"}]
+            )
+        pool = client.stats()["http"]
+        assert pool["requests"] == 6 and pool["in_flight"] == 0, pool
+        assert pool["connections"] == 1 and pool["idle"] == 1, pool
+
+        assert asyncio.run(client.async_warm_up())
+        assert client.stats()["async_http"]["requests"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_pool_metrics():
+    def handler(request):
+        if request.url.path == "/down":
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, content=iter([b"chunk "] * 100))  # Streamed, like a real transport
+
+    metrics = client.PoolMetrics()
+    http_client = httpx.Client(transport=client.MeteredTransport(httpx.MockTransport(handler), metrics))
+    for _ in range(3):
+        try:
+            http_client.get("http://test/down")
+            raise AssertionError("Expected a connect error")
+        except httpx.ConnectError:
+            pass
+    assert metrics.snapshot() == {"requests": 3, "in_flight": 0, "errors": 3}, metrics.snapshot()
+
+    http_client.get("http://test/missing")
+    with http_client.stream("GET", "http://test/ok") as response:
+        assert metrics.snapshot()["in_flight"] == 1  # Headers are in, the body is not
+        response.read()
+    assert metrics.snapshot() == {"requests": 5, "in_flight": 0, "errors": 4}, metrics.snapshot()
+
+    async def body():
+        for _ in range(100):
+            yield b"chunk "
+
+    async def async_handler(request):
+        if request.url.path == "/down":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, content=body())
+
+    async def failing():
+        metrics = client.PoolMetrics()
+        transport = client.AsyncMeteredTransport(httpx.MockTransport(async_handler), metrics)
+        async with httpx.AsyncClient(transport=transport) as async_client:
+            for path in ("down", "ok"):
+                try:
+                    await async_client.get(f"http://test/{path}")
+                except httpx.ConnectError:
+                    pass
+        return metrics.snapshot()
+
+    assert asyncio.run(failing()) == {"requests": 2, "in_flight": 0, "errors": 1}
+
+
+if __name__ == "__main__":
+    test_shared_client()
+    test_pool_metrics()
+    print("SUCCESS: OpenAI clients share one warmed connection pool.")
@@ -0,0 +1,81 @@
+# ------------------------------------------------------------------------------
+# File: tests/12.test_profiles.py
+# Purpose: Verify multi-profile serving: every profile under me/ is loaded into
+#          its own bundle, requests are routed by header, query parameter or
+#          path, and one assistant answers for each profile through the shared
+#          client (against the local fake OpenAI server).
+#
+# How to Run:
+#   python tests/12.test_profiles.py
+#
+# Expected Output:
+#   SUCCESS: one assistant serves every profile.
+# ------------------------------------------------------------------------------
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from app.llm.fake_server import FakeServerConfig, create_server
+
+
+def _profile_tree(root: Path):
+    """me/<profile>/{gi.pdf,summary.txt} plus me/profile.png in a scratch dir"""
+    for profile in ("ai", "power_platform"):
+        folder = root / "me" / profile
+        folder.mkdir(parents=True)
+        shutil.copy(REPO / "me" / "gi.pdf", folder / "gi.pdf")
+        (folder / "summary.txt").write_text(f"Summary for the {profile} profile.", encoding="utf-8")
+    (root / "me" / "profile.png").write_bytes(b"")
+
+
+def test_profiles():
+    server = create_server(port=0, server_config=FakeServerConfig(latency="fixed:0.01", response_tokens=5))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+    os.environ["ANSWER_CACHE"] = "false"
+
+    workdir = tempfile.mkdtemp()
+    _profile_tree(Path(workdir))
+    os.chdir(workdir)
+    try:
+        from app.assistant.minimal_assistant import ResumeAssistant
+
+        assistant = ResumeAssistant()
+        profiles = assistant.profiles
+        assert sorted(profiles.names()) == ["ai", "power_platform"]
+        ai, pp = profiles.get("ai"), profiles.get("power_platform")
+        assert "Summary for the ai profile." in assistant.system_prompt("hi", ai)
+        assert "Power Platform" in assistant.system_prompt("hi", pp)
+        assert {t["function"]["name"] for t in ai.tools} != {t["function"]["name"] for t in pp.tools}
+
+        def request(path="/", headers=None, query=None):
+            return SimpleNamespace(url=SimpleNamespace(path=path), headers=headers or {}, query_params=query or {})
+
+        assert profiles.resolve(request(headers={"x-resume-profile": "ai"})) is ai
+        assert profiles.resolve(request(query={"profile": "ai"})) is ai
+        assert profiles.resolve(request(path="/ai/gradio_api/queue/join")) is ai
+        assert profiles.resolve(request(headers={"referer": "https://example.com/ai/"})) is ai
+        assert profiles.resolve(request(path="/unknown")) is profiles.get()
+
+        # One client and one cache set serve both profiles; sessions stay apart
+        assert assistant.chat("What is Girma's email?", session_id="s1", profile="ai")
+        assert assistant.chat("What is Girma's email?", session_id="s1", profile="power_platform")
+        assert len(assistant.sessions.get("ai:s1").turns) == 1
+        assert len(assistant.sessions.get("power_platform:s1").turns) == 1
+    finally:
+        os.chdir(REPO)
+        shutil.rmtree(workdir, ignore_errors=True)
+        server.shutdown()
+    print("SUCCESS: one assistant serves every profile.")
+
+
+if __name__ == "__main__":
+    test_profiles()
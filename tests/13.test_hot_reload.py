@@ -0,0 +1,94 @@
+# ------------------------------------------------------------------------------
+# File: tests/13.test_hot_reload.py
+# Purpose: Verify hot reload of profiles: summary, PDF and non_ai.py edits are
+#          picked up after they settle, the PDF is only re-extracted when its
+#          hash changes, old bundles stay intact for in-flight requests and
+#          the answer cache is invalidated.
+#
+# How to Run:
+#   python tests/13.test_hot_reload.py
+#
+# Expected Output:
+#   SUCCESS: profile edits are hot reloaded.
+# ------------------------------------------------------------------------------
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Ensure app/ is in the import path
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+
+def _profile_tree(root: Path):
+    """me/<profile>/{gi.pdf,summary.txt} plus me/profile.png in a scratch dir"""
+    for profile in ("ai", "power_platform"):
+        folder = root / "me" / profile
+        folder.mkdir(parents=True)
+        shutil.copy(REPO / "me" / "gi.pdf", folder / "gi.pdf")
+        (folder / "summary.txt").write_text(f"Summary for the {profile} profile.", encoding="utf-8")
+    (root / "me" / "profile.png").write_bytes(b"")
+
+
+def test_hot_reload():
+    workdir = Path(tempfile.mkdtemp())
+    _profile_tree(workdir)
+    os.chdir(workdir)
+    try:
+        from app.assistant.answer_cache import AnswerCache
+        from app.assistant.config.non_ai import ResumeConfig
+        from app.assistant.profiles import ProfileRegistry
+        from app.assistant.reloader import ProfileReloader
+
+        original_configs = ResumeConfig.PROFILE_CONFIGS
+        config_copy = workdir / "non_ai.py"
+        shutil.copy(REPO / "app" / "assistant" / "config" / "non_ai.py", config_copy)
+
+        registry = ProfileRegistry.load(names=["ai", "power_platform"])
+        cache = AnswerCache()
+        cache.store("k", "cached answer")
+        reloader = ProfileReloader(registry, cache, config_path=config_copy)
+        assert reloader.check() == []
+
+        # Summary edit: applied once stable, PDF text reused as is
+        before = registry.get("ai")
+        (workdir / "me" / "ai" / "summary.txt").write_text("Now also a Rust developer.", encoding="utf-8")
+        assert reloader.check() == []  # Still settling
+        assert reloader.check() == ["ai"]
+        after = registry.get("ai")
+        assert after is not before and "Rust developer" in after.summary
+        assert after.resume is before.resume and after.resume_sha == before.resume_sha
+        assert before.summary == "Summary for the ai profile."  # In-flight holders keep the old one
+        assert registry.get("power_platform").summary == "Summary for the power_platform profile."
+        assert cache.get("k") is None
+
+        # PDF content change: new hash, text extracted again
+        with open(workdir / "me" / "power_platform" / "gi.pdf", "ab") as f:
+            f.write(b"\n% revised\n")
+        assert reloader.reload() == ["power_platform"]
+        assert registry.get("power_platform").resume_sha != before.resume_sha
+
+        # non_ai.py edit: PERSONAL changes reach every profile
+        config_copy.write_text(
+            config_copy.read_text(encoding="utf-8").replace('"title": "AI Engineer"', '"title": "Staff AI Engineer"'),
+            encoding="utf-8"
+        )
+        assert reloader.reload() == ["ai", "power_platform"]
+        assert registry.get("ai").personal["title"] == "Staff AI Engineer"
+
+        # A broken config keeps the current settings
+        config_copy.write_text("this is not python", encoding="utf-8")
+        reloader.reload()
+        assert reloader.stats()["failures"] == 1
+        assert registry.get("ai").personal["title"] == "Staff AI Engineer"
+        ResumeConfig.PROFILE_CONFIGS = original_configs
+    finally:
+        os.chdir(REPO)
+        shutil.rmtree(workdir, ignore_errors=True)
+    print("SUCCESS: profile edits are hot reloaded.")
+
+
+if __name__ == "__main__":
+    test_hot_reload()
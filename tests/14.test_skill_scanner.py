@@ -0,0 +1,77 @@
+# ------------------------------------------------------------------------------
+# File: tests/14.test_skill_scanner.py
+# Purpose: Verify the single-pass SkillScanner: every category from one scan,
+#          overlapping and prefix terms, Terraform-only terms, requirements-only
+#          packages, and the same result with and without pyahocorasick.
+#
+# How to Run:
+#   python tests/14.test_skill_scanner.py
+#
+# Expected Output:
+#   SUCCESS: skill scanner finds every category in one pass.
+# ------------------------------------------------------------------------------
+import os
+import sys
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github import skills
+from app.github.skills import SkillScanner, TermMatcher
+
+
+def doc(file_name, text):
+    return SimpleNamespace(text=text, metadata={"file_name": file_name})
+
+
+REPO = [
+    doc("Dockerfile", "FROM python:3.11\n"),
+    doc("deploy/app.yaml", "apiVersion: apps/v1\nkind: Deployment\n"),
+    doc("scripts/release.sh", "helm install resume ./chart\n"),
+    doc("app/main.py", "import boto3\nclient = OpenAI()\nmodel = AutoModelForCausalLM.from_pretrained(x)\n"),
+    doc("requirements.txt", "openai==1.97.0\n# torch is optional\nsentence-transformers\n"),
+    doc("infra/main.tf", 'resource "aws_s3_bucket" "b" {}\n'),
+    doc("go.mod", "module example.com/resume\n"),
+]
+
+EXPECTED = {
+    "languages": ["Python", "YAML"],
+    "devops": ["Docker", "Helm", "Kubernetes"],
+    "ai_components": ["HuggingFace", "OpenAI", "Sentence Transformers"],
+    "aws_resources": ["AWS SDK (Python)", "Amazon S3"],
+    "frameworks": ["Docker", "Go", "Python"],
+}
+
+
+def check_scanner():
+    result = SkillScanner().scan(REPO)
+    assert result == EXPECTED, result
+
+    # Terraform resource names without a .tf file are ignored
+    no_tf = SkillScanner().scan([doc("notes.md", "aws_s3_bucket and aws_instance")])
+    assert no_tf["aws_resources"] == [], no_tf
+
+    # Packages outside requirements files don't count as dependencies
+    code_only = SkillScanner().scan([doc("train.py", "import torch")])
+    assert code_only["ai_components"] == [], code_only
+
+    # Prefix and overlapping terms are all reported
+    matcher = TermMatcher({"helm": ["a"], "helm install": ["b"], "install": ["c"], "arn:aws:s3": ["d"], "s3": ["e"]})
+    assert matcher.tags("run helm install then arn:aws:s3") == {"a", "b", "c", "d", "e"}
+
+
+def test_skill_scanner():
+    check_scanner()
+    if skills.ahocorasick is not None:
+        # Same answers from the regex fallback
+        skills.ahocorasick, automaton = None, skills.ahocorasick
+        try:
+            check_scanner()
+        finally:
+            skills.ahocorasick = automaton
+    print("SUCCESS: skill scanner finds every category in one pass.")
+
+
+if __name__ == "__main__":
+    test_skill_scanner()
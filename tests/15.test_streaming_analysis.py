@@ -0,0 +1,116 @@
+# ------------------------------------------------------------------------------
+# File: tests/15.test_streaming_analysis.py
+# Purpose: Verify that repository files are streamed: the tree source lists
+#          blobs and skips binary files, and skill detection over a generator
+#          of files peaks near the largest file, not the total repo size.
+#
+# How to Run:
+#   python tests/15.test_streaming_analysis.py
+#
+# Expected Output:
+#   SUCCESS: repository files are processed as a stream.
+# ------------------------------------------------------------------------------
+import os
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github.memory import MemoryProbe
+from app.github.skills import SkillScanner
+from app.github.source import GithubTreeSource, parse_repo_url
+
+
+class FakeSession:
+    """Answers the two git data API calls the source makes"""
+
+    headers = {}
+
+    def __init__(self, tree, blobs):
+        self.tree, self.blobs, self.calls = tree, blobs, []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        if "/git/trees/" in url:
+            body, content = {"tree": self.tree, "truncated": False}, b""
+        else:
+            body, content = None, self.blobs[url.rsplit("/", 1)[-1]]
+        return SimpleNamespace(json=lambda: body, content=content, raise_for_status=lambda: None)
+
+
+def test_tree_source():
+    assert parse_repo_url("https://github.com/octo/resume.git/") == ("octo", "resume")
+
+    source = GithubTreeSource(token="x", max_file_bytes=100)
+    source.session = FakeSession(
+        tree=[
+            {"path": "app/main.py", "sha": "a", "size": 12, "type": "blob"},
+            {"path": "logo.png", "sha": "b", "size": 8, "type": "blob"},
+            {"path": "app", "sha": "c", "type": "tree"},
+            {"path": "data.csv", "sha": "d", "size": 500, "type": "blob"},
+        ],
+        blobs={"a": b"import boto3", "b": b"\x89PNG\0\0\0"},
+    )
+    entries = source.list_tree("octo", "resume", "main")
+    assert [e["path"] for e in entries] == ["app/main.py", "logo.png", "data.csv"]
+    with source.meter() as meter:
+        assert source.read_blob("octo", "resume", "a") == "import boto3"
+        assert source.read_blob("octo", "resume", "b") is None  # Binary
+    assert meter == {"calls": 2, "bytes": 19} and source.calls == 3
+
+    # Oversized and binary files are never yielded
+    assert [entry["path"] for entry, _ in source.iter_texts("octo", "resume", entries)] == ["app/main.py"]
+
+
+def test_streaming_memory():
+    file_chars, files = 200_000, 100
+
+    def stream():
+        for i in range(files):
+            # Each file is built only when the consumer asks for it
+            yield f"services/svc_{i}.py", ("import boto3\n" + "x = 1\n" * (file_chars // 6))
+
+    accumulator = SkillScanner().accumulator()
+    with MemoryProbe(trace=True) as probe:
+        for name, text in stream():
+            probe.record(text)
+            accumulator.add(name, text)
+    stats = probe.stats()
+
+    assert accumulator.result()["aws_resources"] == ["AWS SDK (Python)"]
+    assert stats["files"] == files
+    total = stats["total_kb"] * 1024
+    peak = stats["traced_peak_mb"] * 1e6
+    # A file, its lowercased copy and matcher state; nowhere near the ~20 MB repo
+    assert peak < total / 10, stats
+    print(f"  {stats}")
+
+
+def test_probe_tracing():
+    # Off by default: no allocation tracing around production analyses
+    with MemoryProbe() as probe:
+        assert not tracemalloc.is_tracing()
+        probe.record("x" * 10)
+    assert "traced_peak_mb" not in probe.stats() and probe.stats()["files"] == 1
+
+    # Overlapping probes (concurrent analyses): the first to exit neither
+    # stops tracing nor resets the peak the other one is measuring
+    outer, inner = MemoryProbe(trace=True), MemoryProbe(trace=True)
+    outer.__enter__()
+    block = bytearray(5_000_000)
+    inner.__enter__()
+    del block
+    inner.__exit__(None, None, None)
+    assert tracemalloc.is_tracing()
+    outer.__exit__(None, None, None)
+    assert not tracemalloc.is_tracing()
+    assert inner.traced_peak_bytes >= 5_000_000 and outer.traced_peak_bytes >= 5_000_000
+
+
+if __name__ == "__main__":
+    test_tree_source()
+    test_streaming_memory()
+    test_probe_tracing()
+    print("SUCCESS: repository files are processed as a stream.")
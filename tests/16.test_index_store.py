@@ -0,0 +1,64 @@
+# ------------------------------------------------------------------------------
+# File: tests/16.test_index_store.py
+# Purpose: Verify IndexStore's on-disk layout: one folder per repo, commit SHA
+#          and embedding model, atomic writes marked complete by meta.json,
+#          pruning of old SHAs and misses for unknown commits.
+#
+# How to Run:
+#   python tests/16.test_index_store.py
+#
+# Expected Output:
+#   SUCCESS: indexes are persisted per repo, commit and model.
+# ------------------------------------------------------------------------------
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github.index_store import IndexStore
+
+REPO_URL = "https://github.com/octo/resume"
+
+
+def fake_index():
+    """Stands in for a VectorStoreIndex: persist() writes one storage file"""
+    def persist(persist_dir):
+        with open(os.path.join(persist_dir, "docstore.json"), "w") as f:
+            f.write("{}")
+    return SimpleNamespace(storage_context=SimpleNamespace(persist=persist))
+
+
+def test_index_store():
+    root = tempfile.mkdtemp()
+    try:
+        store = IndexStore(root=root, keep=2)
+        assert store.load(REPO_URL, "a" * 40, "text-embedding-ada-002") is None
+        assert store.stats()["misses"] == 1
+
+        folder = store.save(fake_index(), REPO_URL, "a" * 40, "text-embedding-ada-002", {"skills": {"languages": ["Python"]}})
+        assert folder == store.path(REPO_URL + "/", "a" * 40, "text-embedding-ada-002")
+        meta = json.loads((folder / "meta.json").read_text())
+        assert meta["sha"] == "a" * 40 and meta["skills"] == {"languages": ["Python"]}
+
+        # A different embedding model gets its own index
+        assert store.path(REPO_URL, "a" * 40, "text-embedding-3-small") != folder
+
+        # Only the newest `keep` commits survive, and no staging folders are left
+        for sha in ("b" * 40, "c" * 40):
+            time.sleep(0.01)
+            store.save(fake_index(), REPO_URL, sha, "text-embedding-ada-002")
+        names = sorted(p.name[:1] for p in store.repo_dir(REPO_URL).iterdir())
+        assert names == ["b", "c"], names
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    print("SUCCESS: indexes are persisted per repo, commit and model.")
+
+
+if __name__ == "__main__":
+    test_index_store()
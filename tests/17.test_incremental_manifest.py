@@ -0,0 +1,185 @@
+# ------------------------------------------------------------------------------
+# File: tests/17.test_incremental_manifest.py
+# Purpose: Verify incremental re-analysis: diffing a stored per-file manifest
+#          against the current tree, recomputing repo skills from cached
+#          per-file findings, and RepoAnalyzer._build_index updating a stored
+#          index in place (against the local fake OpenAI server and a local
+#          git repo) after a file is modified, deleted or failed to fetch.
+#
+# How to Run:
+#   python tests/17.test_incremental_manifest.py
+#   (the _build_index part needs llama_index and git; it is skipped without them)
+#
+# Expected Output:
+#   SUCCESS: only changed files need to be re-analysed.
+# ------------------------------------------------------------------------------
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github.manifest import build_manifest, diff_tree
+from app.github.skills import SkillScanner
+
+FILES = {
+    "app/main.py": ("1", "import boto3\n"),
+    "infra/main.tf": ("2", 'resource "aws_s3_bucket" "b" {}\n'),
+    "requirements.txt": ("3", "openai==1.97.0\n"),
+    "logo.png": ("4", None),  # Listed, never indexed
+}
+
+
+def entries(files):
+    return [{"path": path, "sha": sha, "size": 10} for path, (sha, _) in files.items()]
+
+
+def test_incremental_manifest():
+    scanner = SkillScanner()
+    manifest = build_manifest(entries(FILES))
+    for path, (_, text) in FILES.items():
+        if text is not None:
+            manifest[path]["skills"] = scanner.detect(os.path.basename(path), text)
+
+    # Per-file findings combine to the same answer as a full scan
+    full = scanner.scan([
+        type("Doc", (), {"text": text, "metadata": {"file_name": os.path.basename(path)}})
+        for path, (_, text) in FILES.items() if text is not None
+    ])
+    combined = scanner.combine(f["skills"] for f in manifest.values() if f["skills"] is not None)
+    assert combined == full, (combined, full)
+    assert "Amazon S3" in combined["aws_resources"]
+
+    # New commit: one file edited, Terraform removed, a file added
+    current = dict(FILES)
+    current["app/main.py"] = ("5", "from langchain import x\n")
+    current.pop("infra/main.tf")
+    current["README.md"] = ("6", "docs\n")
+    diff = diff_tree(manifest, entries(current))
+    assert [e["path"] for e in diff.added] == ["README.md"]
+    assert [e["path"] for e in diff.modified] == ["app/main.py"]
+    assert diff.removed == ["infra/main.tf"]
+    assert diff.stats() == {"added": 1, "modified": 1, "removed": 1, "unchanged": 2}
+
+    # Apply it as RepoAnalyzer does: only the changed files are scanned again
+    for path in diff.removed + [e["path"] for e in diff.modified]:
+        manifest.pop(path)
+    manifest.update(build_manifest(diff.changed))
+    for entry in diff.changed:
+        manifest[entry["path"]]["skills"] = scanner.detect(os.path.basename(entry["path"]), current[entry["path"]][1])
+    skills = scanner.combine(f["skills"] for f in manifest.values() if f["skills"] is not None)
+
+    assert skills["aws_resources"] == [], skills  # boto3 and the .tf file are gone
+    assert skills["ai_components"] == ["LangChain", "OpenAI"], skills
+    assert skills["languages"] == ["Markdown", "Python"], skills
+
+
+def git_commit(repo: Path, files: dict, message: str) -> None:
+    """Write files (None deletes one) and commit them"""
+    env = {**os.environ, "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@example.com",
+           "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@example.com"}
+    for path, text in files.items():
+        if text is None:
+            (repo / path).unlink()
+        else:
+            (repo / path).parent.mkdir(parents=True, exist_ok=True)
+            (repo / path).write_text(text)
+    subprocess.run(["git", "-C", str(repo), "add", "-A"], check=True, capture_output=True, env=env)
+    subprocess.run(["git", "-C", str(repo), "commit", "--quiet", "-m", message], check=True, capture_output=True, env=env)
+
+
+def test_build_index():
+    if importlib.util.find_spec("llama_index") is None or shutil.which("git") is None:
+        print("  llama_index or git not installed; _build_index skipped")
+        return
+    from app.github.analyzer import RepoAnalyzer
+    from app.github.embedding_cache import EmbeddingCache
+    from app.github.git_mirror import GitMirrorSource
+    from app.github.index_store import IndexStore
+    from app.llm.client import configure_llama_index
+    from app.llm.fake_server import FakeServerConfig, create_server
+
+    server = create_server(port=0, server_config=FakeServerConfig(latency="fixed:0", embedding_dimensions=8))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        configure_llama_index()
+        repo_path = tmp / "octo" / "resume"
+        repo_path.mkdir(parents=True)
+        subprocess.run(["git", "init", "--quiet", str(repo_path)], check=True)
+        git_commit(repo_path, {path: text for path, (_, text) in FILES.items() if text is not None}, "first")
+
+        analyzer = object.__new__(RepoAnalyzer)  # Only what _build_index uses
+        analyzer.source = GitMirrorSource(root=str(tmp / "mirrors"))
+        analyzer.indexes = IndexStore(root=str(tmp / "indexes"))
+        analyzer.embeddings = EmbeddingCache(root=str(tmp / "embeddings"))
+        analyzer.skills = SkillScanner()
+        analyzer.index_batch = 2
+        analyzer.incremental = True
+        model = analyzer._embedding_model()
+
+        def build(fail=()):
+            repo_url = str(repo_path)
+            owner, repo = analyzer.source.locate(repo_url)
+            sha = analyzer.source.head_sha(owner, repo, "HEAD")
+            iter_texts = type(analyzer.source).iter_texts
+
+            def flaky_iter_texts(source, owner, repo, entries, failed=None):
+                # Files in fail "could not be fetched", as on a network error
+                for entry, text in iter_texts(source, owner, repo, entries, failed):
+                    if entry["path"] in fail:
+                        failed.append(entry["path"])
+                    else:
+                        yield entry, text
+
+            analyzer.source.iter_texts = flaky_iter_texts.__get__(analyzer.source)
+            try:
+                return analyzer._build_index(repo_url, owner, repo, sha, model)
+            finally:
+                del analyzer.source.iter_texts
+
+        def documents(index):
+            return sorted(index.docstore.get_all_ref_doc_info())
+
+        # First analysis: requirements.txt fails to fetch and is left out of the manifest
+        index, meta = build(fail={"requirements.txt"})
+        assert documents(index) == ["app/main.py", "infra/main.tf"], documents(index)
+        assert meta["failed"] == ["requirements.txt"] and "requirements.txt" not in meta["files"]
+
+        # Same commit again: the failed file is fetched now, nothing else is re-embedded
+        index, meta = build()
+        assert meta["changes"] == {"added": 1, "modified": 0, "removed": 0, "unchanged": 2}, meta["changes"]
+        assert documents(index) == ["app/main.py", "infra/main.tf", "requirements.txt"]
+        assert meta["embeddings"]["chunks"] == 1 and not meta["failed"], meta["embeddings"]
+
+        # Modify one file and delete another: the stored index is updated in place
+        git_commit(repo_path, {"app/main.py": "from langchain import x\n", "infra/main.tf": None}, "second")
+        index, meta = build()
+        assert meta["changes"] == {"added": 0, "modified": 1, "removed": 1, "unchanged": 1}, meta["changes"]
+        assert documents(index) == ["app/main.py", "requirements.txt"], documents(index)
+        assert "langchain" in analyzer._file_text(index, "app/main.py")
+        assert "boto3" not in analyzer._file_text(index, "app/main.py")
+        assert meta["embeddings"]["embedded"] == 1, meta["embeddings"]
+        assert meta["skills"]["aws_resources"] == [] and "LangChain" in meta["skills"]["ai_components"]
+
+        # What was saved is what a later analysis of the commit loads
+        sha = analyzer.source.head_sha(*analyzer.source.locate(str(repo_path)), "HEAD")
+        stored, stored_meta = analyzer.indexes.load(str(repo_path), sha, model)
+        assert documents(stored) == documents(index) and stored_meta["files"] == meta["files"]
+    finally:
+        server.shutdown()
+        os.environ.pop("OPENAI_BASE_URL", None)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_incremental_manifest()
+    test_build_index()
+    print("SUCCESS: only changed files need to be re-analysed.")
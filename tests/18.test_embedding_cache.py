@@ -0,0 +1,78 @@
+# ------------------------------------------------------------------------------
+# File: tests/18.test_embedding_cache.py
+# Purpose: Verify the content-addressed embedding cache: hits across
+#          instances (runs), whitespace-only differences share a vector,
+#          models and output dimensions don't, float16 storage round-trips,
+#          an unrecorded partial write doesn't shift later rows, and usage
+#          counting.
+#
+# How to Run:
+#   python tests/18.test_embedding_cache.py
+#
+# Expected Output:
+#   SUCCESS: embeddings are cached by content and model.
+# ------------------------------------------------------------------------------
+import os
+import shutil
+import sys
+import tempfile
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github.embedding_cache import EmbeddingCache, EmbeddingUsage, model_id
+
+MODEL = "text-embedding-ada-002"
+LICENSE = "MIT License\r\n\r\nPermission is hereby granted   \r\n"
+
+
+def test_embedding_cache():
+    root = tempfile.mkdtemp()
+    try:
+        cache = EmbeddingCache(root=root, dtype="float16")
+        assert cache.get_many(MODEL, [LICENSE, "readme"]) == [None, None]
+        cache.put_many(MODEL, [LICENSE, "readme"], [[0.25, -0.5, 1.0], [0.125, 0.0, -1.0]])
+
+        # A new instance (another run) reads the same files
+        again = EmbeddingCache(root=root, dtype="float16")
+        normalized = "MIT License\n\nPermission is hereby granted\n"
+        vectors = again.get_many(MODEL, [normalized, "readme", "other"])
+        assert vectors[0] == [0.25, -0.5, 1.0] and vectors[1] == [0.125, 0.0, -1.0] and vectors[2] is None
+        assert again.get_many("text-embedding-3-small", [LICENSE]) == [None]
+
+        # Appends after a lookup are visible (the memory map is refreshed)
+        again.put_many(MODEL, ["other"], [[1.0, 1.0, 1.0]])
+        assert again.get_many(MODEL, ["other"]) == [[1.0, 1.0, 1.0]]
+        stats = again.stats()
+        assert stats["entries"] == 3 and stats["hits"] == 3 and stats["misses"] == 2, stats
+
+        # A write that crashed before it was recorded leaves stray bytes at the
+        # end of the file; the next rows overwrite them instead of following
+        vector_file = next(again.root.glob("*.float16"))
+        with open(vector_file, "ab") as f:
+            f.write(b"\xff" * 5)
+        again.put_many(MODEL, ["next"], [[0.5, 0.5, -0.5]])
+        fresh = EmbeddingCache(root=root, dtype="float16")
+        assert fresh.get_many(MODEL, ["next", "other"]) == [[0.5, 0.5, -0.5], [1.0, 1.0, 1.0]]
+
+        # Requested output dimensions are part of the model key
+        small = SimpleNamespace(model_name="text-embedding-3-small", dimensions=None)
+        assert model_id(small) == "text-embedding-3-small"
+        small.dimensions = 256
+        assert model_id(small) == "text-embedding-3-small@256"
+        fresh.put_many(model_id(small), ["readme"], [[1.0, 0.0]])
+        small.dimensions = 512
+        assert fresh.get_many(model_id(small), ["readme"]) == [None]
+
+        usage = EmbeddingUsage(batch_size=10)
+        usage.record(chunks=25, cache_hits=20, embedded=5)
+        assert usage.stats()["embedding_calls"] == 1 and usage.stats()["calls_saved"] == 2
+        assert usage.stats()["hit_ratio"] == 0.8
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    print("SUCCESS: embeddings are cached by content and model.")
+
+
+if __name__ == "__main__":
+    test_embedding_cache()
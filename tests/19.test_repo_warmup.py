@@ -0,0 +1,70 @@
+# ------------------------------------------------------------------------------
+# File: tests/19.test_repo_warmup.py
+# Purpose: Verify the background repo warm-up: every repo is analysed with at
+#          most max_workers at a time, failures and timings are reported per
+#          repo, and a nearly exhausted GitHub rate limit is waited out.
+#
+# How to Run:
+#   python tests/19.test_repo_warmup.py
+#
+# Expected Output:
+#   SUCCESS: repos are pre-analysed in the background.
+# ------------------------------------------------------------------------------
+import os
+import sys
+import threading
+import time
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github.source import GithubTreeSource
+from app.github.warmup import RepoWarmer, repo_urls_from_env
+
+URLS = [f"https://github.com/octo/repo{i}" for i in range(6)]
+
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.source = GithubTreeSource(token="x")
+        self.lock = threading.Lock()
+        self.running = self.peak = 0
+        self.analyzed = []
+
+    def analyze(self, url):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+            self.analyzed.append(url)
+        if url.endswith("repo3"):
+            return {"summary": "Error analyzing repository: boom", "error": "boom", "skills": {}, "commits": {}}
+        return {"summary": "ok", "skills": {}, "commits": {}}
+
+
+def test_repo_warmup():
+    os.environ["GITHUB_REPOS"] = "octo/repo0, https://github.com/octo/repo1/"
+    assert repo_urls_from_env() == URLS[:2]
+
+    analyzer = FakeAnalyzer()
+    warmer = RepoWarmer(lambda: analyzer, URLS, max_workers=2, min_remaining=10).start()
+    warmer.join(timeout=5)
+    progress = warmer.progress()
+    assert sorted(analyzer.analyzed) == URLS and analyzer.peak == 2, analyzer.peak
+    assert progress["counts"] == {"done": 5, "failed": 1}, progress["counts"]
+    assert "boom" in progress["repos"][URLS[3]]["error"]
+    assert progress["repos"][URLS[0]]["seconds"] >= 0.05
+
+    # 3 calls left with 10 to keep in reserve: wait for the reset
+    analyzer = FakeAnalyzer()
+    analyzer.source.rate_remaining, analyzer.source.rate_reset = 3, time.time() + 0.3
+    started = time.perf_counter()
+    RepoWarmer(lambda: analyzer, URLS[:1], max_workers=1, min_remaining=10).start().join(timeout=5)
+    assert time.perf_counter() - started >= 0.25
+    print("SUCCESS: repos are pre-analysed in the background.")
+
+
+if __name__ == "__main__":
+    test_repo_warmup()
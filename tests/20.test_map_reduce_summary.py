@@ -0,0 +1,131 @@
+# ------------------------------------------------------------------------------
+# File: tests/20.test_map_reduce_summary.py
+# Purpose: Verify map-reduce repo summaries: files grouped by top-level
+#          directory, group summaries run concurrently within the limit, and
+#          only the groups whose files changed are summarized again. A failed
+#          group is left out (and retried next run), and the cache directory
+#          is pruned to its most recently used files.
+#
+# How to Run:
+#   python tests/20.test_map_reduce_summary.py
+#
+# Expected Output:
+#   SUCCESS: repo summaries are map-reduced and cached per group.
+# ------------------------------------------------------------------------------
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github.summarizer import ROOT_GROUP, RepoSummarizer, group_files
+
+FILES = {
+    "README.md": "1", "setup.py": "2",
+    "app/main.py": "3", "app/api/routes.py": "4",
+    "infra/main.tf": "5", "docs/guide.md": "6", "tests/test_app.py": "7",
+}
+
+
+class FakeClient:
+    """chat.completions.create that records calls and how many overlap"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls, self.running, self.peak = [], 0, 0
+        self.fail = ()  # Groups whose map call raises, like a rate limit
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, temperature):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.calls.append((model, messages[0]["content"]))
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        if any(f": {group}." in messages[0]["content"] for group in self.fail):
+            raise RuntimeError("429 Too Many Requests")
+        content = f"summary by {model}" if model == "fast" else "Paragraph one.\n\nTwo.\n\nThree."
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def test_map_reduce_summary():
+    groups = group_files(FILES, max_files=200)
+    assert list(groups) == [ROOT_GROUP, "app", "docs", "infra", "tests"]
+    assert groups["app"] == ["app/api/routes.py", "app/main.py"]
+    assert "app/api" in group_files(FILES, max_files=1)  # Oversized groups go one level deeper
+
+    root = tempfile.mkdtemp()
+    try:
+        client = FakeClient()
+        summarizer = RepoSummarizer(client, "fast", "large", cache_dir=root, max_concurrency=2)
+        read = lambda path: f"contents of {path}"
+
+        result = summarizer.summarize("octo/repo", FILES, read)
+        assert result["summary"].count("\n\n") == 2
+        assert result["groups"] == 5 and result["cached_groups"] == 0
+        assert [m for m, _ in client.calls].count("fast") == 5 and client.calls[-1][0] == "large"
+        assert client.peak == 2, client.peak
+
+        # Unchanged repo: no model calls at all
+        client.calls.clear()
+        assert summarizer.summarize("octo/repo", FILES, read)["cached_groups"] == 5
+        assert client.calls == []
+
+        # One directory changed: one map call plus the reduce
+        changed = {**FILES, "infra/main.tf": "8"}
+        result = summarizer.summarize("octo/repo", changed, read)
+        assert result["cached_groups"] == 4
+        assert [m for m, _ in client.calls] == ["fast", "large"]
+        assert "infra" in client.calls[0][1]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_failed_group_and_pruning():
+    root = tempfile.mkdtemp()
+    try:
+        client = FakeClient()
+        client.fail = ("docs",)
+        summarizer = RepoSummarizer(client, "fast", "large", cache_dir=root, max_concurrency=2)
+        read = lambda path: f"contents of {path}"
+
+        # One group fails: the other four are reduced, the partial reduce is not cached
+        result = summarizer.summarize("octo/repo", FILES, read)
+        assert result["failed_groups"] == 1 and result["summary"].count("\n\n") == 2
+        assert "## docs" not in client.calls[-1][1] and len(os.listdir(root)) == 4
+
+        # Next run: only the failed group and the reduce call the model
+        client.fail, client.calls = (), []
+        result = summarizer.summarize("octo/repo", FILES, read)
+        assert result["failed_groups"] == 0 and result["cached_groups"] == 4
+        assert [m for m, _ in client.calls] == ["fast", "large"] and "docs" in client.calls[0][1]
+
+        # Every group failing still fails the summary
+        client.fail = tuple(group_files(FILES, 200))
+        try:
+            summarizer.summarize("octo/other", FILES, read)
+            raise AssertionError("Expected the summary to fail")
+        except RuntimeError:
+            pass
+
+        # Beyond the limit, the least recently used files are deleted
+        summarizer.keep = 3
+        client.fail = ()
+        summarizer.summarize("octo/small", {"README.md": "1"}, read)
+        assert len(os.listdir(root)) == 3
+        assert summarizer.summarize("octo/small", {"README.md": "1"}, read)["cached_groups"] == 1
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_map_reduce_summary()
+    test_failed_group_and_pruning()
+    print("SUCCESS: repo summaries are map-reduced and cached per group.")
@@ -0,0 +1,141 @@
+# ------------------------------------------------------------------------------
+# File: tests/21.test_analysis_jobs.py
+# Purpose: Verify analysis jobs: submit() returns at once, duplicate submits
+#          attach to the running job, the pool bounds concurrency, stage
+#          progress is recorded with timings and watch() streams it, and an
+#          analysis that raises or returns an "error" fails its job. A job
+#          that joins an analysis already in flight (e.g. the warm-up's) still
+#          sees its stages and quick result.
+#
+# How to Run:
+#   python tests/21.test_analysis_jobs.py
+#
+# Expected Output:
+#   SUCCESS: repo analyses run as background jobs with progress.
+# ------------------------------------------------------------------------------
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github.analyzer import RepoAnalyzer
+from app.github.jobs import JobManager
+from app.llm import SingleFlight
+
+STAGES = ("fetch", "skills", "commits", "index", "summary")
+
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls, self.running, self.peak = 0, 0, 0
+
+    def analyze(self, url, progress=None, on_quick=None):
+        with self.lock:
+            self.calls += 1
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            for stage in STAGES:
+                progress(stage, "10 files" if stage == "index" else "")
+                time.sleep(0.03)
+                if stage == "commits":
+                    on_quick({"summary": "quick", "skills": {}, "commits": {}, "phase": "quick"})
+                if url.endswith("broken") and stage == "index":
+                    raise RuntimeError("tree too large")
+                if url.endswith("nokey") and stage == "summary":
+                    # analyze() reports a failed deep phase in the result
+                    return {"summary": "Error analyzing repository: no API key", "error": "no API key",
+                            "skills": {}, "commits": {}}
+            return {"summary": f"summary of {url}", "skills": {}, "commits": {}}
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def test_analysis_jobs():
+    analyzer = FakeAnalyzer()
+    jobs = JobManager(lambda: analyzer, max_workers=2, stages=STAGES)
+
+    started = time.perf_counter()
+    first = jobs.submit("https://github.com/octo/a")
+    assert time.perf_counter() - started < 0.05  # Returns before the work is done
+    assert jobs.submit("https://github.com/octo/A/") == first  # Attaches to the running job
+    others = [jobs.submit(f"https://github.com/octo/{name}") for name in ("b", "c", "broken", "nokey")]
+
+    done = jobs.wait(first, timeout=5)
+    assert done["state"] == "done" and done["result"]["summary"] == "summary of https://github.com/octo/a"
+    assert all(done["stages"][s]["state"] == "done" and "seconds" in done["stages"][s] for s in STAGES)
+    assert done["stages"]["index"]["detail"] == "10 files"
+
+    nokey = jobs.wait(others[-1], timeout=5)
+    assert nokey["state"] == "failed" and nokey["error"] == "no API key" and nokey["result"]["skills"] == {}
+
+    broken = jobs.wait(others[-2], timeout=5)
+    assert broken["state"] == "failed" and "tree too large" in broken["error"]
+    assert broken["stages"]["index"]["state"] == "failed" and broken["stages"]["summary"]["state"] == "skipped"
+    for job_id in others:
+        jobs.wait(job_id, timeout=5)
+    assert analyzer.calls == 5 and analyzer.peak == 2
+    assert jobs.stats()["attached"] == 1
+
+    # A finished repo gets a new job; watch() streams its stages in order
+    async def watch():
+        job_id = jobs.submit("https://github.com/octo/a")
+        assert job_id != first
+        return [snapshot async for snapshot in jobs.watch(job_id, interval=0.01)]
+
+    snapshots = asyncio.run(watch())
+    assert snapshots[-1]["state"] == "done"
+    assert any(snap["partial"] and snap["state"] == "running" for snap in snapshots)  # Quick result came first
+    seen = [next((n for n, s in snap["stages"].items() if s["state"] == "running"), None) for snap in snapshots]
+    running = [stage for stage in dict.fromkeys(seen) if stage]
+    assert running == list(STAGES), running
+
+
+def test_joined_analysis_progress():
+    started, release = threading.Event(), threading.Event()
+
+    def analyze(repo_url, progress, on_quick):
+        for stage in STAGES:
+            progress(stage)
+            if stage == "commits":
+                on_quick({"summary": "quick", "skills": {"Python": 1}, "commits": {}, "phase": "quick"})
+                started.set()
+                release.wait(5)  # The job joins while the deep phase runs
+        return {"summary": "deep", "skills": {}, "commits": {}}
+
+    analyzer = object.__new__(RepoAnalyzer)  # No GitHub or OpenAI clients needed
+    analyzer.cache = type("NoCache", (), {"get": lambda self, url: None})()
+    analyzer.flights = SingleFlight()
+    analyzer._broadcasts, analyzer._broadcasts_lock = {}, threading.Lock()
+    analyzer._analyze = analyze
+
+    # The warm-up starts the analysis without callbacks
+    warmup = threading.Thread(target=analyzer.analyze, args=("https://github.com/octo/a",))
+    warmup.start()
+    assert started.wait(5)
+
+    jobs = JobManager(lambda: analyzer, max_workers=1, stages=STAGES)
+    job_id = jobs.submit("https://github.com/octo/a")
+    time.sleep(0.1)
+    joined = jobs.snapshot(job_id)
+    assert joined["partial"]["skills"] == {"Python": 1}, joined  # Replayed, not stuck on "queued"
+    assert [s["state"] for s in joined["stages"].values()] == ["done", "done", "running", "pending", "pending"]
+
+    release.set()
+    done = jobs.wait(job_id, timeout=5)
+    warmup.join(5)
+    assert done["state"] == "done" and done["result"]["summary"] == "deep"
+    assert all(stage["state"] == "done" for stage in done["stages"].values()), done["stages"]
+    assert analyzer.flights.stats()["coalesced"] == 1 and not analyzer._broadcasts
+
+
+if __name__ == "__main__":
+    test_analysis_jobs()
+    test_joined_analysis_progress()
+    print("SUCCESS: repo analyses run as background jobs with progress.")
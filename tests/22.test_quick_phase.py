@@ -0,0 +1,80 @@
+# ------------------------------------------------------------------------------
+# File: tests/22.test_quick_phase.py
+# Purpose: Verify the quick phase of RepoAnalyzer: skills come from the tree
+#          listing plus manifest files only (no other file is read), and the
+#          result carries metadata, commit stats and a placeholder summary.
+#
+# How to Run:
+#   python tests/22.test_quick_phase.py
+#
+# Expected Output:
+#   SUCCESS: the quick phase uses only cheap signals.
+# ------------------------------------------------------------------------------
+import os
+import sys
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github.analyzer import RepoAnalyzer
+from app.github.skills import SkillScanner, is_manifest, language_bytes
+
+CONTENTS = {
+    "requirements.txt": "openai==1.97.0\n",
+    "Dockerfile": "FROM python:3.11\n",
+    "infra/main.tf": 'resource "aws_lambda_function" "api" {}\n',
+    "app/main.py": "import boto3\n",  # Only an index would see this
+    "web/src/index.ts": "export {}\n",
+}
+
+
+class FakeSource:
+    def __init__(self):
+        self.read = []
+
+    def repo_metadata(self, owner, repo):
+        return {"full_name": f"{owner}/{repo}", "description": "Resume bot", "language": "Python",
+                "topics": ["ai", "gradio"], "stargazers_count": 3, "default_branch": "main"}
+
+    def head_sha(self, owner, repo, ref):
+        return "f" * 40
+
+    def list_tree(self, owner, repo, ref):
+        return [{"path": path, "sha": str(i), "size": len(text)} for i, (path, text) in enumerate(CONTENTS.items())]
+
+    def iter_texts(self, owner, repo, entries):
+        for entry in entries:
+            self.read.append(entry["path"])
+            yield entry, CONTENTS[entry["path"]]
+
+
+def test_quick_phase():
+    assert is_manifest("services/api/requirements-dev.txt") and is_manifest("infra/main.tf")
+    assert not is_manifest("app/main.py")
+
+    analyzer = object.__new__(RepoAnalyzer)  # No llama_index or GitHub client needed
+    analyzer.source = FakeSource()
+    analyzer.skills = SkillScanner()
+    analyzer.quick_manifests = 40
+    analyzer._analyze_commits = lambda url: {"recent_activity": {"commits_last_week": 2}}
+    stages = []
+
+    result, entries = analyzer._quick_phase("https://github.com/octo/resume", "octo", "resume",
+                                            lambda stage, detail="": stages.append(stage))
+    assert stages == ["fetch", "skills", "commits"]
+    assert sorted(analyzer.source.read) == ["Dockerfile", "infra/main.tf", "requirements.txt"]
+    assert len(entries) == len(CONTENTS)
+    assert result["phase"] == "quick" and result["sha"] == "f" * 40
+    assert result["skills"]["languages"] == ["Python", "TypeScript"]
+    assert result["skills"]["ai_components"] == ["OpenAI"]
+    assert result["skills"]["aws_resources"] == ["AWS Lambda"]  # From the .tf file, not app/main.py
+    assert "Docker" in result["skills"]["devops"]
+    assert result["language_bytes"] == language_bytes(entries) == {"Python": 13, "TypeScript": 10}
+    assert result["metadata"]["topics"] == ["ai", "gradio"]
+    assert result["summary"].startswith("**octo/resume**: Resume bot")
+    assert result["commits"]["recent_activity"]["commits_last_week"] == 2
+    print("SUCCESS: the quick phase uses only cheap signals.")
+
+
+if __name__ == "__main__":
+    test_quick_phase()
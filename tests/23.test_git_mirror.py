@@ -0,0 +1,164 @@
+# ------------------------------------------------------------------------------
+# File: tests/23.test_git_mirror.py
+# Purpose: Verify that GitMirrorSource reads a repository from git objects: a
+#          local checkout given as a path or file:// URL is listed with
+#          ls-tree, streamed through cat-file --batch (skipping binary and
+#          oversized files) and its history read with git log, without any
+#          GitHub API call. Checkouts with the same names get different keys,
+#          plain directories and subdirectories are not taken for repositories, a cat-file process that dies falls
+#          back to reading the remaining files one by one, and the token never
+#          appears on a git command line.
+#
+# How to Run:
+#   python tests/23.test_git_mirror.py
+#
+# Expected Output:
+#   SUCCESS: repositories are read from local git objects.
+# ------------------------------------------------------------------------------
+import base64
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.github.git_mirror import GitMirrorSource
+
+
+class FakeSession:
+    """Answers the git trees API call the parent source makes"""
+
+    headers = {}
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        body = {"tree": [{"path": "app/main.py", "sha": "a", "size": 12, "type": "blob"}], "truncated": False}
+        return SimpleNamespace(json=lambda: body, content=b"", headers={}, raise_for_status=lambda: None)
+
+
+def make_repo(root: Path) -> Path:
+    repo = root / "octo" / "resume"
+    (repo / "app").mkdir(parents=True)
+    env = {**os.environ, "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@example.com",
+           "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@example.com"}
+
+    def git(*args):
+        subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, env=env)
+
+    git("init", "--quiet", "--initial-branch=main")
+    (repo / "requirements.txt").write_text("boto3\nfastapi\n")
+    git("add", ".")
+    git("commit", "--quiet", "-m", "Initial commit", "--date=2024-03-01T10:00:00+02:00")
+
+    (repo / "app" / "main.py").write_text("import boto3\n")
+    (repo / "logo.png").write_bytes(b"\x89PNG\0\0\0")
+    (repo / "data.csv").write_text("x\n" * 500)
+    git("add", ".")
+    git("commit", "--quiet", "-m", "Add app\n\nWith a body.")
+    return repo
+
+
+def test_local_repository():
+    if shutil.which("git") is None:
+        print("  git not installed; skipped")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        path = make_repo(Path(tmp))
+        source = GitMirrorSource(root=os.path.join(tmp, "mirrors"), token="x", max_file_bytes=100)
+        owner, repo = source.locate(str(path))
+        assert owner.startswith("octo-") and repo == "resume", (owner, repo)
+        assert source.locate(path.as_uri()) == (owner, repo)
+        assert source.locate("https://github.com/octo/other") == ("octo", "other")
+
+        # Same parent and directory names elsewhere: a different repository
+        twin = make_repo(Path(tmp) / "elsewhere")
+        assert source.locate(str(twin)) not in ((owner, repo), None)
+        # Neither a plain directory nor one inside a checkout is a local repository
+        for directory in (Path(tmp) / "elsewhere", path / "app"):
+            assert not source._is_local(*source.locate(str(directory))), directory
+        assert len(source._local) == 2
+
+        assert source.repo_metadata(owner, repo)["default_branch"] == "main"
+        sha = source.head_sha(owner, repo, "main")
+        assert re.fullmatch(r"[0-9a-f]{40}", sha)
+
+        entries = source.list_tree(owner, repo, sha)
+        sizes = {e["path"]: e["size"] for e in entries}
+        assert sizes == {"app/main.py": 13, "data.csv": 1000, "logo.png": 7, "requirements.txt": 14}, sizes
+
+        # Oversized and binary files are never yielded
+        texts = dict((entry["path"], text) for entry, text in source.iter_texts(owner, repo, entries))
+        assert texts == {"app/main.py": "import boto3\n", "requirements.txt": "boto3\nfastapi\n"}, texts
+
+        # cat-file --batch dies after the first file: the rest are read one at a time
+        read_object = GitMirrorSource._read_object
+
+        def dying(process, sha):
+            if dying.calls:
+                process.kill()
+                process.wait()
+            dying.calls += 1
+            return read_object(process, sha)
+
+        dying.calls = 0
+        source._read_object = dying
+        failed = []
+        recovered = dict((entry["path"], text) for entry, text in source.iter_texts(owner, repo, entries, failed))
+        del source._read_object
+        assert recovered == texts and failed == [] and dying.calls == 2, (recovered, failed)
+        blobs = {e["path"]: e["sha"] for e in entries}
+        assert source.read_blob(owner, repo, blobs["requirements.txt"]) == "boto3\nfastapi\n"
+        assert source.read_blob(owner, repo, blobs["logo.png"]) is None
+
+        commits = source.list_commits(owner, repo)
+        assert [c["commit"]["message"] for c in commits] == ["Add app\n\nWith a body.", "Initial commit"]
+        assert commits[1]["commit"]["author"]["date"] == "2024-03-01T08:00:00Z"  # UTC, like the API
+
+        assert source.calls == 0  # Nothing went to GitHub
+        print(f"  {source.stats()}")
+
+
+def test_token_not_on_command_line():
+    runs = []
+
+    def run(command, **kwargs):
+        runs.append((command, kwargs["env"]))
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    source = GitMirrorSource(token="secret-token", git="git")
+    original, subprocess.run = subprocess.run, run
+    try:
+        source._git("octo", "resume", "fetch", "origin", auth=True)
+        source._git("octo", "resume", "ls-tree", "HEAD")
+    finally:
+        subprocess.run = original
+    (fetch, env), (ls_tree, plain_env) = runs
+    basic = base64.b64encode(b"x-access-token:secret-token").decode()
+    assert not any(basic in arg or "extraHeader" in arg for arg in fetch + ls_tree), fetch
+    assert env["GIT_CONFIG_KEY_0"] == "http.extraHeader" and basic in env["GIT_CONFIG_VALUE_0"]
+    assert plain_env.get("GIT_CONFIG_VALUE_0") != env["GIT_CONFIG_VALUE_0"]  # Only fetches carry the token
+
+
+def test_api_without_git():
+    source = GitMirrorSource(token="x")
+    source.git = None  # As if git were not installed
+    source.session = FakeSession()
+    entries = source.list_tree("octo", "resume", "main")
+    assert entries == [{"path": "app/main.py", "sha": "a", "size": 12}]
+    assert source.session.calls and source.calls == 1
+
+
+if __name__ == "__main__":
+    test_local_repository()
+    test_token_not_on_command_line()
+    test_api_without_git()
+    print("SUCCESS: repositories are read from local git objects.")
@@ -0,0 +1,128 @@
+# ------------------------------------------------------------------------------
+# File: tests/24.test_stream_tool_calls.py
+# Purpose: Verify ResumeAssistant streaming: tool call fragments spread over
+#          many chunks are merged per index, the tools run once the first
+#          stream ends, and the follow-up answer is streamed to the caller.
+#
+# How to Run:
+#   python tests/24.test_stream_tool_calls.py
+#   (like tests 6-8, needs the me/<profile>/ files the config validates)
+#
+# Expected Output:
+#   SUCCESS: streamed tool calls are assembled and answered.
+# ------------------------------------------------------------------------------
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.assistant.memory import SessionStore
+from app.assistant.minimal_assistant import ResumeAssistant
+from app.llm import SingleFlight
+from app.llm.router import ModelRouter
+from app.tools.executor import ToolExecutor
+
+TOOL = {"type": "function", "function": {"name": "record_user_details", "parameters": {}}}
+
+
+def fragment(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+def chunk(content=None, tool_calls=None):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content, tool_calls=tool_calls))])
+
+
+class FakeClient:
+    """Plays back one scripted stream per chat.completions.create call"""
+
+    def __init__(self, *streams):
+        self.streams = list(streams)
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        return iter(self.streams.pop(0))
+
+
+def make_assistant(client, recorded):
+    bundle = SimpleNamespace(
+        name="ai", tools=(TOOL,), prompt_hash="h", index=None, summary="s", resume="r",
+        router=ModelRouter("fast-model", "large-model", enabled=False),
+        system_prompt=lambda summary, resume: "You are a resume assistant."
+    )
+    assistant = object.__new__(ResumeAssistant)  # No profile files or API client needed
+    assistant.profiles = SimpleNamespace(get=lambda profile=None: bundle)
+    assistant.openai = client
+    assistant.tool_executor = ToolExecutor(
+        [TOOL], {"record_user_details": lambda **kwargs: recorded.append(kwargs) or {"recorded": "ok"}}
+    )
+    assistant.answer_cache = None
+    assistant.flights = SingleFlight()
+    assistant.sessions = SessionStore(token_budget=1000)
+    return assistant
+
+
+def test_merge_fragments():
+    tool_calls = {}
+    deltas = [
+        SimpleNamespace(tool_calls=[fragment(0, id="call_a", name="record_"), fragment(1, id="call_b", name="log")]),
+        SimpleNamespace(tool_calls=[fragment(0, name="user_details", arguments='{"email": '), fragment(1, arguments="{}")]),
+        SimpleNamespace(tool_calls=None),  # Content-only chunk
+        SimpleNamespace(tool_calls=[fragment(0, arguments='"a@example.com"}')]),
+    ]
+    for delta in deltas:
+        ResumeAssistant._merge_tool_call_fragments(tool_calls, delta)
+
+    assert sorted(tool_calls) == [0, 1]
+    assert tool_calls[0] == {
+        "id": "call_a", "type": "function",
+        "function": {"name": "record_user_details", "arguments": '{"email": "a@example.com"}'},
+    }
+    assert tool_calls[1]["id"] == "call_b" and tool_calls[1]["function"] == {"name": "log", "arguments": "{}"}
+
+
+def test_chat_stream_with_tool_call():
+    recorded = []
+    client = FakeClient(
+        [
+            chunk("Let me note that. "),
+            chunk(tool_calls=[fragment(0, id="call_1", name="record_user_details", arguments='{"email"')]),
+            chunk(tool_calls=[fragment(0, arguments=': "bob@example.com"}')]),
+            SimpleNamespace(choices=[]),  # Usage-only chunk
+        ],
+        [chunk("Thanks"), chunk(", Bob!")],
+    )
+    assistant = make_assistant(client, recorded)
+
+    deltas = list(assistant.chat_stream("My email is bob@example.com", session_id="s1"))
+    assert deltas == ["Let me note that. ", "Thanks", ", Bob!"], deltas
+    assert recorded == [{"email": "bob@example.com"}]
+
+    # The follow-up request carries the assembled call and its tool output
+    follow_up = client.requests[1]["messages"]
+    assert follow_up[-2]["tool_calls"][0]["function"]["arguments"] == '{"email": "bob@example.com"}'
+    assert follow_up[-1]["role"] == "tool" and json.loads(follow_up[-1]["content"]) == {"recorded": "ok"}
+    assert all(request["stream"] for request in client.requests)
+
+    # The whole streamed answer is remembered for the next turn
+    memory = assistant.sessions.get("ai:s1")
+    assert memory.turns[0][1] == "Let me note that. Thanks, Bob!"
+
+
+def test_chat_stream_without_tools():
+    client = FakeClient([chunk("Eight"), chunk(" years.")])
+    assistant = make_assistant(client, [])
+    assert "".join(assistant.chat_stream("How many years of experience?")) == "Eight years."
+    assert len(client.requests) == 1
+
+
+if __name__ == "__main__":
+    test_merge_fragments()
+    test_chat_stream_with_tool_call()
+    test_chat_stream_without_tools()
+    print("SUCCESS: streamed tool calls are assembled and answered.")
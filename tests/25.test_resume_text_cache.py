@@ -0,0 +1,84 @@
+# ------------------------------------------------------------------------------
+# File: tests/25.test_resume_text_cache.py
+# Purpose: Verify the on-disk resume text cache: the first load extracts the
+#          PDF, later loads are served from the cache file, and a PDF with new
+#          content (new SHA-256) is extracted again.
+#
+# How to Run:
+#   python tests/25.test_resume_text_cache.py
+#   (like tests 6-8, needs the me/<profile>/ files the config validates)
+#
+# Expected Output:
+#   SUCCESS: resume text is cached by PDF hash.
+# ------------------------------------------------------------------------------
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.assistant import resume_loader
+from app.assistant.resume_loader import file_sha256, load_resume_text
+
+
+def write_pdf(path: Path, text: str):
+    """Write a one-page PDF showing text in Helvetica"""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf, offsets = b"%PDF-1.4\n", []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(pdf)
+
+
+def test_resume_text_cache():
+    extractions = []
+    extract = resume_loader.extract_pdf_text
+
+    def counting_extract(path):
+        extractions.append(path)
+        return extract(path)
+
+    resume_loader.extract_pdf_text = counting_extract
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf, cache_dir = Path(tmp) / "resume.pdf", Path(tmp) / "cache"
+            write_pdf(pdf, "Senior Power Platform Developer")
+
+            # Miss: extracted and written to <sha256>_pypdf-<version>.txt
+            assert "Power Platform" in load_resume_text(pdf, cache_dir)
+            assert len(extractions) == 1
+            cached = list(cache_dir.glob("*.txt"))
+            assert [p.name.split("_")[0] for p in cached] == [file_sha256(pdf)]
+
+            # Hit: the PDF is not parsed again
+            assert "Power Platform" in load_resume_text(pdf, cache_dir)
+            assert len(extractions) == 1
+
+            # A new PDF has a new hash, so the stale text is never served
+            write_pdf(pdf, "Staff AI Engineer")
+            text = load_resume_text(pdf, cache_dir)
+            assert "AI Engineer" in text and "Power Platform" not in text
+            assert len(extractions) == 2 and len(list(cache_dir.glob("*.txt"))) == 2
+            assert not list(cache_dir.glob("*.tmp"))  # Written then renamed
+    finally:
+        resume_loader.extract_pdf_text = extract
+
+
+if __name__ == "__main__":
+    test_resume_text_cache()
+    print("SUCCESS: resume text is cached by PDF hash.")
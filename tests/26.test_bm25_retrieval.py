@@ -0,0 +1,88 @@
+# ------------------------------------------------------------------------------
+# File: tests/26.test_bm25_retrieval.py
+# Purpose: Verify BM25 retrieval over the resume: rare query terms outrank
+#          common ones, context_for() keeps within its token budget and top_k,
+#          returns chunks in reading order per section, and falls back to the
+#          leading chunks when nothing in the query matches.
+#
+# How to Run:
+#   python tests/26.test_bm25_retrieval.py
+#   (like tests 6-8, needs the me/<profile>/ files the config validates)
+#
+# Expected Output:
+#   SUCCESS: BM25 retrieval ranks and budgets resume context.
+# ------------------------------------------------------------------------------
+import os
+import sys
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.assistant.retrieval import Chunk, ResumeIndex, chunk_text, tokenize
+from app.assistant.tokens import count_tokens
+
+CHUNKS = [
+    Chunk("summary", 0, "Developer with experience in Power Platform and SharePoint."),
+    Chunk("resume", 0, "Built Power Automate flows and Power Apps for finance teams."),
+    Chunk("resume", 1, "Deployed Kubernetes clusters on AWS with Terraform."),
+    Chunk("resume", 2, "Power BI dashboards and Power Apps forms for field staff."),
+    Chunk("resume", 3, "Led migration of SharePoint sites; mentored two developers."),
+]
+
+
+def test_tokenize_and_chunking():
+    assert tokenize("C#, Node.js and CI/CD.") == ["c#", "node.js", "and", "ci", "cd"]
+
+    words = " ".join(f"w{i}" for i in range(250))
+    chunks = chunk_text(words, "resume", max_words=100, overlap=20)
+    assert [c.position for c in chunks] == [0, 1, 2]
+    assert chunks[1].text.split()[0] == "w80"  # 20 words of overlap
+    assert chunks[-1].text.split()[-1] == "w249"
+    assert chunk_text("   ", "summary") == []
+
+
+def test_ranking():
+    index = ResumeIndex(CHUNKS)
+
+    # "kubernetes" is in one chunk; "power" in three, so it weighs less
+    ranked = index.search("Power Kubernetes", top_k=5)
+    assert ranked[0][0] == 2, ranked
+    assert {i for i, _ in ranked} == {0, 1, 2, 3}
+    assert all(a[1] >= b[1] for a, b in zip(ranked, ranked[1:]))
+
+    # Unknown words score nothing
+    assert index.search("hello there") == []
+    assert [i for i, _ in index.search("sharepoint", top_k=1)] in ([0], [4])
+
+
+def test_context_budget():
+    index = ResumeIndex(CHUNKS)
+    budget = count_tokens(CHUNKS[1].text) + count_tokens(CHUNKS[3].text)
+
+    summary, resume = index.context_for("Power Apps", top_k=6, token_budget=budget)
+    used = count_tokens(summary) + count_tokens(resume)
+    assert used <= budget + 2, (used, budget)  # Separators aside
+    # Both Power Apps chunks fit and stay in reading order
+    assert resume == f"{CHUNKS[1].text}\n...\n{CHUNKS[3].text}"
+    assert summary == ""
+
+    # top_k caps the chunk count even with budget to spare
+    summary, resume = index.context_for("power sharepoint", top_k=2, token_budget=10_000)
+    assert sum(len(section.split("\n...\n")) for section in (summary, resume) if section) == 2
+
+    # A chunk over the budget is skipped, smaller ones after it still fit
+    big = Chunk("resume", 5, "Kubernetes " * 400)
+    index = ResumeIndex(CHUNKS + [big])
+    _, resume = index.context_for("kubernetes", top_k=6, token_budget=count_tokens(CHUNKS[2].text))
+    assert resume == CHUNKS[2].text
+
+    # No matching terms: leading chunks still ground greetings
+    summary, resume = index.context_for("hi!", top_k=2, token_budget=10_000)
+    assert summary == CHUNKS[0].text and resume == CHUNKS[1].text
+
+
+if __name__ == "__main__":
+    test_tokenize_and_chunking()
+    test_ranking()
+    test_context_budget()
+    print("SUCCESS: BM25 retrieval ranks and budgets resume context.")
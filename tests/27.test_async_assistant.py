@@ -0,0 +1,159 @@
+# ------------------------------------------------------------------------------
+# File: tests/27.test_async_assistant.py
+# Purpose: Verify AsyncResumeAssistant on one event loop: chat_stream yields
+#          deltas, runs streamed tool calls and streams the follow-up, chat()
+#          answers, concurrent identical openers share one upstream call, and
+#          answer cache lookups and stores run off the event loop.
+#
+# How to Run:
+#   python tests/27.test_async_assistant.py
+#   (like tests 6-8, needs the me/<profile>/ files the config validates)
+#
+# Expected Output:
+#   SUCCESS: async assistant streams and answers on one event loop.
+# ------------------------------------------------------------------------------
+import asyncio
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.assistant.async_assistant import AsyncResumeAssistant
+from app.assistant.memory import SessionStore
+from app.llm import AsyncSingleFlight
+from app.llm.router import ModelRouter
+from app.tools.executor import ToolExecutor
+
+TOOL = {"type": "function", "function": {"name": "record_user_details", "parameters": {}}}
+
+
+def fragment(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+def chunk(content=None, tool_calls=None):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content, tool_calls=tool_calls))])
+
+
+class FakeAsyncClient:
+    """Awaitable chat.completions.create playing back scripted responses"""
+
+    def __init__(self, *responses, delay=0.0):
+        self.responses = list(responses)
+        self.requests = []
+        self.delay = delay
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        await asyncio.sleep(self.delay)
+        response = self.responses.pop(0)
+        if not kwargs.get("stream"):
+            return response
+
+        async def stream():
+            for item in response:
+                await asyncio.sleep(0)
+                yield item
+        return stream()
+
+
+def make_assistant(client, recorded):
+    bundle = SimpleNamespace(
+        name="ai", tools=(TOOL,), prompt_hash="h", index=None, summary="s", resume="r",
+        router=ModelRouter("fast-model", "large-model"),
+        system_prompt=lambda summary, resume: "You are a resume assistant."
+    )
+    assistant = object.__new__(AsyncResumeAssistant)  # No profile files or API client needed
+    assistant.profiles = SimpleNamespace(get=lambda profile=None: bundle)
+    assistant.openai = client
+    assistant.tool_executor = ToolExecutor(
+        [TOOL], {"record_user_details": lambda **kwargs: recorded.append(kwargs) or {"recorded": "ok"}}
+    )
+    assistant.answer_cache = None
+    assistant.flights = AsyncSingleFlight()
+    assistant.sessions = SessionStore(token_budget=1000)
+    return assistant
+
+
+async def _test_chat_stream():
+    recorded = []
+    client = FakeAsyncClient(
+        [
+            chunk("Noted. "),
+            chunk(tool_calls=[fragment(0, id="call_1", name="record_user_details", arguments='{"email": ')]),
+            chunk(tool_calls=[fragment(0, arguments='"bob@example.com"}')]),
+        ],
+        [chunk("Thanks"), chunk(", Bob!")],
+    )
+    assistant = make_assistant(client, recorded)
+
+    deltas = [delta async for delta in assistant.chat_stream("My email is bob@example.com", session_id="s1")]
+    assert deltas == ["Noted. ", "Thanks", ", Bob!"], deltas
+    assert recorded == [{"email": "bob@example.com"}]
+    assert client.requests[1]["messages"][-1]["role"] == "tool"
+    assert assistant.sessions.get("ai:s1").turns[0][1] == "Noted. Thanks, Bob!"
+
+
+async def _test_chat_and_coalescing():
+    answer = SimpleNamespace(choices=[SimpleNamespace(
+        finish_reason="stop", message=SimpleNamespace(content="girma@example.com", tool_calls=None)
+    )])
+    client = FakeAsyncClient(answer, delay=0.05)
+    assistant = make_assistant(client, [])
+
+    # Five visitors ask the same opener at once: one upstream call
+    answers = await asyncio.gather(*(assistant.chat("What is your email?") for _ in range(5)))
+    assert answers == ["girma@example.com"] * 5 and len(client.requests) == 1
+    assert client.requests[0]["model"] == "fast-model"  # A contact lookup
+
+    stats = assistant.flights.stats()
+    assert stats["executions"] == 1 and stats["coalesced"] == 4, stats
+
+
+class ThreadRecordingCache:
+    """Answer cache that records which thread each call runs on"""
+
+    def __init__(self):
+        self.answers, self.threads = {}, []
+
+    def make_key(self, question, profile, prompt_hash):
+        self.threads.append(threading.get_ident())
+        return f"{profile}:{question}"
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return self.answers.get(key)
+
+    def store(self, key, answer):
+        self.threads.append(threading.get_ident())
+        self.answers[key] = answer
+
+
+async def _test_cache_off_loop():
+    answer = SimpleNamespace(choices=[SimpleNamespace(
+        finish_reason="stop", message=SimpleNamespace(content="girma@example.com", tool_calls=None)
+    )])
+    client = FakeAsyncClient(answer, [chunk("Azure, "), chunk("AWS")])
+    assistant = make_assistant(client, [])
+    assistant.answer_cache = ThreadRecordingCache()
+
+    assert await assistant.chat("What is your email?") == "girma@example.com"
+    assert await assistant.chat("What is your email?") == "girma@example.com"  # Cached
+    assert [d async for d in assistant.chat_stream("Which clouds?", session_id="s2")] == ["Azure, ", "AWS"]
+    assert len(client.requests) == 2 and assistant.answer_cache.answers["ai:Which clouds?"] == "Azure, AWS"
+    assert threading.get_ident() not in assistant.answer_cache.threads
+
+
+def test_async_assistant():
+    asyncio.run(_test_chat_stream())
+    asyncio.run(_test_chat_and_coalescing())
+    asyncio.run(_test_cache_off_loop())
+
+
+if __name__ == "__main__":
+    test_async_assistant()
+    print("SUCCESS: async assistant streams and answers on one event loop.")
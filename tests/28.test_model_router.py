@@ -0,0 +1,91 @@
+# ------------------------------------------------------------------------------
+# File: tests/28.test_model_router.py
+# Purpose: Pin the model router's decisions for representative resume
+#          questions: only short contact and fact lookups go to the fast
+#          model; experience questions, reasoning and anything ambiguous go
+#          to the large model, as does everything when routing is disabled.
+#
+# How to Run:
+#   python tests/28.test_model_router.py
+#
+# Expected Output:
+#   SUCCESS: model router sends only simple lookups to the fast model.
+# ------------------------------------------------------------------------------
+import os
+import sys
+from types import SimpleNamespace
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.llm.router import ModelRouter
+
+FAST = [
+    "What is your email?",
+    "What's your phone number?",
+    "Can I have your LinkedIn?",
+    "Where are you located?",
+    "What degree do you have?",
+    "Which certifications do you hold?",
+    "Are you willing to relocate?",
+]
+
+LARGE = [
+    "Where did you apply Kubernetes operators in your current role?",
+    "When did you start working with Power Automate and what did you build?",
+    "How many years of experience do you have with Azure?",
+    "What is your current title?",
+    "What was your role on the SharePoint migration?",
+    "Why did you choose Terraform over Bicep?",
+    "Explain how you designed the approval flow",
+    "Compare your AWS and Azure experience",
+    "Tell me about your projects",
+    "Given my email is a@b.com, can you describe the largest Power Platform solution you "
+    "delivered and the business problems it solved?",
+]
+
+
+class FakeClient:
+    def __init__(self, label):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        self.label = label
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.label))])
+
+
+def test_routes():
+    router = ModelRouter("fast-model", "large-model")
+    for query in FAST:
+        assert router.route(query).route == "fast", query
+    for query in LARGE:
+        assert router.route(query).route == "large", query
+
+    decisions = router.stats()["decisions"]
+    assert decisions["fast: factual lookup"] == len(FAST), decisions
+
+
+def test_classifier_and_disabled():
+    # Ambiguous queries ask the classifier when one is configured
+    router = ModelRouter("fast-model", "large-model", classifier_model="tiny")
+    client = FakeClient("SIMPLE")
+    assert router.route("Tell me about your projects", client).route == "fast"
+    assert router.route("What is your email?", client).route == "fast" and client.calls == 1
+    assert router.route("Tell me about your projects", FakeClient("COMPLEX")).route == "large"
+
+    # Routing off: everything goes to the large model, no classifier call
+    router = ModelRouter("fast-model", "large-model", classifier_model="tiny", enabled=False)
+    client = FakeClient("SIMPLE")
+    assert all(router.route(query, client).model == "large-model" for query in FAST)
+    assert client.calls == 0
+
+    # from_config follows the MODELS "routing" flag and defaults to off
+    assert ModelRouter.from_config({"fast": "f", "large": "l"}).enabled is False
+
+
+if __name__ == "__main__":
+    test_routes()
+    test_classifier_and_disabled()
+    print("SUCCESS: model router sends only simple lookups to the fast model.")
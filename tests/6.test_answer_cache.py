@@ -0,0 +1,80 @@
+# ------------------------------------------------------------------------------
+# File: tests/6.test_answer_cache.py
+# Purpose: Verify the answer cache: normalized keys, LRU eviction, TTL expiry,
+#          SQLite persistence and invalidation when a source file changes.
+#
+# How to Run:
+#   python tests/6.test_answer_cache.py
+#
+# Expected Output:
+#   SUCCESS: answer cache behaves as expected.
+# ------------------------------------------------------------------------------
+import os
+import sys
+import tempfile
+import time
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.assistant.answer_cache import AnswerCache
+
+
+def test_answer_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        summary = os.path.join(tmp, "summary.txt")
+        with open(summary, "w") as f:
+            f.write("v1")
+
+        db_path = os.path.join(tmp, "answers.db")
+        cache = AnswerCache(max_entries=2, ttl=60, db_path=db_path, sources=(summary,))
+
+        # Normalization: case and punctuation don't matter
+        key = cache.make_key("What cloud experience?", "ai", "h")
+        assert key == cache.make_key("  what CLOUD experience ", "ai", "h")
+        assert key != cache.make_key("What cloud experience?", "power_platform", "h")
+
+        assert cache.get(key) is None
+        cache.store(key, "AWS and Azure")
+        assert cache.get(key) == "AWS and Azure"
+
+        # LRU eviction in memory, SQLite tier still serves the entry
+        cache.store(cache.make_key("q2", "ai", "h"), "a2")
+        cache.store(cache.make_key("q3", "ai", "h"), "a3")
+        assert cache.stats()["entries"] == 2
+        assert cache.get(key) == "AWS and Azure"
+
+        # A second instance sees persisted answers
+        other = AnswerCache(ttl=60, db_path=db_path, sources=(summary,))
+        assert other.get(other.make_key("what cloud experience", "ai", "h")) == "AWS and Azure"
+
+        # Changing a source file invalidates everything
+        time.sleep(0.01)
+        with open(summary, "w") as f:
+            f.write("v2 with more text")
+        assert cache.get(key) is None
+
+        # Keys built after the change use the new signature, so new answers are hits
+        time.sleep(0.01)
+        with open(summary, "w") as f:
+            f.write("v3, edited again")
+        fresh = cache.make_key("What cloud experience?", "ai", "h")
+        assert fresh != key
+        cache.store(fresh, "AWS, Azure and GCP")
+        assert cache.get(fresh) == "AWS, Azure and GCP"
+
+        # TTL expiry
+        short = AnswerCache(ttl=0)
+        short_key = short.make_key("q", "ai", "h")
+        short.store(short_key, "a")
+        time.sleep(0.01)
+        assert short.get(short_key) is None
+
+        stats = cache.stats()
+        assert stats["hits"] == 3 and stats["misses"] == 2, stats
+
+    print("SUCCESS: answer cache behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_answer_cache()
@@ -0,0 +1,82 @@
+# ------------------------------------------------------------------------------
+# File: tests/7.test_tool_executor.py
+# Purpose: Verify the tool executor runs calls concurrently, parses JSON
+#          arguments, returns an "accepted" result when a tool is slow and an
+#          error result when a tool raises.
+#
+# How to Run:
+#   python tests/7.test_tool_executor.py
+#
+# Expected Output:
+#   SUCCESS: tool executor behaves as expected.
+# ------------------------------------------------------------------------------
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import Future
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.tools.executor import ToolExecutor
+
+
+def _tool(name):
+    return {"type": "function", "function": {"name": name, "parameters": {}}}
+
+
+def _call(call_id, name, arguments):
+    return {"id": call_id, "type": "function", "function": {"name": name, "arguments": arguments}}
+
+
+def test_tool_executor():
+    def slow(seconds):
+        time.sleep(seconds)
+        return {"status": "success"}
+
+    executor = ToolExecutor(
+        [_tool("slow"), _tool("fast"), _tool("broken"), _tool("not_implemented")],
+        {"slow": slow, "fast": lambda question: {"status": "success", "q": question}, "broken": lambda: {}["key"]},
+        deadline=0.3
+    )
+
+    start = time.monotonic()
+    messages = executor.run([
+        _call("1", "slow", '{"seconds": 0.2}'),
+        _call("2", "slow", '{"seconds": 0.2}'),
+        _call("3", "slow", '{"seconds": 1.0}'),
+        _call("4", "fast", '{"question": "Can Girma relocate?"}'),
+        _call("5", "fast", "not json"),
+        _call("6", "not_implemented", "{}"),
+        _call("8", "broken", "{}"),
+    ])
+    elapsed = time.monotonic() - start
+    results = {m["tool_call_id"]: json.loads(m["content"]) for m in messages}
+
+    # Concurrent and bounded by the deadline, not the sum of tool durations
+    assert elapsed < 0.6, elapsed
+    assert results["1"]["status"] == "success"
+    assert results["2"]["status"] == "success"
+    assert results["3"]["status"] == "accepted"
+    assert results["4"]["q"] == "Can Girma relocate?"
+    assert results["5"]["status"] == "error"
+    assert results["6"] == {"error": "unknown tool"}
+    assert results["8"] == {"status": "error", "message": "'key'"}  # KeyError in the tool
+
+    async_messages = asyncio.run(executor.run_async([_call("7", "slow", '{"seconds": 1.0}')]))
+    assert json.loads(async_messages[0]["content"])["status"] == "accepted"
+    async_messages = asyncio.run(executor.run_async([_call("9", "broken", "{}")]))
+    assert json.loads(async_messages[0]["content"])["status"] == "error"
+
+    # A cancelled call (pool shutting down) is not logged as a failure
+    cancelled = Future()
+    cancelled.cancel()
+    ToolExecutor._log_late_failure(cancelled)
+
+    print("SUCCESS: tool executor behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_tool_executor()
@@ -0,0 +1,62 @@
+# ------------------------------------------------------------------------------
+# File: tests/8.test_conversation_memory.py
+# Purpose: Verify conversation memory stays within its token budget by
+#          evicting the oldest turns, that sessions are kept apart, and that
+#          per-turn input token counts stay bounded.
+#
+# How to Run:
+#   python tests/8.test_conversation_memory.py
+#
+# Expected Output:
+#   SUCCESS: conversation memory stays within budget.
+# ------------------------------------------------------------------------------
+import os
+import sys
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.assistant.memory import ConversationMemory, SessionStore
+
+
+def test_conversation_memory():
+    sessions = SessionStore(token_budget=200, max_sessions=2)
+    memory = sessions.get("a")
+
+    for i in range(50):
+        memory.add_turn(f"Question {i} about Power Automate experience " * 3, f"Answer {i} " * 20)
+        assert memory.token_count() <= 200 or len(memory.turns) == 1
+
+    # Oldest turns went first; the latest turn is always kept
+    assert memory.turns[-1][0].startswith("Question 49")
+    assert not any(t[0].startswith("Question 0 ") for t in memory.turns)
+
+    evicted = memory.add_turn("Another long question " * 10, "Another long answer " * 10)
+    assert evicted and evicted[0]["role"] == "user"
+
+    # Same id returns the same memory; unknown ids start empty
+    assert sessions.get("a") is memory
+    assert sessions.get("b").turns == []
+    assert sessions.get(None) is None
+
+    # Least recently used session is dropped past max_sessions
+    sessions.get("c")
+    assert sessions.get("a") is not memory
+
+
+
+def test_input_token_history():
+    memory = ConversationMemory(history=3)
+    for tokens in (120, 900, 300, 400, 500):
+        memory.record_input_tokens(tokens)
+    # Only the latest turns are kept; the maximum covers the whole session
+    assert list(memory.input_tokens) == [300, 400, 500]
+    stats = memory.stats()
+    assert stats["last_input_tokens"] == 500 and stats["max_input_tokens"] == 900, stats
+    assert ConversationMemory().stats()["max_input_tokens"] == 0
+
+
+if __name__ == "__main__":
+    test_conversation_memory()
+    test_input_token_history()
+    print("SUCCESS: conversation memory stays within budget.")
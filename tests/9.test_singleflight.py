@@ -0,0 +1,89 @@
+# ------------------------------------------------------------------------------
+# File: tests/9.test_singleflight.py
+# Purpose: Verify that concurrent identical requests share one upstream call
+#          (plain and streaming, threaded and asyncio) and that metrics count
+#          the coalesced callers.
+#
+# How to Run:
+#   python tests/9.test_singleflight.py
+#
+# Expected Output:
+#   SUCCESS: single-flight coalesces identical requests.
+# ------------------------------------------------------------------------------
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Ensure app/ is in the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.llm import AsyncSingleFlight, SingleFlight
+
+
+def test_threaded():
+    flights = SingleFlight()
+    upstream_calls = []
+    lock = threading.Lock()
+
+    def upstream():
+        with lock:
+            upstream_calls.append(1)
+        time.sleep(0.2)
+        return "Girma has 8 years of Power Platform experience"
+
+    def stream():
+        with lock:
+            upstream_calls.append(1)
+        for word in ["Girma", " has", " AWS", " experience"]:
+            time.sleep(0.05)
+            yield word
+
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        results = list(pool.map(lambda _: flights.do("opener", upstream), range(10)))
+    assert len(set(results)) == 1 and len(upstream_calls) == 1
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        streams = list(pool.map(lambda _: "".join(flights.stream("stream", stream)), range(5)))
+    assert streams == ["Girma has AWS experience"] * 5 and len(upstream_calls) == 2
+
+    stats = flights.stats()
+    assert stats["calls"] == 15 and stats["executions"] == 2 and stats["coalesced"] == 13, stats
+
+
+async def _test_async():
+    flights = AsyncSingleFlight()
+    upstream_calls = []
+
+    async def upstream():
+        upstream_calls.append(1)
+        await asyncio.sleep(0.1)
+        return "answer"
+
+    async def stream():
+        upstream_calls.append(1)
+        for word in ["a", "b", "c"]:
+            await asyncio.sleep(0.02)
+            yield word
+
+    async def consume():
+        return "".join([d async for d in flights.stream("s", stream)])
+
+    results = await asyncio.gather(*(flights.do("k", upstream) for _ in range(10)))
+    assert results == ["answer"] * 10 and len(upstream_calls) == 1
+
+    streams = await asyncio.gather(*(consume() for _ in range(5)))
+    assert streams == ["abc"] * 5 and len(upstream_calls) == 2
+    assert flights.stats()["coalesced"] == 13
+
+
+def test_singleflight():
+    test_threaded()
+    asyncio.run(_test_async())
+    print("SUCCESS: single-flight coalesces identical requests.")
+
+
+if __name__ == "__main__":
+    test_singleflight()